@@ -0,0 +1,33 @@
+"""Index executions by project and timestamp
+
+Revision ID: 3f9c2d1e8a47
+Revises: 6b6a30a6c9a0
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2d1e8a47'
+down_revision: Union[str, Sequence[str], None] = '6b6a30a6c9a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_executions_project_timestamp',
+        'executions',
+        ['project_id', 'timestamp'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_executions_project_timestamp', table_name='executions')
@@ -5,6 +5,7 @@ This module defines the logic for the headless API endpoints exposed via Gradio.
 
 import hashlib
 import hmac
+import time
 import uuid
 from datetime import UTC, datetime
 from typing import Any, Optional
@@ -26,9 +27,21 @@ from gradio_chat_agent.models.plan import ExecutionPlan
 class ApiEndpoints:
     """Handlers for API endpoints."""
 
-    def __init__(self, engine: ExecutionEngine):
-        """Initialize with the execution engine."""
+    def __init__(self, engine: ExecutionEngine, rollup_cache_ttl: float = 0.0):
+        """Initialize with the execution engine.
+
+        Args:
+            engine: The authoritative execution engine.
+            rollup_cache_ttl: Seconds the org rollup is cached between
+                requests. Zero disables the cache.
+        """
         self.engine = engine
+        self.rollup_cache_ttl = rollup_cache_ttl
+        self._rollup_cache: Optional[tuple[float, dict[str, Any]]] = None
+
+    def invalidate_rollup(self):
+        """Drops the cached org rollup so the next request recomputes it."""
+        self._rollup_cache = None
 
     def execute_action(
         self,
@@ -474,6 +487,8 @@ class ApiEndpoints:
                 }
             }
             self.engine.repository.set_project_limits(pid, default_policy)
+            self.engine.invalidate_policy(pid)
+            self.invalidate_rollup()
 
             return ApiResponse(
                 message="Project created with default policy",
@@ -486,6 +501,7 @@ class ApiEndpoints:
                     code=1, message="Project ID required for archive"
                 ).model_dump(mode="json")
             self.engine.repository.archive_project(project_id)
+            self.engine.invalidate_policy(project_id)
             return ApiResponse(message="Project archived").model_dump(
                 mode="json"
             )
@@ -504,6 +520,8 @@ class ApiEndpoints:
                 ).model_dump(mode="json")
 
             self.engine.repository.purge_project(project_id)
+            self.engine.invalidate_policy(project_id)
+            self.invalidate_rollup()
             return ApiResponse(message="Project purged").model_dump(
                 mode="json"
             )
@@ -700,6 +718,7 @@ class ApiEndpoints:
             Result wrapped in ApiResponse.
         """
         self.engine.repository.set_project_limits(project_id, policy)
+        self.engine.invalidate_policy(project_id)
         return ApiResponse(message="Policy updated").model_dump(mode="json")
 
     def list_users(self, user_id: str | None = None) -> dict[str, Any]:
@@ -783,7 +802,16 @@ class ApiEndpoints:
                 code=1, message="Permission denied: System Admin required"
             ).model_dump(mode="json")
 
-        rollup = self.engine.repository.get_org_rollup()
+        # The rollup is platform-wide, so one cached entry serves every admin.
+        ttl = self.rollup_cache_ttl
+        now = time.monotonic()
+        entry = self._rollup_cache
+        if ttl > 0 and entry is not None and now - entry[0] < ttl:
+            rollup = entry[1]
+        else:
+            rollup = self.engine.repository.get_org_rollup()
+            if ttl > 0:
+                self._rollup_cache = (now, rollup)
         return ApiResponse(data=rollup).model_dump(mode="json")
 
     def create_api_token(
@@ -16,9 +16,12 @@ from fastapi import FastAPI, Response
 # Ensure src is in path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
+from gradio_chat_agent.api.endpoints import ApiEndpoints
 from gradio_chat_agent.chat.gemini_adapter import GeminiAgentAdapter
-from gradio_chat_agent.chat.openai_adapter import OpenAIAgentAdapter
-from gradio_chat_agent.execution.engine import ExecutionEngine
+from gradio_chat_agent.chat.openai_adapter import (
+    get_adapter as get_openai_adapter,
+)
+from gradio_chat_agent.execution.engine import EngineConfig, ExecutionEngine
 from gradio_chat_agent.execution.scheduler import SchedulerWorker
 from gradio_chat_agent.observability.logging import get_logger, setup_logging
 from gradio_chat_agent.observability.metrics import (
@@ -151,12 +154,28 @@ def create_app() -> FastAPI:
     bootstrap_admin(repository)
 
     # 3. Setup Engine
-    engine = ExecutionEngine(registry=registry, repository=repository)
+    engine = ExecutionEngine(
+        registry=registry,
+        repository=repository,
+        config=EngineConfig(
+            policy_cache_ttl=float(os.environ.get("POLICY_CACHE_TTL", "5"))
+        ),
+    )
 
     # 3.5 Setup Alerting
-    from gradio_chat_agent.observability.alerting import AlertingService
+    from gradio_chat_agent.observability.alerting import (
+        AlertingService,
+        WebhookAlertHandler,
+    )
 
     alerting_service = AlertingService(engine)
+    webhook_handler = None
+    alert_webhooks = os.environ.get("ALERT_WEBHOOK_URLS")
+    if alert_webhooks:
+        webhook_handler = WebhookAlertHandler(
+            [u.strip() for u in alert_webhooks.split(",") if u.strip()]
+        )
+        alerting_service.add_handler(webhook_handler)
     engine.add_post_execution_hook(alerting_service.check_execution_alerts)
 
     # 4. Setup Agent
@@ -166,7 +185,7 @@ def create_app() -> FastAPI:
         adapter = GeminiAgentAdapter()
     else:
         logger.info("Using OpenAI Agent Adapter")
-        adapter = OpenAIAgentAdapter()
+        adapter = get_openai_adapter()
 
     # 5. Create FastAPI App
     from contextlib import asynccontextmanager
@@ -183,6 +202,8 @@ def create_app() -> FastAPI:
         app.state.scheduler.stop()
         app.state.browser_observer.stop()
         app.state.browser_executor.stop()
+        if webhook_handler is not None:
+            webhook_handler.close()
 
     app = FastAPI(lifespan=lifespan)
 
@@ -217,7 +238,11 @@ def create_app() -> FastAPI:
         return {"user": user}
 
     # 7. Build UI
-    demo = create_ui(engine, adapter, auth_manager=auth_manager)
+    api = ApiEndpoints(
+        engine,
+        rollup_cache_ttl=float(os.environ.get("ROLLUP_CACHE_TTL", "30")),
+    )
+    demo = create_ui(engine, adapter, auth_manager=auth_manager, api=api)
 
     # --- CORS Configuration ---
     allowed_origins = os.environ.get("GRADIO_ALLOWED_ORIGINS", "*").split(",")
@@ -258,7 +283,9 @@ def create_app() -> FastAPI:
     from gradio_chat_agent.execution.observer import AuditLogObserver
 
     browser_executor = BrowserExecutor(engine)
-    browser_observer = AuditLogObserver(engine, poll_interval=2.0)
+    browser_observer = AuditLogObserver(
+        engine, poll_interval=0.5, max_poll_interval=5.0, max_workers=4
+    )
     browser_observer.add_callback(browser_executor)
     app.state.browser_observer = browser_observer
     app.state.browser_executor = browser_executor
@@ -5,12 +5,25 @@ This module provides an adapter that uses OpenAI's Chat Completion API
 application intents or plans.
 """
 
+import asyncio
+import functools
+import hashlib
 import json
 import os
-import uuid
-from typing import Any, Optional, Union, cast
-
-from openai import OpenAI
+import random
+import secrets
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Optional, Union, cast
+
+import httpx
+import orjson
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    OpenAI,
+    RateLimitError,
+)
 from openai.types.chat.chat_completion_content_part_param import (
     ChatCompletionContentPartParam,
 )
@@ -35,22 +48,77 @@ from gradio_chat_agent.models.plan import ExecutionPlan
 from gradio_chat_agent.observability.metrics import LLM_TOKEN_USAGE_TOTAL
 
 
+# HTTP client settings. The sync client relies on the SDK's own retry
+# (exponential backoff with jitter on 429, timeouts and connection errors).
+OPENAI_MAX_RETRIES = 5
+OPENAI_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# Backoff settings for transient errors on async requests (seconds).
+RATE_LIMIT_MAX_RETRIES = OPENAI_MAX_RETRIES
+RATE_LIMIT_BACKOFF_BASE = 0.5
+RATE_LIMIT_BACKOFF_CAP = 20.0
+_RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Returns an exponential backoff delay with full jitter.
+
+    Args:
+        attempt: The zero-based number of the attempt that just failed.
+
+    Returns:
+        The number of seconds to sleep before the next attempt.
+    """
+    delay = min(RATE_LIMIT_BACKOFF_CAP, RATE_LIMIT_BACKOFF_BASE * 2**attempt)
+    return random.uniform(0, delay)
+
+
 class OpenAIAgentAdapter(AgentAdapter):
     """Adapter for OpenAI models that utilizes function calling."""
 
-    def __init__(self, model_name: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        model_name: str = "gpt-4o-mini",
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+    ):
         """Initializes the OpenAI adapter.
 
         Args:
             model_name: The identifier of the OpenAI model to use.
                 Defaults to 'gpt-4o-mini' unless overridden by the
                 OPENAI_MODEL environment variable.
+            api_key: Optional API key. Defaults to OPENAI_API_KEY.
+            base_url: Optional API base URL. Defaults to OPENAI_API_BASE.
         """
-        api_key = os.environ.get("OPENAI_API_KEY")
-        base_url = os.environ.get("OPENAI_API_BASE")
-
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self._api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        self._base_url = base_url or os.environ.get("OPENAI_API_BASE")
+
+        self.client = OpenAI(
+            api_key=self._api_key,
+            base_url=self._base_url,
+            max_retries=OPENAI_MAX_RETRIES,
+            timeout=OPENAI_TIMEOUT,
+        )
+        self._async_client: Optional[AsyncOpenAI] = None
         self.model_name = os.environ.get("OPENAI_MODEL", model_name)
+        self._token_counter = LLM_TOKEN_USAGE_TOTAL.labels(
+            model=self.model_name
+        )
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Lazily created async client used by the streaming API."""
+        if self._async_client is None:
+            # Retries are handled by _acreate_with_backoff so they are not
+            # stacked on top of the SDK's own retry loop.
+            self._async_client = AsyncOpenAI(
+                api_key=self._api_key,
+                base_url=self._base_url,
+                max_retries=0,
+                timeout=OPENAI_TIMEOUT,
+            )
+        return self._async_client
 
     def _registry_to_tools(
         self, action_registry: dict[str, Any]
@@ -101,23 +169,20 @@ class OpenAIAgentAdapter(AgentAdapter):
 
         return tools
 
-    def _construct_system_prompt(
-        self,
-        component_registry: dict[str, Any],
-        state_snapshot: dict[str, Any],
-        execution_mode: str,
-        facts: Optional[dict[str, Any]] = None,
+    def _construct_prompt_prefix(
+        self, component_registry: dict[str, Any]
     ) -> str:
-        """Constructs the system prompt with context for the LLM.
+        """Constructs the stable head of the system prompt.
+
+        The prefix only contains the static rules and the component
+        registry, serialized with sorted keys, so that it stays byte-identical
+        across turns and can be served from the provider's prompt cache.
 
         Args:
             component_registry: Dictionary of available components.
-            state_snapshot: Current state of all application components.
-            execution_mode: The active operational mode.
-            facts: Optional dictionary of session facts.
 
         Returns:
-            A string containing the formatted system prompt.
+            A string containing the cacheable prompt prefix.
         """
 
         # Simplify component registry for context (reduce tokens)
@@ -129,15 +194,14 @@ class OpenAIAgentAdapter(AgentAdapter):
                 "invariants": comp_def.get("invariants", []),
             }
 
-        facts_str = (
-            json.dumps(facts, indent=2) if facts else "No facts stored."
-        )
+        registry_str = orjson.dumps(
+            components_summary,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+        ).decode("utf-8")
 
         prompt = f"""You are a governed execution agent.
 Your goal is to help the user control the application state by proposing actions.
 
-EXECUTION MODE: {execution_mode.upper()}
-
 RULES:
 1. You DO NOT execute actions directly. You propose them by calling the corresponding function.
 2. You must rely on the provided Component Registry and Action Registry.
@@ -150,52 +214,74 @@ RULES:
    - Only ask for the specific missing required parameters defined in the schema.
 5. Do not hallucinate action IDs. Only use the tools provided.
 6. If the user confirms a previous request (e.g., "yes", "proceed"), re-submit the action with the same parameters.
+7. Follow the EXECUTION MODE given at the end of this prompt.
 
 COMPONENT REGISTRY:
-{json.dumps(components_summary, indent=2)}
+{registry_str}
+"""
+        return prompt
 
-CURRENT STATE SNAPSHOT:
-{json.dumps(state_snapshot, indent=2)}
+    def _construct_system_prompt(
+        self,
+        component_registry: dict[str, Any],
+        state_snapshot: dict[str, Any],
+        execution_mode: str,
+        facts: Optional[dict[str, Any]] = None,
+        prompt_prefix: Optional[str] = None,
+    ) -> str:
+        """Constructs the system prompt with context for the LLM.
+
+        Volatile context (facts, state, execution mode) is appended after the
+        stable prefix so that changes between turns do not invalidate the
+        cached part of the prompt.
+
+        Args:
+            component_registry: Dictionary of available components.
+            state_snapshot: Current state of all application components.
+            execution_mode: The active operational mode.
+            facts: Optional dictionary of session facts.
+            prompt_prefix: Optional pre-built prefix from
+                `_construct_prompt_prefix`.
 
+        Returns:
+            A string containing the formatted system prompt.
+        """
+        if prompt_prefix is None:
+            prompt_prefix = self._construct_prompt_prefix(component_registry)
+
+        facts_str = (
+            json.dumps(facts, indent=2) if facts else "No facts stored."
+        )
+
+        prompt = f"""{prompt_prefix}
 SESSION MEMORY (FACTS):
 {facts_str}
+
+CURRENT STATE SNAPSHOT:
+{json.dumps(state_snapshot, indent=2)}
+
+EXECUTION MODE: {execution_mode.upper()}
 """
         return prompt
 
-    def message_to_intent_or_plan(
+    def _build_messages(
         self,
         message: str,
         history: list[dict[str, Any]],
-        state_snapshot: dict[str, Any],
-        component_registry: dict[str, Any],
-        action_registry: dict[str, Any],
+        system_prompt: str,
         media: Optional[dict[str, Any]] = None,
-        execution_mode: str = "assisted",
-        facts: Optional[dict[str, Any]] = None,
-    ) -> Union[ChatIntent, ExecutionPlan]:
-        """Translates a user message into a structured intent using OpenAI.
+    ) -> list[ChatCompletionMessageParam]:
+        """Assembles the chat messages sent to the completion endpoint.
 
         Args:
             message: Raw text from user.
             history: List of past conversation turns.
-            state_snapshot: Current project state snapshot.
-            component_registry: Dict of available components.
-            action_registry: Dict of available actions.
+            system_prompt: The fully constructed system prompt.
             media: Optional image/document data. Defaults to None.
-            execution_mode: Current execution mode. Defaults to 'assisted'.
-            facts: Optional session facts.
 
         Returns:
-            A ChatIntent or ExecutionPlan object.
+            The list of chat completion messages.
         """
-
-        tools: list[ChatCompletionFunctionToolParam] = self._registry_to_tools(
-            action_registry
-        )
-        system_prompt = self._construct_system_prompt(
-            component_registry, state_snapshot, execution_mode, facts
-        )
-
         messages: list[ChatCompletionMessageParam] = [
             {"role": "system", "content": system_prompt}
         ]
@@ -225,11 +311,131 @@ SESSION MEMORY (FACTS):
                 )
 
         messages.append({"role": "user", "content": user_content})
+        return messages
+
+    def _prepare_request(
+        self,
+        message: str,
+        history: list[dict[str, Any]],
+        state_snapshot: dict[str, Any],
+        component_registry: dict[str, Any],
+        action_registry: dict[str, Any],
+        media: Optional[dict[str, Any]],
+        execution_mode: str,
+        facts: Optional[dict[str, Any]],
+    ) -> tuple[
+        list[ChatCompletionMessageParam],
+        list[ChatCompletionFunctionToolParam],
+        str,
+    ]:
+        """Builds the messages, tools and prompt cache key for a request.
+
+        Returns:
+            A tuple of (messages, tools, prompt_cache_key).
+        """
+        tools: list[ChatCompletionFunctionToolParam] = self._registry_to_tools(
+            action_registry
+        )
+        prompt_prefix = self._construct_prompt_prefix(component_registry)
+        system_prompt = self._construct_system_prompt(
+            component_registry,
+            state_snapshot,
+            execution_mode,
+            facts,
+            prompt_prefix=prompt_prefix,
+        )
+        # Route turns sharing the same prefix to the same prompt cache.
+        prompt_cache_key = hashlib.md5(
+            prompt_prefix.encode("utf-8"), usedforsecurity=False
+        ).hexdigest()
+
+        messages = self._build_messages(message, history, system_prompt, media)
+        return messages, tools, prompt_cache_key
+
+    def _tool_call_to_intent(
+        self, fn_name: str, raw_arguments: str, execution_mode: str
+    ) -> ChatIntent:
+        """Converts a single tool call into a ChatIntent.
+
+        Args:
+            fn_name: The name of the called function.
+            raw_arguments: The JSON encoded arguments of the call.
+            execution_mode: Current execution mode.
+
+        Returns:
+            A clarification request for 'ask_clarification', otherwise an
+            action call intent.
+        """
+        try:
+            arguments = orjson.loads(raw_arguments)
+        except orjson.JSONDecodeError:
+            arguments = {}
+
+        if fn_name == "ask_clarification":
+            return ChatIntent(
+                type=IntentType.CLARIFICATION_REQUEST,
+                request_id=secrets.token_hex(16),
+                question=arguments.get("question", "Can you clarify?"),
+                choices=arguments.get("choices", []),
+                execution_mode=ExecutionMode(execution_mode),
+            )
+
+        # Action Intent
+        # Check for confirmation heuristic if arguments missing confirmation?
+        # Actually, System Prompt Rule 6 says LLM should re-submit with parameters.
+        # So we assume arguments contains 'confirmed=True' if LLM did its job.
+
+        return ChatIntent(
+            type=IntentType.ACTION_CALL,
+            request_id=secrets.token_hex(16),
+            action_id=fn_name,
+            inputs=arguments,
+            execution_mode=ExecutionMode(execution_mode),
+            confirmed=arguments.get("confirmed", False),  # Trust LLM
+        )
+
+    def message_to_intent_or_plan(
+        self,
+        message: str,
+        history: list[dict[str, Any]],
+        state_snapshot: dict[str, Any],
+        component_registry: dict[str, Any],
+        action_registry: dict[str, Any],
+        media: Optional[dict[str, Any]] = None,
+        execution_mode: str = "assisted",
+        facts: Optional[dict[str, Any]] = None,
+    ) -> Union[ChatIntent, ExecutionPlan]:
+        """Translates a user message into a structured intent using OpenAI.
+
+        Args:
+            message: Raw text from user.
+            history: List of past conversation turns.
+            state_snapshot: Current project state snapshot.
+            component_registry: Dict of available components.
+            action_registry: Dict of available actions.
+            media: Optional image/document data. Defaults to None.
+            execution_mode: Current execution mode. Defaults to 'assisted'.
+            facts: Optional session facts.
+
+        Returns:
+            A ChatIntent or ExecutionPlan object.
+        """
+        messages, tools, prompt_cache_key = self._prepare_request(
+            message,
+            history,
+            state_snapshot,
+            component_registry,
+            action_registry,
+            media,
+            execution_mode,
+            facts,
+        )
 
         # Make sure that the variables are bounded
         tool_calls = []
         message_output = ChatCompletionMessage(role="assistant")
 
+        valid_names = frozenset(action_registry) | {"ask_clarification"}
         max_retries = 2
         for attempt in range(max_retries + 1):
             try:
@@ -238,6 +444,7 @@ SESSION MEMORY (FACTS):
                     messages=messages,
                     tools=tools,
                     tool_choice="auto",
+                    prompt_cache_key=prompt_cache_key,
                 )
             except Exception as e:
                 # Fallback for errors
@@ -252,32 +459,43 @@ SESSION MEMORY (FACTS):
             tool_calls = message_output.tool_calls or []
 
             # Metrics
-            if hasattr(completion, "usage") and completion.usage:
-                LLM_TOKEN_USAGE_TOTAL.labels(model=self.model_name).inc(
-                    completion.usage.total_tokens
-                )
+            usage = getattr(completion, "usage", None)
+            if usage is not None:
+                self._token_counter.inc(usage.total_tokens)
 
             # Check for hallucinations
-            invalid_tools = []
-            for tc in tool_calls:
-                tc = cast(ChatCompletionMessageFunctionToolCall, tc)
-                fn_name = tc.function.name
-                if (
-                    fn_name != "ask_clarification"
-                    and fn_name not in action_registry
-                ):
-                    invalid_tools.append(fn_name)
+            function_calls = cast(
+                list[ChatCompletionMessageFunctionToolCall], tool_calls
+            )
+            invalid_tools = {
+                tc.function.name
+                for tc in function_calls
+                if tc.function.name not in valid_names
+            }
 
             if invalid_tools and attempt < max_retries:
-                # Append assistant message with bad calls
+                # Append assistant message with bad calls. Built by hand
+                # rather than via model_dump() to skip a full Pydantic
+                # serialization pass over the response.
                 messages.append(
-                    cast(
-                        ChatCompletionMessageParam, message_output.model_dump()
-                    )
+                    {
+                        "role": "assistant",
+                        "content": message_output.content,
+                        "tool_calls": [
+                            {
+                                "id": tc.id,
+                                "type": "function",
+                                "function": {
+                                    "name": tc.function.name,
+                                    "arguments": tc.function.arguments,
+                                },
+                            }
+                            for tc in function_calls
+                        ],
+                    }
                 )
                 # Append tool error outputs
-                for tc in tool_calls:
-                    tc = cast(ChatCompletionMessageFunctionToolCall, tc)
+                for tc in function_calls:
                     fn_name = tc.function.name
                     content = (
                         f"Error: Action '{fn_name}' does not exist."
@@ -302,7 +520,7 @@ SESSION MEMORY (FACTS):
             )
             return ChatIntent(
                 type=IntentType.CLARIFICATION_REQUEST,
-                request_id=str(uuid.uuid4()),
+                request_id=secrets.token_hex(16),
                 question=content,
                 execution_mode=ExecutionMode(execution_mode),
             )
@@ -310,38 +528,385 @@ SESSION MEMORY (FACTS):
         intents = []
         for tc in tool_calls:
             tc = cast(ChatCompletionMessageFunctionToolCall, tc)
-            fn_name = tc.function.name
+            intent = self._tool_call_to_intent(
+                tc.function.name, tc.function.arguments, execution_mode
+            )
+            if intent.type == IntentType.CLARIFICATION_REQUEST:
+                return intent
+            intents.append(intent)
+
+        if len(intents) == 1:
+            return intents[0]
+        else:
+            return ExecutionPlan(plan_id=secrets.token_hex(16), steps=intents)
+
+    async def _acreate_with_backoff(self, **kwargs: Any) -> Any:
+        """Calls the async completion endpoint, backing off on transient errors.
+
+        Retries rate limits, timeouts and connection errors with exponential
+        backoff and full jitter so concurrent requests from
+        `abatch_messages` do not retry in lockstep.
+
+        Args:
+            **kwargs: Arguments forwarded to `chat.completions.create`.
+
+        Returns:
+            The completion (or stream) returned by the SDK.
+        """
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
             try:
-                arguments = json.loads(tc.function.arguments)
-            except json.JSONDecodeError:
-                arguments = {}
+                return await self.async_client.chat.completions.create(
+                    **kwargs
+                )
+            except _RETRYABLE_ERRORS:
+                if attempt == RATE_LIMIT_MAX_RETRIES:
+                    raise
+                await asyncio.sleep(_backoff_delay(attempt))
 
-            if fn_name == "ask_clarification":
-                return ChatIntent(
+    async def _astream_tool_calls(
+        self, content_parts: list[str], **kwargs: Any
+    ) -> AsyncIterator[dict[str, str]]:
+        """Streams a completion and yields each tool call once complete.
+
+        The SDK stream is always closed, also when the caller stops early.
+        Transient errors raised while reading the stream are retried like
+        those raised by `_acreate_with_backoff`, as long as no tool call has
+        been yielded yet.
+
+        Args:
+            content_parts: Receives the text content of the completion.
+            **kwargs: Arguments forwarded to `chat.completions.create`.
+
+        Yields:
+            Dicts with the 'id', 'name' and 'arguments' of each tool call.
+        """
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            stream = await self._acreate_with_backoff(**kwargs)
+            yielded = False
+            try:
+                async with stream:
+                    # Tool calls are streamed as fragments keyed by index.
+                    pending: dict[int, dict[str, str]] = {}
+                    async for chunk in stream:
+                        # Metrics (usage is only set on the final chunk)
+                        if chunk.usage is not None:
+                            self._token_counter.inc(chunk.usage.total_tokens)
+                        if not chunk.choices:
+                            continue
+
+                        choice = chunk.choices[0]
+                        delta = choice.delta
+                        if delta.content:
+                            content_parts.append(delta.content)
+
+                        completed: list[dict[str, str]] = []
+                        for tc_delta in delta.tool_calls or []:
+                            if tc_delta.index not in pending:
+                                # A new index means all previous calls are
+                                # complete.
+                                for index in sorted(pending):
+                                    completed.append(pending.pop(index))
+                                pending[tc_delta.index] = {
+                                    "id": "",
+                                    "name": "",
+                                    "arguments": "",
+                                }
+                            call = pending[tc_delta.index]
+                            if tc_delta.id:
+                                call["id"] = tc_delta.id
+                            if tc_delta.function:
+                                call["name"] += tc_delta.function.name or ""
+                                call["arguments"] += (
+                                    tc_delta.function.arguments or ""
+                                )
+
+                        if choice.finish_reason:
+                            for index in sorted(pending):
+                                completed.append(pending.pop(index))
+
+                        for call in completed:
+                            yielded = True
+                            yield call
+                return
+            except _RETRYABLE_ERRORS:
+                if yielded or attempt == RATE_LIMIT_MAX_RETRIES:
+                    raise
+                content_parts.clear()
+                await asyncio.sleep(_backoff_delay(attempt))
+
+    async def amessage_to_intent_or_plan(
+        self,
+        message: str,
+        history: list[dict[str, Any]],
+        state_snapshot: dict[str, Any],
+        component_registry: dict[str, Any],
+        action_registry: dict[str, Any],
+        media: Optional[dict[str, Any]] = None,
+        execution_mode: str = "assisted",
+        facts: Optional[dict[str, Any]] = None,
+    ) -> Union[ChatIntent, ExecutionPlan]:
+        """Async counterpart of `message_to_intent_or_plan`.
+
+        Collects the intents produced by `astream_intents` into a single
+        intent, or an ExecutionPlan when several actions were called.
+
+        Returns:
+            A ChatIntent or ExecutionPlan object.
+        """
+        intents = [
+            intent
+            async for intent in self.astream_intents(
+                message,
+                history,
+                state_snapshot,
+                component_registry,
+                action_registry,
+                media,
+                execution_mode,
+                facts,
+            )
+        ]
+        if intents[-1].type == IntentType.CLARIFICATION_REQUEST:
+            return intents[-1]
+        if len(intents) == 1:
+            return intents[0]
+        return ExecutionPlan(plan_id=secrets.token_hex(16), steps=intents)
+
+    async def abatch_messages(
+        self,
+        messages: list[str],
+        history: list[dict[str, Any]],
+        state_snapshot: dict[str, Any],
+        component_registry: dict[str, Any],
+        action_registry: dict[str, Any],
+        execution_mode: str = "assisted",
+        facts: Optional[dict[str, Any]] = None,
+        max_concurrency: int = 50,
+    ) -> list[Union[ChatIntent, ExecutionPlan]]:
+        """Translates several independent messages concurrently.
+
+        Args:
+            messages: The user messages to translate.
+            history: Conversation history shared by all messages.
+            state_snapshot: Current project state snapshot.
+            component_registry: Dict of available components.
+            action_registry: Dict of available actions.
+            execution_mode: Current execution mode. Defaults to 'assisted'.
+            facts: Optional session facts.
+            max_concurrency: Maximum number of in-flight requests.
+                Defaults to 50.
+
+        Returns:
+            The results, in the same order as `messages`. A message that
+            fails yields a clarification request without affecting the
+            others.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(message: str) -> Union[ChatIntent, ExecutionPlan]:
+            async with semaphore:
+                try:
+                    return await self.amessage_to_intent_or_plan(
+                        message,
+                        history,
+                        state_snapshot,
+                        component_registry,
+                        action_registry,
+                        execution_mode=execution_mode,
+                        facts=facts,
+                    )
+                except Exception as e:
+                    return ChatIntent(
+                        type=IntentType.CLARIFICATION_REQUEST,
+                        request_id=secrets.token_hex(16),
+                        question=f"Error communicating with LLM: {str(e)}",
+                        execution_mode=ExecutionMode(execution_mode),
+                    )
+
+        return list(await asyncio.gather(*(run(m) for m in messages)))
+
+    async def astream_intents(
+        self,
+        message: str,
+        history: list[dict[str, Any]],
+        state_snapshot: dict[str, Any],
+        component_registry: dict[str, Any],
+        action_registry: dict[str, Any],
+        media: Optional[dict[str, Any]] = None,
+        execution_mode: str = "assisted",
+        facts: Optional[dict[str, Any]] = None,
+    ) -> AsyncIterator[ChatIntent]:
+        """Streams intents as soon as each tool call has been generated.
+
+        Unlike `message_to_intent_or_plan`, the completion is requested with
+        `stream=True` so callers can start rendering or dispatching the first
+        tool call while the model is still generating the following ones.
+        The stream stops after a clarification request is yielded.
+
+        Hallucinated tool calls trigger the same retry loop as the blocking
+        variant as long as no intent has been yielded yet. Once that is no
+        longer possible, every call is converted to an intent, as in the
+        blocking variant. Errors while creating or reading the stream end
+        it with a clarification request.
+
+        Args:
+            message: Raw text from user.
+            history: List of past conversation turns.
+            state_snapshot: Current project state snapshot.
+            component_registry: Dict of available components.
+            action_registry: Dict of available actions.
+            media: Optional image/document data. Defaults to None.
+            execution_mode: Current execution mode. Defaults to 'assisted'.
+            facts: Optional session facts.
+
+        Yields:
+            ChatIntent objects in the order the model produced them.
+        """
+        messages, tools, prompt_cache_key = self._prepare_request(
+            message,
+            history,
+            state_snapshot,
+            component_registry,
+            action_registry,
+            media,
+            execution_mode,
+            facts,
+        )
+
+        valid_names = frozenset(action_registry) | {"ask_clarification"}
+        yielded = False
+        max_retries = 2
+        for attempt in range(max_retries + 1):
+            content_parts: list[str] = []
+            # Calls held back because the batch will be retried.
+            held_calls: list[dict[str, str]] = []
+            try:
+                async with aclosing(
+                    self._astream_tool_calls(
+                        content_parts,
+                        model=self.model_name,
+                        messages=messages,
+                        tools=tools,
+                        tool_choice="auto",
+                        prompt_cache_key=prompt_cache_key,
+                        stream=True,
+                        stream_options={"include_usage": True},
+                    )
+                ) as calls:
+                    async for call in calls:
+                        # A hallucinated call can only be retried while
+                        # nothing has been yielded; from then on the batch is
+                        # held back. Otherwise calls are converted as in
+                        # `message_to_intent_or_plan`.
+                        can_retry = not yielded and attempt < max_retries
+                        if can_retry and (
+                            held_calls or call["name"] not in valid_names
+                        ):
+                            held_calls.append(call)
+                            continue
+
+                        intent = self._tool_call_to_intent(
+                            call["name"], call["arguments"], execution_mode
+                        )
+                        yielded = True
+                        yield intent
+                        if intent.type == IntentType.CLARIFICATION_REQUEST:
+                            return
+            except Exception as e:
+                # Fallback for errors
+                yield ChatIntent(
                     type=IntentType.CLARIFICATION_REQUEST,
-                    request_id=str(uuid.uuid4()),
-                    question=arguments.get("question", "Can you clarify?"),
-                    choices=arguments.get("choices", []),
+                    request_id=f"err_{id(messages)}",
+                    question=f"Error communicating with LLM: {str(e)}",
                     execution_mode=ExecutionMode(execution_mode),
                 )
+                return
 
-            # Action Intent
-            # Check for confirmation heuristic if arguments missing confirmation?
-            # Actually, System Prompt Rule 6 says LLM should re-submit with parameters.
-            # So we assume arguments contains 'confirmed=True' if LLM did its job.
-
-            intents.append(
-                ChatIntent(
-                    type=IntentType.ACTION_CALL,
-                    request_id=str(uuid.uuid4()),
-                    action_id=fn_name,
-                    inputs=arguments,
-                    execution_mode=ExecutionMode(execution_mode),
-                    confirmed=arguments.get("confirmed", False),  # Trust LLM
+            if held_calls:
+                invalid_names = {
+                    call["name"]
+                    for call in held_calls
+                    if call["name"] not in valid_names
+                }
+                # Append assistant message with bad calls
+                messages.append(
+                    {
+                        "role": "assistant",
+                        "content": "".join(content_parts) or None,
+                        "tool_calls": [
+                            {
+                                "id": call["id"],
+                                "type": "function",
+                                "function": {
+                                    "name": call["name"],
+                                    "arguments": call["arguments"],
+                                },
+                            }
+                            for call in held_calls
+                        ],
+                    }
                 )
-            )
+                # Append tool error outputs
+                for call in held_calls:
+                    content = (
+                        f"Error: Action '{call['name']}' does not exist."
+                        if call["name"] in invalid_names
+                        else "Action suppressed due to batch error."
+                    )
+                    messages.append(
+                        {
+                            "role": "tool",
+                            "tool_call_id": call["id"],
+                            "content": content,
+                        }
+                    )
+                continue
 
-        if len(intents) == 1:
-            return intents[0]
-        else:
-            return ExecutionPlan(plan_id=str(uuid.uuid4()), steps=intents)
+            if not yielded:
+                content = (
+                    "".join(content_parts)
+                    or "I'm not sure what you want to do."
+                )
+                yield ChatIntent(
+                    type=IntentType.CLARIFICATION_REQUEST,
+                    request_id=secrets.token_hex(16),
+                    question=content,
+                    execution_mode=ExecutionMode(execution_mode),
+                )
+            return
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_adapter(
+    model_name: str, api_key: Optional[str], base_url: Optional[str]
+) -> OpenAIAgentAdapter:
+    return OpenAIAgentAdapter(
+        model_name=model_name, api_key=api_key, base_url=base_url
+    )
+
+
+def get_adapter(
+    model_name: str = "gpt-4o-mini",
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+) -> OpenAIAgentAdapter:
+    """Returns a shared OpenAIAgentAdapter for the given configuration.
+
+    Adapters are stateless between requests, so sessions using the same
+    model and endpoint reuse a single instance (and its HTTP clients).
+    Environment variables are resolved before the cache lookup so that
+    configuration changes yield a fresh adapter.
+
+    Args:
+        model_name: The identifier of the OpenAI model to use.
+        api_key: Optional API key. Defaults to OPENAI_API_KEY.
+        base_url: Optional API base URL. Defaults to OPENAI_API_BASE.
+
+    Returns:
+        The cached adapter instance.
+    """
+    return _cached_adapter(
+        os.environ.get("OPENAI_MODEL", model_name),
+        api_key or os.environ.get("OPENAI_API_KEY"),
+        base_url or os.environ.get("OPENAI_API_BASE"),
+    )
@@ -1,20 +1,25 @@
 """CLI tool for managing the Gradio Chat Agent."""
 
-import json
+import functools
 import os
+import uuid
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
+import orjson
 import typer
-import yaml
-from jsonschema import validate as json_validate
-from jsonschema.exceptions import ValidationError as JsonSchemaValidationError
 from typing_extensions import Annotated
 
-from gradio_chat_agent.persistence.sql_repository import SQLStateRepository
 from gradio_chat_agent.utils import hash_password
 
 
+# yaml, jsonschema and SQLAlchemy (via SQLStateRepository) are imported
+# lazily inside the commands that need them to keep CLI startup fast.
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
+
+
 app = typer.Typer(help="Gradio Chat Agent Management CLI")
 project_app = typer.Typer(help="Manage projects")
 user_app = typer.Typer(help="Manage users")
@@ -29,10 +34,59 @@ app.add_typer(token_app, name="token")
 app.add_typer(worker_app, name="worker")
 
 
+_POLICY_SCHEMA_PATH = (
+    Path(__file__).parent.parent.parent
+    / "docs"
+    / "schemas"
+    / "policy.schema.json"
+)
+
+
+# Compiled policy validators keyed by (schema path, schema mtime), so an
+# edited schema is picked up without restarting the process.
+_VALIDATOR_CACHE: dict[tuple[str, float], "Validator"] = {}
+
+
+def _load_policy_schema(schema_path: Path) -> dict[str, Any]:
+    """Loads the policy JSON schema."""
+    return orjson.loads(schema_path.read_bytes())
+
+
+def _get_policy_validator(schema_path: Path) -> "Validator":
+    """Returns a cached validator instance for the policy schema.
+
+    `jsonschema.validate` re-checks the schema and constructs a new
+    validator on every call; reusing one instance amortizes that cost
+    across validations. The schema itself is meta-validated only on a
+    cache miss, so cached validators go straight to instance checks.
+    """
+    key = (str(schema_path), schema_path.stat().st_mtime)
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is None:
+        from jsonschema.validators import validator_for
+
+        schema = _load_policy_schema(schema_path)
+        validator_cls = validator_for(schema)
+        validator_cls.check_schema(schema)
+        validator = validator_cls(schema, format_checker=None)
+        _VALIDATOR_CACHE[key] = validator
+    return validator
+
+
 def get_repo():
     db_url = os.environ.get(
         "DATABASE_URL", "sqlite:///gradio_chat_agent.sqlite3"
     )
+    return _get_repo_for_url(db_url)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_repo_for_url(db_url: str):
+    """Creates the repository once per process and database URL."""
+    from gradio_chat_agent.persistence.sql_repository import (
+        SQLStateRepository,
+    )
+
     return SQLStateRepository(db_url)
 
 
@@ -54,15 +108,15 @@ def project_create(
 def project_list():
     """Lists all projects."""
     repo = get_repo()
-    projects = repo.list_projects()
-    if not projects:
-        typer.echo("No projects found.")
-        return
-
-    for p in projects:
+    found = False
+    for p in repo.iter_projects():
+        found = True
         status = "Archived" if p["archived"] else "Active"
         typer.echo(f"[{status}] {p['id']}: {p['name']}")
 
+    if not found:
+        typer.echo("No projects found.")
+
 
 @project_app.command("validate")
 def project_validate(
@@ -71,23 +125,30 @@ def project_validate(
     ],
 ):
     """Validates a project policy YAML file against the schema."""
+    import yaml
+    from jsonschema.exceptions import (
+        ValidationError as JsonSchemaValidationError,
+    )
+    from jsonschema.exceptions import best_match
+
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as YamlLoader
+
     if not file_path.exists():
         typer.echo(f"Error: File not found: {file_path}", err=True)
         raise typer.Exit(code=1)
 
     try:
-        with open(file_path, "r") as f:
-            policy = yaml.safe_load(f)
+        # libyaml parses the raw bytes directly, skipping Python decoding.
+        with open(file_path, "rb") as f:
+            policy = yaml.load(f, Loader=YamlLoader)
     except Exception as e:
         typer.echo(f"Error parsing YAML: {str(e)}", err=True)
         raise typer.Exit(code=1)
 
-    schema_path = (
-        Path(__file__).parent.parent.parent
-        / "docs"
-        / "schemas"
-        / "policy.schema.json"
-    )
+    schema_path = _POLICY_SCHEMA_PATH
     if not schema_path.exists():
         # Fallback if running from a different environment
         typer.echo(
@@ -97,9 +158,10 @@ def project_validate(
         return
 
     try:
-        with open(schema_path, "r") as f:
-            schema = json.load(f)
-        json_validate(instance=policy, schema=schema)
+        validator = _get_policy_validator(schema_path)
+        error = best_match(validator.iter_errors(policy))
+        if error is not None:
+            raise error
         typer.echo(f"Policy file {file_path} is valid.")
     except JsonSchemaValidationError as e:
         typer.echo(f"Validation Error: {e.message}", err=True)
@@ -111,14 +173,82 @@ def project_validate(
         raise typer.Exit(code=1)
 
 
+def _read_jsonl(
+    file_path: Path, required: tuple[str, ...] = ()
+) -> list[dict[str, Any]]:
+    """Reads a JSON Lines file of objects, skipping blank lines.
+
+    Args:
+        file_path: The file to read.
+        required: Keys every record must contain.
+
+    Returns:
+        The parsed records.
+    """
+    if not file_path.exists():
+        typer.echo(f"Error: File not found: {file_path}", err=True)
+        raise typer.Exit(code=1)
+    try:
+        lines = [
+            (line_no, orjson.loads(line))
+            for line_no, line in enumerate(
+                file_path.read_bytes().splitlines(), start=1
+            )
+            if line.strip()
+        ]
+    except orjson.JSONDecodeError as e:
+        typer.echo(f"Error parsing {file_path}: {str(e)}", err=True)
+        raise typer.Exit(code=1)
+
+    for line_no, record in lines:
+        if not isinstance(record, dict):
+            typer.echo(
+                f"Error: line {line_no}: expected a JSON object", err=True
+            )
+            raise typer.Exit(code=1)
+        for key in required:
+            if key not in record:
+                typer.echo(f"Error: line {line_no}: missing '{key}'", err=True)
+                raise typer.Exit(code=1)
+    return [record for _, record in lines]
+
+
 @user_app.command("create")
 def user_create(
-    username: Annotated[str, typer.Option(help="Username")],
+    username: Annotated[Optional[str], typer.Option(help="Username")] = None,
     password: Annotated[
-        str, typer.Option(help="Password", prompt=True, hide_input=True)
-    ],
+        Optional[str], typer.Option(help="Password", hide_input=True)
+    ] = None,
+    from_file: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--from-file",
+            help='JSONL file of {"username": ..., "password": ...} records',
+        ),
+    ] = None,
 ):
-    """Creates a new user."""
+    """Creates a new user, or many users from a JSONL file."""
+    if from_file:
+        records = _read_jsonl(from_file, required=("username", "password"))
+        repo = get_repo()
+        repo.create_users(
+            [
+                {
+                    "user_id": r["username"],
+                    "password_hash": hash_password(r["password"]),
+                }
+                for r in records
+            ]
+        )
+        typer.echo(f"Users created: {len(records)}")
+        return
+
+    if not username:
+        typer.echo("Error: --username or --from-file is required.", err=True)
+        raise typer.Exit(code=1)
+    if password is None:
+        password = typer.prompt("Password", hide_input=True)
+
     repo = get_repo()
     password_hash = hash_password(password)
     repo.create_user(username, password_hash)
@@ -147,41 +277,74 @@ def webhook_list(
 ):
     """Lists all webhooks."""
     repo = get_repo()
-    webhooks = repo.list_webhooks(project_id)
-    if not webhooks:
-        typer.echo("No webhooks found.")
-        return
-
-    for w in webhooks:
+    found = False
+    for w in repo.iter_webhooks(project_id):
+        found = True
         status = "Enabled" if w["enabled"] else "Disabled"
         typer.echo(
             f"[{status}] {w['id']} (Project: {w['project_id']}, Action: {w['action_id']})"
         )
 
+    if not found:
+        typer.echo("No webhooks found.")
+
 
 @token_app.command("create")
 def token_create(
-    owner: Annotated[str, typer.Option(help="Username of the token owner")],
-    name: Annotated[str, typer.Option(help="Label for the token")],
+    owner: Annotated[
+        Optional[str], typer.Option(help="Username of the token owner")
+    ] = None,
+    name: Annotated[
+        Optional[str], typer.Option(help="Label for the token")
+    ] = None,
     expires_days: Annotated[
         Optional[int], typer.Option(help="Days until expiration")
     ] = None,
+    from_file: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--from-file",
+            help='JSONL file of {"owner", "name", "expires_days"} records',
+        ),
+    ] = None,
 ):
-    """Creates a new API token."""
-    repo = get_repo()
-    import uuid
-    from datetime import UTC, datetime, timedelta
+    """Creates a new API token, or many tokens from a JSONL file."""
+    if from_file:
+        specs = [
+            (r["owner"], r["name"], r.get("expires_days"))
+            for r in _read_jsonl(from_file, required=("owner", "name"))
+        ]
+    elif owner and name:
+        specs = [(owner, name, expires_days)]
+    else:
+        typer.echo(
+            "Error: --owner and --name, or --from-file, are required.",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    now = datetime.now(UTC)
+    tokens = [
+        {
+            "user_id": token_owner,
+            "name": token_name,
+            "token_id": f"sk-{uuid.uuid4().hex}",
+            "expires_at": now + timedelta(days=days) if days else None,
+        }
+        for token_owner, token_name, days in specs
+    ]
 
-    token_id = f"sk-{uuid.uuid4().hex}"
-    expires_at = None
-    if expires_days:
-        expires_at = datetime.now(UTC) + timedelta(days=expires_days)
+    repo = get_repo()
+    if len(tokens) == 1:
+        repo.create_api_token(**tokens[0])
+    else:
+        repo.create_api_tokens(tokens)
 
-    repo.create_api_token(owner, name, token_id, expires_at)
-    typer.echo(f"Token created: {name}")
-    typer.echo(f"Value: {token_id}")
-    if expires_at:
-        typer.echo(f"Expires at: {expires_at}")
+    for token in tokens:
+        typer.echo(f"Token created: {token['name']}")
+        typer.echo(f"Value: {token['token_id']}")
+        if token["expires_at"]:
+            typer.echo(f"Expires at: {token['expires_at']}")
 
 
 @token_app.command("list")
@@ -190,15 +353,15 @@ def token_list(
 ):
     """Lists all API tokens for a user."""
     repo = get_repo()
-    tokens = repo.list_api_tokens(owner)
-    if not tokens:
-        typer.echo(f"No tokens found for user: {owner}")
-        return
-
-    for t in tokens:
+    found = False
+    for t in repo.iter_api_tokens(owner):
+        found = True
         status = "Active" if not t["revoked_at"] else "Revoked"
         typer.echo(f"[{status}] {t['id']}: {t['name']}")
 
+    if not found:
+        typer.echo(f"No tokens found for user: {owner}")
+
 
 @token_app.command("revoke")
 def token_revoke(
@@ -0,0 +1,143 @@
+"""Role bitmask helpers for RBAC enforcement.
+
+The built-in roles are encoded as single bits so that a user's role list
+can be folded into one integer once per request, turning each permission
+check into a bitwise test instead of a list scan.
+"""
+
+import sys
+from collections.abc import Collection, Iterable, Mapping, Sequence
+from types import MappingProxyType
+from typing import Any, Optional
+
+
+ROLE_VIEWER = 1
+ROLE_OPERATOR = 2
+ROLE_ADMIN = 4
+
+# Built-in roles from least to most privileged, interned so that role
+# strings resolved through `intern_role` compare by identity.
+ROLE_ORDER: tuple[str, ...] = tuple(
+    sys.intern(r) for r in ("viewer", "operator", "admin")
+)
+
+ROLE_BITS: Mapping[str, int] = MappingProxyType(
+    {role: 1 << i for i, role in enumerate(ROLE_ORDER)}
+)
+
+
+def intern_role(role: str) -> str:
+    """Interns a role identifier read from storage or policy.
+
+    Args:
+        role: The role identifier.
+
+    Returns:
+        The interned role string.
+    """
+    return sys.intern(role)
+
+
+def to_role_mask(roles: Iterable[str]) -> int:
+    """Folds a list of role identifiers into a bitmask.
+
+    Unknown roles contribute no bits.
+
+    Args:
+        roles: The role identifiers held by a user.
+
+    Returns:
+        The combined role bitmask.
+    """
+    mask = 0
+    for role in roles:
+        mask |= ROLE_BITS.get(role, 0)
+    return mask
+
+
+def has_role(user_mask: int, role_mask: int) -> bool:
+    """Checks whether a user mask holds any of the given roles.
+
+    Args:
+        user_mask: The user's role bitmask.
+        role_mask: The role bit (or bits) to test for.
+
+    Returns:
+        True if at least one of the bits is set.
+    """
+    return bool(user_mask & role_mask)
+
+
+def is_viewer_only(user_mask: int) -> bool:
+    """Checks whether a user holds the viewer role and nothing above it.
+
+    Args:
+        user_mask: The user's role bitmask.
+
+    Returns:
+        True if the only known role is 'viewer'.
+    """
+    return user_mask == ROLE_VIEWER
+
+
+# A compiled approval rule: (min_cost, required_role, required_bit, rule).
+# `required_bit` is None for custom roles that have no bit assigned.
+ApprovalRule = tuple[float, str, Optional[int], dict[str, Any]]
+
+
+def compile_approval_rules(
+    rules: Iterable[dict[str, Any]],
+) -> tuple[ApprovalRule, ...]:
+    """Pre-sorts approval rules and resolves their required role bits.
+
+    Args:
+        rules: The 'approvals' entries of the project policy.
+
+    Returns:
+        The compiled rules in ascending `min_cost` order. Rules with equal
+        thresholds keep their policy order.
+    """
+    compiled = []
+    for rule in rules:
+        required_role = intern_role(rule.get("required_role", "admin"))
+        compiled.append(
+            (
+                rule.get("min_cost", 0),
+                required_role,
+                ROLE_BITS.get(required_role),
+                rule,
+            )
+        )
+    compiled.sort(key=lambda r: r[0])
+    return tuple(compiled)
+
+
+def match_approval_rule(
+    compiled: Sequence[ApprovalRule],
+    cost: float,
+    user_mask: int,
+    user_roles: Collection[str] = frozenset(),
+) -> Optional[dict[str, Any]]:
+    """Finds the approval rule an action must go through, from compiled rules.
+
+    The scan stops at the first threshold above the action cost.
+
+    Args:
+        compiled: Rules returned by `compile_approval_rules`.
+        cost: The cost of the action.
+        user_mask: The user's role bitmask.
+        user_roles: The user's raw roles (ideally a set), used for custom
+            required roles that have no bit assigned.
+
+    Returns:
+        The lowest-threshold rule the user does not satisfy, or None.
+    """
+    for min_cost, required_role, required_bit, rule in compiled:
+        if cost < min_cost:
+            break
+        if required_bit is None:
+            if required_role not in user_roles:
+                return rule
+        elif not user_mask & required_bit:
+            return rule
+    return None
@@ -1,6 +1,9 @@
 """Executor for web automation actions using Playwright."""
 
+import threading
 import uuid
+from collections import OrderedDict
+from operator import itemgetter
 from typing import Optional
 
 from playwright.sync_api import sync_playwright
@@ -9,8 +12,15 @@ from gradio_chat_agent.models.enums import IntentType
 from gradio_chat_agent.models.intent import ChatIntent
 from gradio_chat_agent.observability.logging import get_logger
 
+
 logger = get_logger(__name__)
 
+# Required parameter extractors for each browser action type.
+_GET_URL = itemgetter("url")
+_GET_SELECTOR = itemgetter("selector")
+_GET_SELECTOR_AND_TEXT = itemgetter("selector", "text")
+_GET_DIRECTION = itemgetter("direction")
+
 
 class BrowserExecutor:
     """Executes queued browser actions using Playwright.
@@ -18,18 +28,37 @@ class BrowserExecutor:
     This class is designed to be used as a callback for an AuditLogObserver.
     It watches for successful 'browser.*' actions that set a 'pending_action',
     executes them, and syncs the resulting browser state back to the engine.
+
+    Successful syncs are debounced per project: a burst of actions issued
+    within `sync_delay` seconds of each other results in a single
+    'browser.sync.state' execution carrying the final browser state.
     """
 
-    def __init__(self, engine):
+    def __init__(self, engine, max_pages: int = 16, sync_delay: float = 0.1):
         """Initializes the browser executor.
 
         Args:
             engine: The authoritative execution engine.
+            max_pages: Maximum number of project pages kept open. The least
+                recently used page is closed when the limit is exceeded.
+            sync_delay: Seconds to wait for further actions before syncing
+                the browser state back. Zero or less syncs immediately.
         """
         self.engine = engine
+        self.max_pages = max_pages
+        self.sync_delay = sync_delay
+        self._sync_lock = threading.Lock()
+        # project_id -> (latest sync inputs, timer that will flush them)
+        self._pending_syncs: dict[str, tuple[dict, threading.Timer]] = {}
         self._playwright = None
         self._browser = None
-        self._pages = {}  # project_id -> page
+        self._pages = OrderedDict()  # project_id -> page, in LRU order
+        self._handlers = {
+            "navigate": self._do_navigate,
+            "click": self._do_click,
+            "type": self._do_type,
+            "scroll": self._do_scroll,
+        }
 
     def _ensure_browser(self):
         """Ensures that the Playwright browser is launched."""
@@ -38,10 +67,106 @@ class BrowserExecutor:
             self._browser = self._playwright.chromium.launch(headless=True)
 
     def _get_page(self, project_id: str):
-        """Retrieves or creates a browser page for a specific project."""
-        if project_id not in self._pages:
-            self._pages[project_id] = self._browser.new_page()
-        return self._pages[project_id]
+        """Retrieves or creates a browser page for a specific project.
+
+        Each page lives in its own browser context so projects never share
+        cookies or storage. Closing an evicted page also closes its context.
+        """
+        page = self._pages.get(project_id)
+        if page is not None:
+            self._pages.move_to_end(project_id)
+            return page
+
+        page = self._browser.new_page()
+        self._pages[project_id] = page
+        while len(self._pages) > self.max_pages:
+            evicted_id, evicted = self._pages.popitem(last=False)
+            logger.debug(f"Closing idle browser page for project {evicted_id}")
+            try:
+                evicted.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser page: {str(e)}")
+        return page
+
+    def _do_navigate(self, page, params: dict) -> str:
+        url = _GET_URL(params)
+        page.goto(url)
+        return f"Navigated to {url}"
+
+    def _do_click(self, page, params: dict) -> str:
+        selector = _GET_SELECTOR(params)
+        page.click(selector)
+        return f"Clicked element: {selector}"
+
+    def _do_type(self, page, params: dict) -> str:
+        selector, text = _GET_SELECTOR_AND_TEXT(params)
+        page.fill(selector, text)
+        return f"Typed '{text}' into {selector}"
+
+    def _do_scroll(self, page, params: dict) -> str:
+        direction = _GET_DIRECTION(params)
+        amount = params.get("amount", 500)
+        if direction == "down":
+            page.evaluate(f"window.scrollBy(0, {amount})")
+        else:
+            page.evaluate(f"window.scrollBy(0, -{amount})")
+        return f"Scrolled {direction} by {amount}px"
+
+    def _sync_state(self, project_id: str, inputs: dict, prefix: str = "sync"):
+        """Executes a 'browser.sync.state' intent with the given inputs."""
+        sync_intent = ChatIntent(
+            type=IntentType.ACTION_CALL,
+            request_id=f"{prefix}-{uuid.uuid4().hex[:8]}",
+            action_id="browser.sync.state",
+            inputs=inputs,
+        )
+        self.engine.execute_intent(
+            project_id=project_id,
+            intent=sync_intent,
+            user_roles=["admin"],
+            user_id="system_browser"
+        )
+
+    def _schedule_sync(self, project_id: str, inputs: dict):
+        """Schedules a debounced state sync, replacing any pending one."""
+        if self.sync_delay <= 0:
+            self._sync_state(project_id, inputs)
+            return
+
+        timer = threading.Timer(self.sync_delay, self._flush_sync, args=[project_id])
+        timer.daemon = True
+        with self._sync_lock:
+            previous = self._pending_syncs.get(project_id)
+            if previous is not None:
+                previous[1].cancel()
+            self._pending_syncs[project_id] = (inputs, timer)
+        timer.start()
+
+    def _take_pending_sync(self, project_id: str) -> Optional[dict]:
+        """Removes and cancels the pending sync for a project, if any."""
+        with self._sync_lock:
+            pending = self._pending_syncs.pop(project_id, None)
+        if pending is None:
+            return None
+        pending[1].cancel()
+        return pending[0]
+
+    def _flush_sync(self, project_id: str):
+        """Executes the pending sync for a project (timer callback)."""
+        inputs = self._take_pending_sync(project_id)
+        if inputs is None:
+            return
+        try:
+            self._sync_state(project_id, inputs)
+        except Exception as e:
+            logger.exception(f"Error syncing browser state for project {project_id}: {str(e)}")
+
+    def flush_syncs(self):
+        """Immediately executes all pending state syncs."""
+        with self._sync_lock:
+            project_ids = list(self._pending_syncs)
+        for project_id in project_ids:
+            self._flush_sync(project_id)
 
     def __call__(self, project_id: str, result):
         """Callback for the AuditLogObserver.
@@ -75,78 +200,38 @@ class BrowserExecutor:
             self._ensure_browser()
             page = self._get_page(project_id)
 
-            res_msg = ""
-            if action_type == "navigate":
-                url = params["url"]
-                page.goto(url)
-                res_msg = f"Navigated to {url}"
-            elif action_type == "click":
-                selector = params["selector"]
-                page.click(selector)
-                res_msg = f"Clicked element: {selector}"
-            elif action_type == "type":
-                selector = params["selector"]
-                text = params["text"]
-                page.fill(selector, text)
-                res_msg = f"Typed '{text}' into {selector}"
-            elif action_type == "scroll":
-                direction = params["direction"]
-                amount = params.get("amount", 500)
-                if direction == "down":
-                    page.evaluate(f"window.scrollBy(0, {amount})")
-                else:
-                    page.evaluate(f"window.scrollBy(0, -{amount})")
-                res_msg = f"Scrolled {direction} by {amount}px"
-            else:
+            handler = self._handlers.get(action_type)
+            if handler is None:
                 logger.warning(f"Unknown browser action type: {action_type}")
                 return
-
-            # 3. Synchronize state back
-            sync_intent = ChatIntent(
-                type=IntentType.ACTION_CALL,
-                request_id=f"sync-{uuid.uuid4().hex[:8]}",
-                action_id="browser.sync.state",
-                inputs={
-                    "url": page.url,
-                    "title": page.title(),
-                    "status": "idle",
-                    "last_action_result": res_msg,
-                    "last_error": None
-                }
-            )
-            self.engine.execute_intent(
-                project_id=project_id,
-                intent=sync_intent,
-                user_roles=["admin"],
-                user_id="system_browser"
-            )
-            logger.info(f"Browser action '{action_type}' completed and synced.")
+            res_msg = handler(page, params)
+
+            # 3. Synchronize state back. Page properties are read here since
+            # Playwright's sync API is bound to this thread; only the engine
+            # write is deferred so a burst of actions coalesces into one sync.
+            self._schedule_sync(project_id, {
+                "url": page.url,
+                "title": page.title(),
+                "status": "idle",
+                "last_action_result": res_msg,
+                "last_error": None
+            })
+            logger.info(f"Browser action '{action_type}' completed; sync scheduled.")
 
         except Exception as e:
             logger.exception(f"Error executing browser action '{action_type}': {str(e)}")
-            # Sync error state
-            error_intent = ChatIntent(
-                type=IntentType.ACTION_CALL,
-                request_id=f"err-{uuid.uuid4().hex[:8]}",
-                action_id="browser.sync.state",
-                inputs={
-                    "status": "error",
-                    "last_error": str(e)
-                }
-            )
-            self.engine.execute_intent(
-                project_id=project_id,
-                intent=error_intent,
-                user_roles=["admin"],
-                user_id="system_browser"
-            )
+            # Sync error state right away, folding in any pending success state
+            inputs = self._take_pending_sync(project_id) or {}
+            inputs.update({"status": "error", "last_error": str(e)})
+            self._sync_state(project_id, inputs, prefix="err")
 
     def stop(self):
-        """Closes the browser and stops Playwright."""
+        """Flushes pending syncs, closes the browser and stops Playwright."""
+        self.flush_syncs()
         if self._playwright:
             if self._browser:
                 self._browser.close()
             self._playwright.stop()
             self._playwright = None
             self._browser = None
-            self._pages = {}
+            self._pages = OrderedDict()
@@ -5,21 +5,36 @@ gatekeeper for all state mutations. It enforces governance policies, validates
 inputs, checks permissions, and records audit logs.
 """
 
-import ast
-import copy
-import hashlib
 import os
 import threading
 import time
 import uuid
-from datetime import datetime
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Any, Callable, Optional
 
 import jsonschema
 from pydantic import BaseModel
 
+from gradio_chat_agent.execution.authority import (
+    ROLE_ADMIN,
+    ROLE_OPERATOR,
+    ApprovalRule,
+    compile_approval_rules,
+    has_role,
+    intern_role,
+    is_viewer_only,
+    match_approval_rule,
+    to_role_mask,
+)
+from gradio_chat_agent.execution.expressions import (
+    compile_safe_expr,
+    eval_compiled,
+    state_references,
+)
 from gradio_chat_agent.models.enums import (
-    ActionRisk,
+    ExecutionMode,
     ExecutionStatus,
     IntentType,
 )
@@ -36,13 +51,72 @@ from gradio_chat_agent.observability.metrics import (
     ENGINE_EXECUTION_DURATION_SECONDS,
     ENGINE_EXECUTION_TOTAL,
 )
-from gradio_chat_agent.persistence.repository import StateRepository
+from gradio_chat_agent.persistence.repository import (
+    StateRepository,
+    UsageSnapshot,
+)
 from gradio_chat_agent.registry.abstract import Registry
-from gradio_chat_agent.utils import compute_checksum, compute_state_diff
+from gradio_chat_agent.utils import (
+    compute_checksum,
+    compute_media_hash,
+    compute_state_diff,
+    fast_clone,
+)
 
 
 logger = get_logger(__name__)
 
+# ExecutionResult stores statuses as plain strings (`use_enum_values`), so
+# hot loops compare against the values rather than the enum members.
+_SUCCESS = ExecutionStatus.SUCCESS.value
+_REJECTED = ExecutionStatus.REJECTED.value
+_FAILED = ExecutionStatus.FAILED.value
+
+# Maximum number of steps in a plan, per execution mode. Intents store the
+# mode as its plain value (`use_enum_values`).
+_PLAN_STEP_LIMITS = {
+    ExecutionMode.INTERACTIVE.value: 1,
+    ExecutionMode.ASSISTED.value: 5,
+    ExecutionMode.AUTONOMOUS.value: 10,
+}
+_DEFAULT_PLAN_STEP_LIMIT = _PLAN_STEP_LIMITS[ExecutionMode.ASSISTED.value]
+
+# Lowercase day abbreviations indexed by `datetime.weekday()`.
+_DAY_ABBR = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+
+def _parse_hhmm(value: str) -> int:
+    """Converts an 'HH:MM' string to minutes since midnight."""
+    hours, minutes = value.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def _normalize_windows(
+    windows: list[dict],
+) -> tuple[tuple[frozenset[str], int, int], ...]:
+    """Normalizes execution windows into (days, start, end) tuples.
+
+    Start and end are minutes since midnight. Windows without exactly two
+    parseable 'HH:MM' bounds are dropped, as they can never match.
+
+    Args:
+        windows: The 'execution_windows.allowed' entries of a policy.
+
+    Returns:
+        A tuple of (day set, start minute, end minute) tuples.
+    """
+    normalized = []
+    for window in windows:
+        hours = window.get("hours", [])
+        if len(hours) != 2:
+            continue
+        try:
+            start, end = _parse_hhmm(hours[0]), _parse_hhmm(hours[1])
+        except (AttributeError, ValueError):
+            continue
+        normalized.append((frozenset(window.get("days", [])), start, end))
+    return tuple(normalized)
+
 
 class EngineConfig(BaseModel):
     """Configuration for the Execution Engine.
@@ -50,9 +124,43 @@ class EngineConfig(BaseModel):
     Attributes:
         require_confirmed_for_confirmation_required: If True, strictly enforces
             the 'confirmed' flag for actions that require it.
+        policy_cache_ttl: Seconds a project's policy and archived flag are
+            cached between executions. Zero disables the cache.
+        trust_handler_diff: If True, records the diff returned by the
+            handler instead of recomputing it from the old and new state.
+            State reconstruction replays recorded diffs, so only enable
+            this when every handler returns a complete, exact diff.
     """
 
     require_confirmed_for_confirmation_required: bool = True
+    policy_cache_ttl: float = 0.0
+    trust_handler_diff: bool = False
+
+
+# Validated once; simulated memory actions return shallow copies of it.
+_MEMORY_SIM_TEMPLATE = ExecutionResult(
+    request_id="",
+    action_id="memory.remember",
+    status=ExecutionStatus.SUCCESS,
+    message="Simulated memory update.",
+    state_snapshot_id="simulated",
+    simulated=True,
+)
+
+
+@dataclass(frozen=True)
+class ProjectPolicy:
+    """Per-project governance settings, optionally cached by the engine.
+
+    Attributes:
+        limits: The project policy, as returned by `get_project_limits`.
+        archived: Whether the project is archived.
+        approvals: The policy's approval rules, compiled and sorted.
+    """
+
+    limits: dict[str, Any]
+    archived: bool
+    approvals: tuple[ApprovalRule, ...] = ()
 
 
 class ExecutionEngine:
@@ -84,7 +192,9 @@ class ExecutionEngine:
         self.repository = repository
         self.config = config or EngineConfig()
         self.project_locks: dict[str, threading.Lock] = {}
-        self._global_lock = threading.Lock()
+        self._policy_cache: dict[str, tuple[float, ProjectPolicy]] = {}
+        # Usage counters read once per simulated plan, keyed by project.
+        self._plan_usage = threading.local()
         self.post_execution_hooks: list[
             Callable[[str, ExecutionResult], None]
         ] = []
@@ -125,7 +235,7 @@ class ExecutionEngine:
         members = self.repository.get_project_members(project_id)
         for m in members:
             if m["user_id"] == user_id:
-                return [m["role"]]
+                return [intern_role(m["role"])]
 
         # 2. Check dynamic mapping rules
         user = self.repository.get_user(user_id)
@@ -148,7 +258,7 @@ class ExecutionEngine:
                 if condition and role:
                     try:
                         if self._safe_eval(condition, {"user": proxy}):
-                            return [role]
+                            return [intern_role(role)]
                     except Exception as e:
                         logger.warning(
                             f"Error evaluating role mapping for user {user_id}: {str(e)}"
@@ -165,7 +275,7 @@ class ExecutionEngine:
             project_id: The project context.
             result: The successful execution result.
         """
-        if result.simulated or result.status != ExecutionStatus.SUCCESS:
+        if result.simulated or result.status != _SUCCESS:
             return
 
         for hook in self.post_execution_hooks:
@@ -184,19 +294,94 @@ class ExecutionEngine:
                     },
                 )
 
+    def invalidate_policy(self, project_id: Optional[str] = None):
+        """Drops cached project policy so the next execution refetches it.
+
+        Args:
+            project_id: The project to invalidate. If None, clears all.
+        """
+        if project_id is None:
+            self._policy_cache.clear()
+        else:
+            self._policy_cache.pop(project_id, None)
+
+    def _get_policy(self, project_id: str) -> ProjectPolicy:
+        """Fetches a project's policy and archived flag.
+
+        The result is served from the cache while it is within its TTL.
+
+        Args:
+            project_id: The ID of the project.
+
+        Returns:
+            The project's governance settings.
+        """
+        ttl = self.config.policy_cache_ttl
+        now = time.monotonic()
+        if ttl > 0:
+            entry = self._policy_cache.get(project_id)
+            if entry is not None and now - entry[0] < ttl:
+                return entry[1]
+
+        usage = self.repository.get_usage_snapshot(project_id, counters=False)
+        policy = ProjectPolicy(
+            limits=usage.limits,
+            archived=usage.archived,
+            approvals=compile_approval_rules(
+                usage.limits.get("approvals", [])
+            ),
+        )
+        if ttl > 0:
+            self._policy_cache[project_id] = (now, policy)
+        return policy
+
+    def _get_usage(
+        self, project_id: str, policy: ProjectPolicy, simulate: bool = False
+    ) -> UsageSnapshot:
+        """Reads the rate and budget counters for a project.
+
+        Must be called while holding the project lock, so that the limit
+        checks and the commit they guard see the same counters. Within a
+        simulated plan the counters are read once and reused by every
+        step: simulated successes are not recorded, and the first
+        rejection ends the plan, so they cannot change between steps.
+
+        Args:
+            project_id: The ID of the project.
+            policy: The policy in effect for this execution.
+            simulate: Whether this is a dry-run execution.
+
+        Returns:
+            The project's usage snapshot.
+        """
+        cache = (
+            getattr(self._plan_usage, "snapshots", None) if simulate else None
+        )
+        if cache is not None and project_id in cache:
+            return cache[project_id]
+        usage = self.repository.get_usage_snapshot(
+            project_id, limits=policy.limits, archived=policy.archived
+        )
+        if cache is not None:
+            cache[project_id] = usage
+        return usage
+
     def _get_project_lock(self, project_id: str) -> threading.Lock:
         """Retrieves (or creates) a threading lock for a specific project.
 
+        Lookups are lock-free: `dict.setdefault` is atomic under the GIL,
+        so concurrent first calls for a project still agree on one lock.
+
         Args:
             project_id: The ID of the project to lock.
 
         Returns:
             A threading.Lock object dedicated to the project.
         """
-        with self._global_lock:
-            if project_id not in self.project_locks:
-                self.project_locks[project_id] = threading.Lock()
-            return self.project_locks[project_id]
+        lock = self.project_locks.get(project_id)
+        if lock is None:
+            lock = self.project_locks.setdefault(project_id, threading.Lock())
+        return lock
 
     from contextlib import contextmanager
 
@@ -247,22 +432,13 @@ class ExecutionEngine:
         Returns:
             True if current UTC time is within an allowed window, False otherwise.
         """
-        from datetime import datetime, timezone
-
         now = datetime.now(timezone.utc)
-        current_day = now.strftime("%a").lower()
-        current_time_str = now.strftime("%H:%M")
-
-        for window in windows:
-            allowed_days = window.get("days", [])
-            if current_day not in allowed_days:
-                continue
+        current_day = _DAY_ABBR[now.weekday()]
+        current_minute = now.hour * 60 + now.minute
 
-            allowed_hours = window.get("hours", [])
-            if len(allowed_hours) == 2:
-                start_str, end_str = allowed_hours
-                if start_str <= current_time_str <= end_str:
-                    return True
+        for days, start, end in _normalize_windows(windows):
+            if current_day in days and start <= current_minute <= end:
+                return True
 
         return False
 
@@ -286,55 +462,7 @@ class ExecutionEngine:
         Raises:
             ValueError: If the expression contains forbidden nodes.
         """
-        tree = ast.parse(expr, mode="eval")
-
-        # Define allowed node types
-        allowed_nodes = (
-            ast.Expression,
-            ast.Constant,
-            ast.Name,
-            ast.Load,
-            ast.Attribute,
-            ast.Subscript,
-            ast.Index,  # For older Python versions
-            ast.Slice,
-            ast.BinOp,
-            ast.UnaryOp,
-            ast.Compare,
-            ast.BoolOp,
-            ast.And,
-            ast.Or,
-            ast.Not,
-            ast.Add,
-            ast.Sub,
-            ast.Mult,
-            ast.Div,
-            ast.Mod,
-            ast.Pow,
-            ast.Eq,
-            ast.NotEq,
-            ast.Lt,
-            ast.LtE,
-            ast.Gt,
-            ast.GtE,
-            ast.Is,
-            ast.IsNot,
-            ast.In,
-            ast.NotIn,
-            ast.USub,
-            ast.UAdd,
-            ast.Call,
-        )
-
-        for node in ast.walk(tree):
-            if not isinstance(node, allowed_nodes):
-                raise ValueError(
-                    f"Forbidden expression node: {type(node).__name__}"
-                )
-
-        # Compile and evaluate in a restricted environment
-        code = compile(tree, filename="<safe_eval>", mode="eval")
-        return eval(code, {"__builtins__": {}}, context)
+        return eval_compiled(compile_safe_expr(expr), context)
 
     def execute_plan(
         self,
@@ -364,11 +492,7 @@ class ExecutionEngine:
             mode = plan.steps[0].execution_mode or "assisted"
 
         # Set limits
-        max_steps = 5  # Default/Assisted
-        if mode == "interactive":
-            max_steps = 1
-        elif mode == "autonomous":
-            max_steps = 10
+        max_steps = _PLAN_STEP_LIMITS.get(mode, _DEFAULT_PLAN_STEP_LIMIT)
 
         if len(plan.steps) > max_steps:
             error_result = self._create_rejection(
@@ -381,26 +505,35 @@ class ExecutionEngine:
 
         current_simulated_state = None
 
-        for step in plan.steps:
-            # Execute the step
-            result = self.execute_intent(
-                project_id=project_id,
-                intent=step,
-                user_roles=user_roles,
-                simulate=simulate,
-                override_state=current_simulated_state,
-                user_id=user_id,
-            )
-            results.append(result)
+        owns_usage = (
+            simulate and getattr(self._plan_usage, "snapshots", None) is None
+        )
+        if owns_usage:
+            self._plan_usage.snapshots = {}
 
-            # Abort on failure or rejection
-            if result.status != ExecutionStatus.SUCCESS:
-                break
+        try:
+            for step in plan.steps:
+                # Execute the step
+                result = self.execute_intent(
+                    project_id=project_id,
+                    intent=step,
+                    user_roles=user_roles,
+                    simulate=simulate,
+                    override_state=current_simulated_state,
+                    user_id=user_id,
+                )
+                results.append(result)
 
-            # If simulating, update the simulated state for the next step
-            if simulate and result.status == ExecutionStatus.SUCCESS:
-                if hasattr(result, "_simulated_state"):
+                # Abort on failure, rejection or pending approval
+                if result.status != _SUCCESS:
+                    break
+
+                # If simulating, update the simulated state for the next step
+                if simulate and hasattr(result, "_simulated_state"):
                     current_simulated_state = result._simulated_state
+        finally:
+            if owns_usage:
+                self._plan_usage.snapshots = None
 
         return results
 
@@ -411,6 +544,7 @@ class ExecutionEngine:
         current_state: dict,
         user_id: Optional[str],
         user_roles: list[str],
+        limits: Optional[dict[str, Any]] = None,
     ) -> Optional[ExecutionResult]:
         """Evaluates custom policy rules defined in the project policy.
 
@@ -420,12 +554,14 @@ class ExecutionEngine:
             current_state: The current application state.
             user_id: The ID of the user.
             user_roles: The resolved roles for the user.
+            limits: The project policy, if already fetched.
 
         Returns:
             An ExecutionResult if a rule triggers a rejection or approval requirement,
             otherwise None.
         """
-        limits = self.repository.get_project_limits(project_id)
+        if limits is None:
+            limits = self.repository.get_project_limits(project_id)
         rules = limits.get("rules", [])
 
         # Construct evaluation context
@@ -503,6 +639,11 @@ class ExecutionEngine:
         This method validates the intent, checks permissions, executes the
         action (if valid), and persists the result.
 
+        Checks run cheapest first and the first failing one decides the
+        outcome: lifecycle and execution window, policy rules, rate and
+        budget limits, roles, confirmation, approval, handler presence, and
+        only then input schema validation and preconditions.
+
         Args:
             project_id: The ID of the project context.
             intent: The structured intent object to execute.
@@ -542,8 +683,11 @@ class ExecutionEngine:
                 execution_time_ms=get_duration(),
             )
 
+        # Policy and lifecycle state (counters are read under the lock)
+        policy = self._get_policy(project_id)
+
         # 1.3 Project Lifecycle Check
-        if self.repository.is_project_archived(project_id):
+        if policy.archived:
             return self._create_rejection(
                 project_id,
                 intent,
@@ -554,7 +698,7 @@ class ExecutionEngine:
             )
 
         # 1.5 Execution Window Check
-        limits = self.repository.get_project_limits(project_id)
+        limits = policy.limits
         windows = limits.get("execution_windows", {}).get("allowed")
         if windows and not simulate:
             if not self._is_within_execution_window(windows):
@@ -579,34 +723,38 @@ class ExecutionEngine:
                 )
 
             if simulate:
-                return ExecutionResult(
-                    request_id=intent.request_id,
-                    user_id=user_id,
-                    action_id=intent.action_id,
-                    status=ExecutionStatus.SUCCESS,
-                    message="Simulated memory update.",
-                    state_snapshot_id="simulated",
-                    simulated=True,
-                    execution_time_ms=get_duration(),
+                # Copy the validated template instead of re-validating
+                return _MEMORY_SIM_TEMPLATE.model_copy(
+                    update={
+                        "request_id": intent.request_id,
+                        "user_id": user_id,
+                        "action_id": intent.action_id,
+                        "timestamp": datetime.now(),
+                        "execution_time_ms": get_duration(),
+                        "state_diff": [],
+                        "metadata": {},
+                    }
                 )
 
             inputs = intent.inputs or {}
+            key = inputs.get("key")
             try:
                 if intent.action_id == "memory.remember":
+                    value = inputs.get("value")
                     self.repository.save_session_fact(
                         project_id,
                         user_id,
-                        inputs.get("key"),  # pyright: ignore[reportArgumentType]; The error will be caugt by the exception.
-                        inputs.get("value"),
+                        key,  # pyright: ignore[reportArgumentType]; The error will be caugt by the exception.
+                        value,
                     )
-                    msg = f"Remembered: {inputs.get('key')} = {inputs.get('value')}"
+                    msg = f"Remembered: {key} = {value}"
                 else:  # memory.forget
                     self.repository.delete_session_fact(
                         project_id,
                         user_id,
-                        inputs.get("key"),  # pyright: ignore[reportArgumentType]; The error will be caugt by the exception.
+                        key,  # pyright: ignore[reportArgumentType]; The error will be caugt by the exception.
                     )
-                    msg = f"Forgot: {inputs.get('key')}"
+                    msg = f"Forgot: {key}"
 
                 # Log execution, but no state diff for components
                 result = ExecutionResult(
@@ -632,7 +780,13 @@ class ExecutionEngine:
                 )
 
         # 2. Acquire Lock
-        with self.project_lock(project_id):
+        # Chained simulation runs against the caller's state and commits
+        # nothing, so it does not need to serialize with real executions.
+        if simulate and override_state is not None:
+            lock = nullcontext()
+        else:
+            lock = self.project_lock(project_id)
+        with lock:
             # 3. Load State
             if override_state is not None:
                 current_snapshot = StateSnapshot(
@@ -664,8 +818,10 @@ class ExecutionEngine:
                         )
 
             # 4. Resolve Action
-            action = self.registry.get_action(intent.action_id)
-            if not action:
+            # One lookup resolves the declaration, handler, validator and
+            # compiled preconditions prepared at registration.
+            compiled = self.registry.get_compiled_action(intent.action_id)
+            if compiled is None:
                 return self._create_rejection(
                     project_id,
                     intent,
@@ -681,25 +837,25 @@ class ExecutionEngine:
                 current_snapshot.components,
                 user_id,
                 user_roles,
+                limits=limits,
             )
             if rule_result:
                 return rule_result
 
-            action_cost = getattr(action, "cost", 1.0)
+            action = compiled.action
+            action_cost = action.cost
 
             # 5. Authorization & Governance
-            # Fetch Limits
-            limits = self.repository.get_project_limits(project_id)
+            # Counters are read under the project lock, so concurrent
+            # executions cannot both pass the same rate or budget check.
+            usage = self._get_usage(project_id, policy, simulate)
 
             # Rate Limiting: Check actions/minute
             rpm_limit = (
                 limits.get("limits", {}).get("rate", {}).get("per_minute")
             )
             if rpm_limit and not simulate:
-                recent_count = self.repository.count_recent_executions(
-                    project_id, minutes=1
-                )
-                if recent_count >= rpm_limit:
+                if usage.per_minute >= rpm_limit:
                     return self._create_rejection(
                         project_id,
                         intent,
@@ -715,10 +871,7 @@ class ExecutionEngine:
                 limits.get("limits", {}).get("rate", {}).get("per_hour")
             )
             if rph_limit and not simulate:
-                recent_count = self.repository.count_recent_executions(
-                    project_id, minutes=60
-                )
-                if recent_count >= rph_limit:
+                if usage.per_hour >= rph_limit:
                     return self._create_rejection(
                         project_id,
                         intent,
@@ -735,9 +888,7 @@ class ExecutionEngine:
                     limits.get("limits", {}).get("budget", {}).get("daily")
                 )
                 if daily_budget is not None:
-                    current_usage = self.repository.get_daily_budget_usage(
-                        project_id
-                    )
+                    current_usage = usage.daily_budget_used
                     if current_usage + action_cost > daily_budget:
                         return self._create_rejection(
                             project_id,
@@ -750,12 +901,13 @@ class ExecutionEngine:
                         )
 
             # --- RBAC Role Enforcement ---
-            if "admin" in user_roles:
+            role_mask = to_role_mask(user_roles)
+            if has_role(role_mask, ROLE_ADMIN):
                 # Admins have full access
                 pass
-            elif "operator" in user_roles:
+            elif has_role(role_mask, ROLE_OPERATOR):
                 # Operators can execute low and medium risk actions
-                if action.permission.risk == ActionRisk.HIGH:
+                if compiled.high_risk:
                     return self._create_rejection(
                         project_id,
                         intent,
@@ -765,7 +917,7 @@ class ExecutionEngine:
                         execution_time_ms=get_duration(),
                         cost=action_cost,
                     )
-            elif "viewer" in user_roles or not user_roles:
+            elif is_viewer_only(role_mask) or not user_roles:
                 # Viewers cannot execute any actions
                 return self._create_rejection(
                     project_id,
@@ -789,59 +941,75 @@ class ExecutionEngine:
                 )
 
             # Confirmation check
-            if self.config.require_confirmed_for_confirmation_required:
-                if (
-                    action.permission.confirmation_required
-                    or action.permission.risk == ActionRisk.HIGH
-                ):
-                    if not intent.confirmed:
-                        return self._create_rejection(
-                            project_id,
-                            intent,
-                            "Confirmation required.",
-                            code="confirmation_required",
-                            user_id=user_id,
-                            execution_time_ms=get_duration(),
-                            cost=action_cost,
-                        )
+            if (
+                compiled.needs_confirmation
+                and not intent.confirmed
+                and self.config.require_confirmed_for_confirmation_required
+            ):
+                return self._create_rejection(
+                    project_id,
+                    intent,
+                    "Confirmation required.",
+                    code="confirmation_required",
+                    user_id=user_id,
+                    execution_time_ms=get_duration(),
+                    cost=action_cost,
+                )
 
             # Approval Workflow Check
             if not simulate and not intent.confirmed:
-                approval_rules = limits.get("approvals", [])
-
-                for rule in approval_rules:
-                    min_cost = rule.get("min_cost", 0)
+                rule = match_approval_rule(
+                    policy.approvals,
+                    action_cost,
+                    role_mask,
+                    frozenset(user_roles),
+                )
+                if rule is not None:
                     required_role = rule.get("required_role", "admin")
-
-                    if (
-                        action_cost >= min_cost
-                        and required_role not in user_roles
-                    ):
-                        # This action triggers an approval requirement
-                        result = ExecutionResult(
-                            request_id=intent.request_id,
-                            user_id=user_id,
-                            action_id=intent.action_id,
-                            status=ExecutionStatus.PENDING_APPROVAL,
-                            message=f"Action requires approval from a {required_role} (Cost: {action_cost}).",
-                            state_snapshot_id="none",
-                            execution_time_ms=get_duration(),
-                            cost=action_cost,
-                        )
-                        # We save it to history so admins can see pending requests
-                        self.repository.save_execution(project_id, result)
-                        return result
+                    # This action triggers an approval requirement
+                    result = ExecutionResult(
+                        request_id=intent.request_id,
+                        user_id=user_id,
+                        action_id=intent.action_id,
+                        status=ExecutionStatus.PENDING_APPROVAL,
+                        message=f"Action requires approval from a {required_role} (Cost: {action_cost}).",
+                        state_snapshot_id="none",
+                        execution_time_ms=get_duration(),
+                        cost=action_cost,
+                    )
+                    # We save it to history so admins can see pending requests
+                    self.repository.save_execution(project_id, result)
+                    return result
+
+            # 5.5 Handler Lookup
+            # A missing handler is an O(1) check, so it runs before the more
+            # expensive schema validation and precondition evaluation.
+            handler = compiled.handler
+            if not handler:
+                return self._create_failure(
+                    project_id,
+                    intent,
+                    f"No handler registered for {intent.action_id}.",
+                    user_id=user_id,
+                    execution_time_ms=get_duration(),
+                    cost=action_cost,
+                )
 
             # 6. Schema Validation
-            try:
-                jsonschema.validate(
-                    instance=intent.inputs or {}, schema=action.input_schema
-                )
-            except jsonschema.ValidationError as e:
+            # The validator is reused across calls; `best_match` picks the
+            # same error `jsonschema.validate` would raise.
+            validator = compiled.validator
+            if validator is None:
+                # Re-raises the schema error for an invalid input schema
+                validator = self.registry.get_input_validator(action)
+            error = jsonschema.exceptions.best_match(
+                validator.iter_errors(intent.inputs or {})
+            )
+            if error is not None:
                 return self._create_rejection(
                     project_id,
                     intent,
-                    f"Input validation failed: {e.message}",
+                    f"Input validation failed: {error.message}",
                     user_id=user_id,
                     execution_time_ms=get_duration(),
                     cost=action_cost,
@@ -853,9 +1021,12 @@ class ExecutionEngine:
                 "state": current_snapshot.components,
                 "inputs": intent.inputs or {},
             }
-            for precondition in action.preconditions:
+            for code, precondition in compiled.preconditions:
                 try:
-                    if not self._safe_eval(precondition.expr, eval_context):
+                    if code is None:
+                        # Re-raises the compile error for this precondition
+                        code = compile_safe_expr(precondition.expr)
+                    if not eval_compiled(code, eval_context):
                         return self._create_rejection(
                             project_id,
                             intent,
@@ -875,24 +1046,19 @@ class ExecutionEngine:
                     )
 
             # 8. Execution
-            handler = self.registry.get_handler(intent.action_id)
-            if not handler:
-                return self._create_failure(
-                    project_id,
-                    intent,
-                    f"No handler registered for {intent.action_id}.",
-                    user_id=user_id,
-                    execution_time_ms=get_duration(),
-                    cost=action_cost,
-                )
-
             try:
-                # Deep copy components to prevent mutation of the old snapshot object
-                # if the handler mutates in place (though handlers should be pure-ish)
-                components_copy = copy.deepcopy(current_snapshot.components)
-
-                # Create a temporary snapshot object for the handler to read
-                temp_snapshot = StateSnapshot(
+                # Deep copy components to prevent mutation of the old snapshot
+                # object if the handler mutates in place. Handlers marked pure
+                # copy what they change, so they can share the live state.
+                if compiled.pure:
+                    components_copy = current_snapshot.components
+                else:
+                    components_copy = fast_clone(current_snapshot.components)
+
+                # Create a temporary snapshot object for the handler to read.
+                # The fields come from an already-validated snapshot, so skip
+                # pydantic validation (which would copy the components again).
+                temp_snapshot = StateSnapshot.model_construct(
                     snapshot_id=current_snapshot.snapshot_id,
                     timestamp=current_snapshot.timestamp,
                     components=components_copy,
@@ -911,18 +1077,65 @@ class ExecutionEngine:
                     cost=action_cost,
                 )
 
+            # The committed snapshot is built without validation below, so
+            # check the shape its `components` field requires here.
+            if not isinstance(new_components, dict) or not all(
+                isinstance(state, dict) for state in new_components.values()
+            ):
+                return self._create_failure(
+                    project_id,
+                    intent,
+                    "Handler error: new state must map component IDs to dicts.",
+                    user_id=user_id,
+                    execution_time_ms=get_duration(),
+                    cost=action_cost,
+                )
+
+            old_components = current_snapshot.components
+            changed_ids = {
+                cid
+                for cid in old_components.keys() | new_components.keys()
+                if old_components.get(cid) != new_components.get(cid)
+            }
+
+            # Re-compute diffs if handler didn't provide them reliably,
+            # or just trust the handler. The Utils function is safer.
+            if self.config.trust_handler_diff:
+                computed_diffs = list(diffs or [])
+            else:
+                computed_diffs = compute_state_diff(
+                    old_components, new_components
+                )
+
             # 8.5 Invariant Check
-            for component in self.registry.list_components():
-                for invariant in component.invariants:
+            # A no-op handler leaves the state identical, so there is nothing
+            # to re-check. Otherwise, invariants that only read components the
+            # handler left untouched are skipped; their inputs are identical
+            # to the previous state. Invariants with unknown or missing
+            # references always run.
+            if changed_ids:
+                invariant_context = {"state": new_components}
+                for (
+                    component_id,
+                    code,
+                    invariant,
+                ) in self.registry.get_compiled_invariants():
+                    refs = state_references(invariant.expr)
+                    if (
+                        refs
+                        and refs.isdisjoint(changed_ids)
+                        and refs.issubset(new_components)
+                    ):
+                        continue
                     try:
-                        if not self._safe_eval(
-                            invariant.expr,
-                            {"state": new_components},
-                        ):
+                        if code is None:
+                            # Re-raises the compile error for this invariant
+                            code = compile_safe_expr(invariant.expr)
+                        if not eval_compiled(code, invariant_context):
                             return self._create_failure(
                                 project_id,
                                 intent,
-                                f"Invariant violated for {component.component_id}: {invariant.description}",
+                                f"Invariant violated for {component_id}: {invariant.description}",
                                 code="invariant_violation",
                                 user_id=user_id,
                                 execution_time_ms=get_duration(),
@@ -932,7 +1145,7 @@ class ExecutionEngine:
                         return self._create_failure(
                             project_id,
                             intent,
-                            f"Error evaluating invariant for {component.component_id}: {str(e)}",
+                            f"Error evaluating invariant for {component_id}: {str(e)}",
                             code="invariant_error",
                             user_id=user_id,
                             execution_time_ms=get_duration(),
@@ -952,9 +1165,7 @@ class ExecutionEngine:
                 history = self.repository.get_execution_history(
                     project_id, limit=10
                 )
-                success_count = sum(
-                    1 for e in history if e.status == ExecutionStatus.SUCCESS
-                )
+                success_count = sum(1 for e in history if e.status == _SUCCESS)
                 if current_snapshot and success_count % 5 != 0:
                     is_checkpoint = False
                     parent_id = current_snapshot.snapshot_id
@@ -964,19 +1175,12 @@ class ExecutionEngine:
             metadata["cost"] = action_cost
 
             if intent.media and intent.media.data:
-                media_hash = hashlib.sha256(
-                    intent.media.data.encode("utf-8")
-                ).hexdigest()
-                metadata["media_hash"] = media_hash
+                metadata["media_hash"] = compute_media_hash(intent.media.data)
                 metadata["media_type"] = intent.media.type
                 metadata["media_mime"] = intent.media.mime_type
 
-            # Re-compute diffs if handler didn't provide them reliably,
-            # or just trust the handler. The Utils function is safer.
-            computed_diffs = compute_state_diff(
-                current_snapshot.components, new_components
-            )
-
+            # One timestamp for the execution and the snapshot it produces
+            committed_at = datetime.now()
             result = ExecutionResult(
                 request_id=intent.request_id,
                 user_id=user_id,
@@ -990,6 +1194,7 @@ class ExecutionEngine:
                 execution_time_ms=get_duration(),
                 cost=action_cost,
                 metadata=metadata,
+                timestamp=committed_at,
             )
 
             # Metrics
@@ -998,7 +1203,7 @@ class ExecutionEngine:
                     action_id=intent.action_id
                 ).observe(result.execution_time_ms / 1000.0)
             ENGINE_EXECUTION_TOTAL.labels(
-                status="success",
+                status=_SUCCESS,
                 action_id=intent.action_id,
                 project_id=project_id,
             ).inc()
@@ -1016,7 +1221,7 @@ class ExecutionEngine:
                         "project_id": project_id,
                         "user_id": user_id,
                         "action_id": intent.action_id,
-                        "status": "success",
+                        "status": _SUCCESS,
                         "simulated": simulate,
                         "duration_ms": result.execution_time_ms,
                         "cost": result.cost,
@@ -1028,8 +1233,11 @@ class ExecutionEngine:
                 result._simulated_state = new_components
                 return result
 
-            new_snapshot = StateSnapshot(
+            # Every field is set, so `model_construct` skips both validation
+            # (an O(n) copy of the components) and the default factories.
+            new_snapshot = StateSnapshot.model_construct(
                 snapshot_id=new_snapshot_id,
+                timestamp=committed_at,
                 components=new_components,
                 checksum=compute_checksum(new_components),
                 is_checkpoint=is_checkpoint,
@@ -1088,10 +1296,13 @@ class ExecutionEngine:
 
             # 2. Revert Logic
             new_snapshot_id = str(uuid.uuid4())
-            new_components = copy.deepcopy(target_snapshot.components)
+            new_components = fast_clone(target_snapshot.components)
+            reverted_at = datetime.now()
 
-            new_snapshot = StateSnapshot(
+            # Cloned from a stored snapshot, so there is nothing to validate
+            new_snapshot = StateSnapshot.model_construct(
                 snapshot_id=new_snapshot_id,
+                timestamp=reverted_at,
                 components=new_components,
                 checksum=compute_checksum(new_components),
                 is_checkpoint=True,
@@ -1109,6 +1320,7 @@ class ExecutionEngine:
                 message=f"Reverted state to snapshot {snapshot_id}",
                 state_snapshot_id=new_snapshot_id,
                 state_diff=diffs,
+                timestamp=reverted_at,
             )
 
             # 3. Persistence
@@ -1151,7 +1363,7 @@ class ExecutionEngine:
         reconstructed_state: dict[str, dict[str, Any]] = {}
 
         for entry in history:
-            if entry.status != ExecutionStatus.SUCCESS:
+            if entry.status != _SUCCESS:
                 continue
 
             # Apply diffs to reconstructed_state
@@ -1182,14 +1394,10 @@ class ExecutionEngine:
             if target_timestamp:
                 entry_ts = entry.timestamp
                 if entry_ts.tzinfo is None:
-                    from datetime import timezone
-
                     entry_ts = entry_ts.replace(tzinfo=timezone.utc)
 
                 target_ts = target_timestamp
                 if target_ts.tzinfo is None:
-                    from datetime import timezone
-
                     target_ts = target_ts.replace(tzinfo=timezone.utc)
 
                 if entry_ts > target_ts:
@@ -1197,6 +1405,50 @@ class ExecutionEngine:
 
         return reconstructed_state
 
+    @staticmethod
+    def _build_error_result(
+        status: ExecutionStatus,
+        intent: ChatIntent,
+        message: str,
+        code: str,
+        snapshot_id: str,
+        user_id: Optional[str],
+        execution_time_ms: Optional[float],
+        cost: Optional[float],
+    ) -> ExecutionResult:
+        """Builds a REJECTED or FAILED result.
+
+        Results are built with regular (validated) construction: pydantic's
+        Rust validator is faster than `model_construct`, which resolves the
+        signature of every unset `default_factory` (e.g. `timestamp`) in
+        Python on each call.
+
+        Args:
+            status: ExecutionStatus.REJECTED or ExecutionStatus.FAILED.
+            intent: The intent that was rejected or failed.
+            message: A human-readable explanation, also used as the detail.
+            code: A machine-readable error code.
+            snapshot_id: The ID of the state snapshot at the time.
+            user_id: The ID of the user.
+            execution_time_ms: Execution duration.
+            cost: Cost of attempt.
+
+        Returns:
+            The execution result.
+        """
+        return ExecutionResult(
+            request_id=intent.request_id,
+            user_id=user_id,
+            action_id=intent.action_id or "unknown",
+            status=status,
+            message=message,
+            state_snapshot_id=snapshot_id,
+            intent=intent.model_dump(mode="json"),
+            error=ExecutionError(code=code, detail=message),
+            execution_time_ms=execution_time_ms,
+            cost=cost,
+        )
+
     def _create_rejection(
         self,
         project_id: str,
@@ -1224,22 +1476,20 @@ class ExecutionEngine:
         Returns:
             An ExecutionResult object with REJECTED status.
         """
-        result = ExecutionResult(
-            request_id=intent.request_id,
-            user_id=user_id,
-            action_id=intent.action_id or "unknown",
-            status=ExecutionStatus.REJECTED,
-            message=message,
-            state_snapshot_id=snapshot_id,
-            intent=intent.model_dump(mode="json"),
-            error=ExecutionError(code=code, detail=message),
-            execution_time_ms=execution_time_ms,
-            cost=cost,
+        result = self._build_error_result(
+            ExecutionStatus.REJECTED,
+            intent,
+            message,
+            code,
+            snapshot_id,
+            user_id,
+            execution_time_ms,
+            cost,
         )
 
         # Metrics
         ENGINE_EXECUTION_TOTAL.labels(
-            status="rejected",
+            status=_REJECTED,
             action_id=intent.action_id or "unknown",
             project_id=project_id,
         ).inc()
@@ -1293,22 +1543,20 @@ class ExecutionEngine:
         Returns:
             An ExecutionResult object with FAILED status.
         """
-        result = ExecutionResult(
-            request_id=intent.request_id,
-            user_id=user_id,
-            action_id=intent.action_id or "unknown",
-            status=ExecutionStatus.FAILED,
-            message=message,
-            state_snapshot_id=snapshot_id,
-            intent=intent.model_dump(mode="json"),
-            error=ExecutionError(code=code, detail=message),
-            execution_time_ms=execution_time_ms,
-            cost=cost,
+        result = self._build_error_result(
+            ExecutionStatus.FAILED,
+            intent,
+            message,
+            code,
+            snapshot_id,
+            user_id,
+            execution_time_ms,
+            cost,
         )
 
         # Metrics
         ENGINE_EXECUTION_TOTAL.labels(
-            status="failed",
+            status=_FAILED,
             action_id=intent.action_id or "unknown",
             project_id=project_id,
         ).inc()
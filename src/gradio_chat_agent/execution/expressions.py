@@ -0,0 +1,187 @@
+"""Compilation and evaluation of restricted policy expressions.
+
+Preconditions, invariants, role mappings and policy rules are written as
+small Python expressions. They are parsed once, checked against an
+allow-list of AST node types, and compiled into reusable code objects.
+"""
+
+import ast
+import functools
+import types
+from collections.abc import Iterable
+from typing import Any, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+# Shared globals for evaluation. Only Load-context nodes are allowed, so
+# expressions cannot write to it and one instance can serve every call.
+_EVAL_GLOBALS: dict[str, Any] = {"__builtins__": {}}
+
+# AST node types permitted in policy/precondition expressions.
+_SAFE_EXPR_NODES = frozenset(
+    {
+        ast.Expression,
+        ast.Constant,
+        ast.Name,
+        ast.Load,
+        ast.Attribute,
+        ast.Subscript,
+        ast.Index,  # For older Python versions
+        ast.Slice,
+        ast.BinOp,
+        ast.UnaryOp,
+        ast.Compare,
+        ast.BoolOp,
+        ast.And,
+        ast.Or,
+        ast.Not,
+        ast.Add,
+        ast.Sub,
+        ast.Mult,
+        ast.Div,
+        ast.Mod,
+        ast.Pow,
+        ast.Eq,
+        ast.NotEq,
+        ast.Lt,
+        ast.LtE,
+        ast.Gt,
+        ast.GtE,
+        ast.Is,
+        ast.IsNot,
+        ast.In,
+        ast.NotIn,
+        ast.USub,
+        ast.UAdd,
+        # Method calls such as state.get(...). Builtins like len() are not
+        # callable: expressions run with empty __builtins__.
+        ast.Call,
+    }
+)
+
+
+# String methods that resolve attribute paths from a format string,
+# which would bypass the attribute-name check below.
+_FORBIDDEN_ATTRS = frozenset({"format", "format_map"})
+
+
+class _SafeExprValidator(ast.NodeVisitor):
+    """Depth-first AST check that stops at the first forbidden node."""
+
+    def generic_visit(self, node: ast.AST):
+        if type(node) not in _SAFE_EXPR_NODES:
+            raise ValueError(
+                f"Forbidden expression node: {type(node).__name__}"
+            )
+        super().generic_visit(node)
+
+    def visit_Attribute(self, node: ast.Attribute):
+        # Dunder attributes (__class__, __globals__, ...) are the usual way
+        # out of a restricted eval.
+        if node.attr.startswith("__") or node.attr in _FORBIDDEN_ATTRS:
+            raise ValueError(f"Forbidden attribute access: {node.attr}")
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name):
+        if node.id.startswith("__"):
+            raise ValueError(f"Forbidden name: {node.id}")
+        self.generic_visit(node)
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_safe_expr(expr: str) -> types.CodeType:
+    """Parses, validates and compiles a restricted expression.
+
+    Expressions come from a small, bounded set of registry and policy
+    strings, so the compiled code object is cached per expression.
+
+    Args:
+        expr: The expression string.
+
+    Returns:
+        The compiled code object.
+
+    Raises:
+        ValueError: If the expression contains forbidden nodes.
+    """
+    tree = ast.parse(expr, mode="eval")
+    _SafeExprValidator().visit(tree)
+    return compile(tree, filename="<safe_eval>", mode="eval")
+
+
+@functools.lru_cache(maxsize=1024)
+def state_references(expr: str) -> Optional[frozenset[str]]:
+    """Finds the component IDs an expression reads from `state`.
+
+    Only constant subscripts such as `state['demo.counter']` are
+    understood. Any other use of `state` makes the dependencies unknown.
+
+    Args:
+        expr: The expression string.
+
+    Returns:
+        The referenced component IDs, or None if they cannot be determined
+        (including when the expression does not parse).
+    """
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError:
+        return None
+
+    refs = set()
+    keyed_uses = 0
+    total_uses = 0
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id == "state":
+            total_uses += 1
+        elif (
+            isinstance(node, ast.Subscript)
+            and isinstance(node.value, ast.Name)
+            and node.value.id == "state"
+            and isinstance(node.slice, ast.Constant)
+            and isinstance(node.slice.value, str)
+        ):
+            keyed_uses += 1
+            refs.add(node.slice.value)
+    if keyed_uses != total_uses:
+        return None
+    return frozenset(refs)
+
+
+def eval_compiled(code: types.CodeType, context: dict) -> Any:
+    """Evaluates a pre-validated code object in a restricted environment.
+
+    Args:
+        code: A code object returned by `compile_safe_expr`.
+        context: The variables available to the expression.
+
+    Returns:
+        The result of the evaluation.
+    """
+    return eval(code, _EVAL_GLOBALS, context)
+
+
+def compile_checks(
+    checks: Iterable[T],
+) -> list[tuple[Optional[types.CodeType], T]]:
+    """Pairs each check declaration with its compiled expression.
+
+    Checks whose expression fails to compile are paired with None so the
+    error surfaces, attributed to that check, when it is evaluated.
+
+    Args:
+        checks: Declarations with an `expr` attribute (preconditions or
+            invariants).
+
+    Returns:
+        A list of (code, check) tuples in declaration order.
+    """
+    compiled = []
+    for check in checks:
+        try:
+            code = compile_safe_expr(check.expr)
+        except (SyntaxError, ValueError):
+            code = None
+        compiled.append((code, check))
+    return compiled
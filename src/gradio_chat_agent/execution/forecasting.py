@@ -35,22 +35,14 @@ class ForecastingService:
         if daily_limit is None:
             return {"status": "no_limit", "message": "No daily budget limit set for this project."}
 
-        # Fetch usage for the last 24 hours
+        # Usage since midnight, aggregated by the repository. No spend today
+        # means no burn rate, so there is no need to scan execution history.
         current_usage = self.engine.repository.get_daily_budget_usage(project_id)
         
-        # Calculate burn rate (units per hour)
-        # We look at the last few hours to estimate current pace
-        history = self.engine.repository.get_execution_history(project_id, limit=100)
-        
         now = datetime.now(timezone.utc)
         start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
         
-        successful_today = [
-            e for e in history 
-            if e.status == "success" and e.timestamp.replace(tzinfo=timezone.utc if e.timestamp.tzinfo is None else e.timestamp.tzinfo) >= start_of_day
-        ]
-        
-        if not successful_today:
+        if current_usage <= 0:
             return {
                 "status": "ok",
                 "current_usage": current_usage,
@@ -1,7 +1,7 @@
 """Background observer for successful state mutations."""
 
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
 
 from gradio_chat_agent.execution.engine import ExecutionEngine
@@ -10,12 +10,19 @@ from gradio_chat_agent.observability.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Factor the poll interval grows by after each poll that finds nothing.
+_BACKOFF_FACTOR = 1.5
+
 
 class AuditLogObserver:
     """Observer that polls the audit log for successful mutations.
 
     This allows triggering long-running or unreliable external tasks
     asynchronously without blocking the main execution flow.
+
+    Commits made by this process's engine wake the observer immediately
+    through a post-execution hook; polling picks up entries written by
+    other processes (e.g. background workers).
     """
 
     def __init__(
@@ -23,25 +30,56 @@ class AuditLogObserver:
         engine: ExecutionEngine,
         poll_interval: float = 5.0,
         batch_size: int = 50,
+        max_poll_interval: Optional[float] = None,
+        max_workers: int = 1,
+        callback_workers: int = 0,
+        max_pending_callbacks: int = 1000,
     ):
         """Initializes the audit log observer.
 
         Args:
             engine: The authoritative execution engine.
             poll_interval: How often to poll for new log entries (seconds).
+                With `max_poll_interval` set, this is the interval used
+                while entries keep arriving.
             batch_size: Number of entries to process in one poll.
+            max_poll_interval: If set, the interval grows after each poll
+                that finds nothing, up to this many seconds, and resets to
+                `poll_interval` as soon as an entry is processed. If None,
+                the interval stays fixed.
+            max_workers: Number of projects whose new entries are fetched
+                concurrently. Keep it within the database connection pool
+                size.
+            callback_workers: If positive, entries are handed to a pool of
+                this many threads and callbacks run there, so slow callbacks
+                do not delay polling. Callbacks must then be thread-safe and
+                must not rely on entries arriving in order. If zero,
+                callbacks run one at a time on the observer thread.
+            max_pending_callbacks: Maximum number of entries waiting in the
+                callback pool. When it is full, the rest of a project's
+                batch is left for a later poll instead of blocking.
         """
         self.engine = engine
         self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self.callback_workers = callback_workers
+        self._callback_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_callbacks = threading.BoundedSemaphore(
+            max_pending_callbacks
+        )
         self.batch_size = batch_size
         self._stop_event = threading.Event()
+        # Set to cut the current wait short (new commit or stop request).
+        self._wake_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._callbacks: list[Callable[[str, ExecutionResult], None]] = []
-        
-        # Track the last processed sequence/ID per project or globally
-        # For simplicity in this implementation, we'll use a timestamp-based approach
-        # or track the last seen request_id globally if we assume unique IDs.
-        self._last_processed_timestamp = None
+
+        # High watermark per project: the sequence number of the last
+        # processed execution. Sequences are assigned by the repository, so
+        # ordering does not depend on clocks.
+        self._last_processed_seq: dict[str, int] = {}
 
     def add_callback(self, callback: Callable[[str, ExecutionResult], None]):
         """Registers a callback to be executed when a new success is detected.
@@ -56,11 +94,17 @@ class AuditLogObserver:
         if self._thread is not None:
             return
 
-        # Initialize timestamp to now to avoid processing historic logs on start
-        from datetime import datetime, timezone
-        self._last_processed_timestamp = datetime.now(timezone.utc)
+        # Start from the current end of each log to avoid processing
+        # historic entries. Projects created later start from the beginning.
+        repository = self.engine.repository
+        self._last_processed_seq = {
+            project["id"]: repository.get_latest_execution_seq(project["id"])
+            for project in repository.list_projects()
+        }
 
         self._stop_event.clear()
+        self._wake_event.clear()
+        self.engine.add_post_execution_hook(self._notify)
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
         logger.info("Audit log observer started.")
@@ -68,58 +112,142 @@ class AuditLogObserver:
     def stop(self):
         """Stops the background observation thread."""
         self._stop_event.set()
+        self._wake_event.set()
+        if self._notify in self.engine.post_execution_hooks:
+            self.engine.post_execution_hooks.remove(self._notify)
         if self._thread:
             self._thread.join()
             self._thread = None
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._callback_pool is not None:
+            self._callback_pool.shutdown(wait=True)
+            self._callback_pool = None
         logger.info("Audit log observer stopped.")
 
     def _run(self):
         """Main polling loop."""
+        interval = self.poll_interval
         while not self._stop_event.is_set():
+            processed = 0
             try:
-                self._poll_and_process()
+                processed = self._poll_and_process()
             except Exception as e:
                 logger.exception(f"Error in audit log observer poll: {str(e)}")
-            
-            self._stop_event.wait(self.poll_interval)
-
-    def _poll_and_process(self):
-        """Polls all projects for new successful executions."""
-        projects = self.engine.repository.list_projects()
-        
-        for project in projects:
-            project_id = project["id"]
-            # Fetch recent history
-            history = self.engine.repository.get_execution_history(
-                project_id, limit=self.batch_size
+
+            interval = self._next_interval(interval, processed)
+            self._wake_event.wait(interval)
+            # Cleared before the next poll, so a commit that lands during
+            # the poll sets it again and is picked up on the next pass.
+            self._wake_event.clear()
+
+    def _notify(self, project_id: str, result: ExecutionResult):
+        """Post-execution hook that wakes the polling loop.
+
+        Args:
+            project_id: The project of the committed execution.
+            result: The successful execution result.
+        """
+        self._wake_event.set()
+
+    def _next_interval(self, interval: float, processed: int) -> float:
+        """Computes the wait before the next poll.
+
+        Args:
+            interval: The wait used before the poll that just ran.
+            processed: The number of entries that poll processed.
+
+        Returns:
+            The wait in seconds.
+        """
+        if processed or self.max_poll_interval is None:
+            return self.poll_interval
+        return min(interval * _BACKOFF_FACTOR, self.max_poll_interval)
+
+    def _fetch_new_entries(
+        self, project_id: str
+    ) -> list[tuple[int, ExecutionResult]]:
+        """Fetches a project's successful entries after its watermark.
+
+        Args:
+            project_id: The ID of the project.
+
+        Returns:
+            (sequence, result) tuples, oldest first.
+        """
+        return self.engine.repository.get_successful_executions_since(
+            project_id,
+            self._last_processed_seq.get(project_id, 0),
+            limit=self.batch_size,
+        )
+
+    def _dispatch(self, project_id: str, entry: ExecutionResult):
+        """Runs every registered callback for one entry.
+
+        Args:
+            project_id: The ID of the project.
+            entry: The successful execution result.
+        """
+        for cb in self._callbacks:
+            try:
+                cb(project_id, entry)
+            except Exception as e:
+                logger.error(f"Error in async observer callback: {str(e)}")
+
+    def _submit(self, project_id: str, entry: ExecutionResult) -> bool:
+        """Hands one entry to the callback pool without blocking.
+
+        Args:
+            project_id: The ID of the project.
+            entry: The successful execution result.
+
+        Returns:
+            False if the pool already holds `max_pending_callbacks` entries.
+        """
+        if not self._pending_callbacks.acquire(blocking=False):
+            return False
+        if self._callback_pool is None:
+            self._callback_pool = ThreadPoolExecutor(
+                max_workers=self.callback_workers
             )
-            
-            # Reverse to process in chronological order
-            new_entries = []
-            for entry in reversed(history):
-                # Filter for successes newer than our last check
-                if entry.status == "success":
-                    # Note: We compare timestamps. Accuracy depends on DB clock.
-                    entry_ts = entry.timestamp
-                    # Ensure timezone awareness for comparison if needed
-                    if entry_ts.tzinfo is None:
-                        from datetime import timezone
-                        entry_ts = entry_ts.replace(tzinfo=timezone.utc)
-
-                    if self._last_processed_timestamp is None or entry_ts > self._last_processed_timestamp:
-                        new_entries.append(entry)
-
-            # Process new entries
-            for entry in new_entries:
-                for cb in self._callbacks:
-                    try:
-                        cb(project_id, entry)
-                    except Exception as e:
-                        logger.error(f"Error in async observer callback: {str(e)}")
-                
-                # Update high watermark
-                entry_ts = entry.timestamp
-                if entry_ts.tzinfo is None:
-                    from datetime import timezone
-                    entry_ts = entry_ts.replace(tzinfo=timezone.utc)
-                self._last_processed_timestamp = entry_ts
+        future = self._callback_pool.submit(self._dispatch, project_id, entry)
+        future.add_done_callback(lambda _: self._pending_callbacks.release())
+        return True
+
+    def _poll_and_process(self) -> int:
+        """Polls all projects for new successful executions.
+
+        Returns:
+            The number of entries processed.
+        """
+        project_ids = [p["id"] for p in self.engine.repository.list_projects()]
+
+        # Fetching is I/O bound, so projects are queried concurrently when
+        # workers are configured. Watermark updates stay on this thread, in
+        # project order.
+        if self.max_workers > 1 and len(project_ids) > 1:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            batches = list(self._pool.map(self._fetch_new_entries, project_ids))
+        else:
+            batches = [self._fetch_new_entries(pid) for pid in project_ids]
+
+        processed = 0
+        for project_id, entries in zip(project_ids, batches):
+            for seq, entry in entries:
+                if self.callback_workers <= 0:
+                    self._dispatch(project_id, entry)
+                elif not self._submit(project_id, entry):
+                    # The watermark stays put, so the rest of the batch is
+                    # fetched again once the pool drains.
+                    logger.warning(
+                        f"Observer callback queue full; deferring entries "
+                        f"for project {project_id}."
+                    )
+                    break
+
+                self._last_processed_seq[project_id] = seq
+                processed += 1
+
+        return processed
@@ -35,6 +35,8 @@ class SchedulerWorker:
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._active_schedules: set[str] = set()
+        # schedule_id -> (cron string, trigger parsed from it)
+        self._trigger_cache: dict[str, tuple[str, CronTrigger]] = {}
 
     def start(self):
         """Starts the scheduler and the polling thread."""
@@ -77,23 +79,31 @@ class SchedulerWorker:
             if job_id not in enabled_ids:
                 self.scheduler.remove_job(job_id)
                 self._active_schedules.remove(job_id)
+                self._trigger_cache.pop(job_id, None)
                 logger.info(f"Removed schedule job: {job_id}")
 
-        # Add or update jobs
+        # Add new jobs and replace those whose cron expression changed
         for s in enabled_schedules:
             job_id = s["id"]
-            if job_id not in self._active_schedules:
-                self.scheduler.add_job(
-                    self._execute_scheduled_action,
-                    CronTrigger.from_crontab(s["cron"]),
-                    id=job_id,
-                    args=[s],
-                    replace_existing=True,
-                )
-                self._active_schedules.add(job_id)
-                logger.info(
-                    f"Added schedule job: {job_id} (Cron: {s['cron']})"
-                )
+            cached = self._trigger_cache.get(job_id)
+            if cached is not None and cached[0] == s["cron"]:
+                if job_id in self._active_schedules:
+                    continue
+                trigger = cached[1]
+            else:
+                trigger = CronTrigger.from_crontab(s["cron"])
+                self._trigger_cache[job_id] = (s["cron"], trigger)
+
+            verb = "Updated" if job_id in self._active_schedules else "Added"
+            self.scheduler.add_job(
+                self._execute_scheduled_action,
+                trigger,
+                id=job_id,
+                args=[s],
+                replace_existing=True,
+            )
+            self._active_schedules.add(job_id)
+            logger.info(f"{verb} schedule job: {job_id} (Cron: {s['cron']})")
 
     def _execute_scheduled_action(self, schedule_config: dict[str, Any]):
         """Callback executed by APScheduler."""
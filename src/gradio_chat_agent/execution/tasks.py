@@ -1,6 +1,7 @@
 """Huey-based tasks for background execution."""
 
 import os
+import threading
 from huey import SqliteHuey
 from gradio_chat_agent.execution.engine import ExecutionEngine
 from gradio_chat_agent.persistence.sql_repository import SQLStateRepository
@@ -15,23 +16,44 @@ huey = SqliteHuey(filename=db_path)
 
 # Global instances for the worker process
 _engine = None
+_engine_lock = threading.Lock()
 
 def get_engine():
+    """Returns the worker's engine, building it on first use.
+
+    Consumer worker threads share one engine; the lock ensures only the
+    first caller builds it.
+    """
     global _engine
-    if _engine is None:
-        # Re-initialize engine components for the worker process
-        # In a real app, this would use a proper DI or config loader
-        db_url = os.environ.get("DATABASE_URL", "sqlite:///gradio_chat_agent.sqlite3")
-        repo = SQLStateRepository(db_url, auto_create_tables=False)
-        
-        # We need to re-register all actions/components if using InMemoryRegistry
-        # or use a persistent registry if available.
-        # For this implementation, we'll re-register basic ones or assume a common setup function.
-        from gradio_chat_agent.app import create_registry
-        registry = create_registry()
-        _engine = ExecutionEngine(registry, repo)
+    if _engine is not None:
+        return _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = _build_engine()
     return _engine
 
+def _build_engine():
+    # Re-initialize engine components for the worker process
+    # In a real app, this would use a proper DI or config loader
+    db_url = os.environ.get("DATABASE_URL", "sqlite:///gradio_chat_agent.sqlite3")
+    repo = SQLStateRepository(db_url, auto_create_tables=False)
+
+    # We need to re-register all actions/components if using InMemoryRegistry
+    # or use a persistent registry if available.
+    # For this implementation, we'll re-register basic ones or assume a common setup function.
+    from gradio_chat_agent.app import create_registry
+    registry = create_registry()
+    return ExecutionEngine(registry, repo)
+
+@huey.on_startup()
+def warm_engine():
+    """Builds the engine when a consumer worker starts.
+
+    This runs before the worker dequeues its first task, so a burst after
+    a restart does not wait on registry bootstrap.
+    """
+    get_engine()
+
 @huey.task()
 def execute_background_action(project_id: str, action_id: str, inputs: dict, user_id: str, trigger_type: str):
     """Executes an action in the background."""
@@ -1,11 +1,73 @@
 """Operational alerting system for the Gradio Chat Agent."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, Callable
+
+import httpx
+import orjson
+
 from gradio_chat_agent.models.enums import ExecutionStatus
 from gradio_chat_agent.observability.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Shared keep-alive connection pool for outgoing alert webhooks.
+_WEBHOOK_CLIENT = httpx.Client(
+    timeout=httpx.Timeout(3.0),
+    limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class WebhookAlertHandler:
+    """Alert handler that POSTs alerts to one or more webhook URLs.
+
+    Requests reuse pooled keep-alive connections and run on the handler's
+    own thread pool. Calling the handler only queues the requests, so the
+    post-execution hook that raises an alert (and the project lock held
+    around it) never waits on a webhook.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        max_workers: int = 8,
+        client: Optional[httpx.Client] = None,
+    ):
+        """Initializes the webhook handler.
+
+        Args:
+            urls: The webhook URLs to notify.
+            max_workers: Maximum number of concurrent requests.
+            client: Optional HTTP client. Defaults to the shared pool.
+        """
+        self.urls = urls
+        self.max_workers = max_workers
+        self.client = client or _WEBHOOK_CLIENT
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="alert-webhook"
+        )
+
+    def _post(self, url: str, body: bytes):
+        try:
+            response = self.client.post(
+                url, content=body, headers=_JSON_HEADERS
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error(f"Error sending alert to webhook {url}: {str(e)}")
+
+    def close(self):
+        """Waits for queued alerts to be sent and stops the worker threads."""
+        self._executor.shutdown(wait=True)
+
+    def __call__(self, alert: dict[str, Any]):
+        # Serialize once; every URL receives the same body.
+        body = orjson.dumps(alert)
+        for url in self.urls:
+            self._executor.submit(self._post, url, body)
+
 
 class AlertingService:
     """Monitors system performance and triggers alerts for anomalies."""
@@ -37,9 +99,10 @@ class AlertingService:
             result: The execution result.
         """
         # 1. Failure Rate check (Last 5 minutes)
-        total_5m = self.engine.repository.count_recent_executions(project_id, minutes=5)
+        counts_5m = self.engine.repository.count_recent_executions_by_status(project_id, minutes=5)
+        total_5m = sum(counts_5m.values())
         if total_5m >= 10: # Minimum sample size
-            failed_5m = self.engine.repository.count_recent_executions(project_id, minutes=5, status=ExecutionStatus.FAILED)
+            failed_5m = counts_5m.get(ExecutionStatus.FAILED.value, 0)
             failure_rate = failed_5m / total_5m
             if failure_rate > 0.05:
                 self._trigger_alert({
@@ -347,6 +347,42 @@ class InMemoryStateRepository(StateRepository):
         history = self._executions.get(project_id, [])
         return sorted(history, key=lambda x: x.timestamp, reverse=True)[:limit]
 
+    def get_latest_execution_seq(self, project_id: str) -> int:
+        """Returns the sequence number of a project's latest execution.
+
+        Executions are appended in order, so a result's sequence number is
+        its 1-based position in the project's log.
+
+        Args:
+            project_id: The ID of the project.
+
+        Returns:
+            The latest sequence number, or 0 if there are no executions.
+        """
+        return len(self._executions.get(project_id, []))
+
+    def get_successful_executions_since(
+        self, project_id: str, after_seq: int, limit: int = 100
+    ) -> list[tuple[int, ExecutionResult]]:
+        """Retrieves successful executions recorded after a sequence number.
+
+        Args:
+            project_id: The ID of the project.
+            after_seq: Only executions with a greater sequence are returned.
+            limit: Maximum number of records to return. Defaults to 100.
+
+        Returns:
+            (sequence, result) tuples in ascending sequence order.
+        """
+        history = self._executions.get(project_id, [])
+        entries = []
+        for seq, result in enumerate(history[after_seq:], start=after_seq + 1):
+            if result.status == ExecutionStatus.SUCCESS:
+                entries.append((seq, result))
+                if len(entries) >= limit:
+                    break
+        return entries
+
     def _get_fact_key(self, project_id: str, user_id: str) -> str:
         """Generates a storage key for session facts.
 
@@ -451,6 +487,32 @@ class InMemoryStateRepository(StateRepository):
                     count += 1
         return count
 
+    def count_recent_executions_by_status(
+        self, project_id: str, minutes: int
+    ) -> dict[str, int]:
+        """Counts executions in the last N minutes, grouped by status.
+
+        Args:
+            project_id: The ID of the project to count executions for.
+            minutes: The lookback time window in minutes.
+
+        Returns:
+            A mapping of status value to execution count.
+        """
+        history = self._executions.get(project_id, [])
+        cutoff = datetime.now(timezone.utc) - timedelta(minutes=minutes)
+
+        counts: dict[str, int] = {}
+        for ex in history:
+            ex_ts = ex.timestamp
+            if ex_ts.tzinfo is None:
+                ex_ts = ex_ts.replace(tzinfo=timezone.utc)
+
+            if ex_ts >= cutoff:
+                status = ExecutionStatus(ex.status).value
+                counts[status] = counts.get(status, 0) + 1
+        return counts
+
     def get_daily_budget_usage(self, project_id: str) -> float:
         """Calculates the total cost of successful executions today.
 
@@ -12,6 +12,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
@@ -302,6 +303,12 @@ class Execution(Base):
 
     project: Mapped["Project"] = relationship(back_populates="executions")
 
+    # Rate limits, daily budgets and history all filter a project's
+    # executions by time.
+    __table_args__ = (
+        Index("ix_executions_project_timestamp", "project_id", "timestamp"),
+    )
+
 
 class SessionFact(Base):
     """Represents a session-specific fact stored for an agent.
@@ -4,6 +4,8 @@ This module defines the abstract contract for state persistence.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional
 
@@ -14,6 +16,28 @@ from gradio_chat_agent.models.execution_result import (
 from gradio_chat_agent.models.state_snapshot import StateSnapshot
 
 
+@dataclass(frozen=True)
+class UsageSnapshot:
+    """Governance inputs for a single execution, fetched in one call.
+
+    Counters are only computed when the project policy defines the
+    matching limit; otherwise they are reported as zero.
+
+    Attributes:
+        limits: The project policy, as returned by `get_project_limits`.
+        per_minute: Executions in the last minute.
+        per_hour: Executions in the last hour.
+        daily_budget_used: Cost of successful executions since midnight.
+        archived: Whether the project is archived.
+    """
+
+    limits: dict[str, Any]
+    per_minute: int = 0
+    per_hour: int = 0
+    daily_budget_used: float = 0.0
+    archived: bool = False
+
+
 class StateRepository(ABC):
     """Abstract interface for persisting application state and history."""
 
@@ -104,6 +128,37 @@ class StateRepository(ABC):
         """
         pass  # pragma: no cover
 
+    @abstractmethod
+    def get_latest_execution_seq(self, project_id: str) -> int:
+        """Returns the sequence number of a project's latest execution.
+
+        Sequence numbers increase with every recorded execution, so they
+        order the audit log independently of wall-clock timestamps.
+
+        Args:
+            project_id: The ID of the project.
+
+        Returns:
+            The latest sequence number, or 0 if there are no executions.
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def get_successful_executions_since(
+        self, project_id: str, after_seq: int, limit: int = 100
+    ) -> list[tuple[int, ExecutionResult]]:
+        """Retrieves successful executions recorded after a sequence number.
+
+        Args:
+            project_id: The ID of the project.
+            after_seq: Only executions with a greater sequence are returned.
+            limit: Maximum number of records to return. Defaults to 100.
+
+        Returns:
+            (sequence, result) tuples in ascending sequence order.
+        """
+        pass  # pragma: no cover
+
     @abstractmethod
     def get_session_facts(
         self, project_id: str, user_id: str
@@ -186,6 +241,30 @@ class StateRepository(ABC):
 
         pass  # pragma: no cover
 
+    def count_recent_executions_by_status(
+        self, project_id: str, minutes: int
+    ) -> dict[str, int]:
+        """Counts executions in the last N minutes, grouped by status.
+
+        Lets callers that need several per-status counts (e.g. a failure
+        rate) fetch them in one round trip. The default implementation
+        falls back to one `count_recent_executions` call per status.
+
+        Args:
+            project_id: The ID of the project to count executions for.
+            minutes: The lookback time window in minutes.
+
+        Returns:
+            A mapping of status value to execution count. Statuses with no
+            executions may be omitted.
+        """
+        counts = {}
+        for status in ExecutionStatus:
+            count = self.count_recent_executions(project_id, minutes, status)
+            if count:
+                counts[status.value] = count
+        return counts
+
     @abstractmethod
     def get_daily_budget_usage(self, project_id: str) -> float:
         """Calculates the total cost of successful executions today.
@@ -198,6 +277,56 @@ class StateRepository(ABC):
         """
         pass  # pragma: no cover
 
+    def get_usage_snapshot(
+        self,
+        project_id: str,
+        limits: Optional[dict[str, Any]] = None,
+        archived: Optional[bool] = None,
+        counters: bool = True,
+    ) -> UsageSnapshot:
+        """Fetches the limits, counters and lifecycle state for a project.
+
+        The default implementation composes the individual repository
+        methods; backends should override it to use a single round trip.
+
+        Args:
+            project_id: The ID of the project.
+            limits: The project policy, if already known (e.g. cached).
+            archived: The archived flag, if already known.
+            counters: If False, only the policy and archived flag are read
+                and all counters are left at zero.
+
+        Returns:
+            The project's usage snapshot.
+        """
+        if limits is None:
+            limits = self.get_project_limits(project_id)
+        if archived is None:
+            archived = self.is_project_archived(project_id)
+        if not counters:
+            return UsageSnapshot(limits=limits, archived=archived)
+        policy = limits.get("limits", {})
+        rate = policy.get("rate", {})
+        return UsageSnapshot(
+            limits=limits,
+            per_minute=(
+                self.count_recent_executions(project_id, minutes=1)
+                if rate.get("per_minute")
+                else 0
+            ),
+            per_hour=(
+                self.count_recent_executions(project_id, minutes=60)
+                if rate.get("per_hour")
+                else 0
+            ),
+            daily_budget_used=(
+                self.get_daily_budget_usage(project_id)
+                if policy.get("budget", {}).get("daily") is not None
+                else 0.0
+            ),
+            archived=archived,
+        )
+
     @abstractmethod
     def get_webhook(self, webhook_id: str) -> Optional[dict[str, Any]]:
         """Retrieves a webhook configuration by ID.
@@ -353,6 +482,16 @@ class StateRepository(ABC):
         """
         pass  # pragma: no cover
 
+    def iter_projects(self) -> Iterator[dict[str, Any]]:
+        """Iterates over all projects without materializing the full list.
+
+        The default implementation delegates to `list_projects`.
+
+        Yields:
+            Project dictionaries, as returned by `list_projects`.
+        """
+        yield from self.list_projects()
+
     @abstractmethod
     def create_user(
         self,
@@ -373,6 +512,19 @@ class StateRepository(ABC):
         """
         pass  # pragma: no cover
 
+    def create_users(self, users: list[dict[str, Any]]):
+        """Creates several users at once.
+
+        Implementations may override this to insert all rows in a single
+        transaction. The default implementation calls `create_user` for
+        each entry.
+
+        Args:
+            users: Dictionaries of `create_user` keyword arguments.
+        """
+        for user in users:
+            self.create_user(**user)
+
     @abstractmethod
     def list_users(self) -> list[dict[str, Any]]:
         """Lists all users in the system.
@@ -400,6 +552,19 @@ class StateRepository(ABC):
         """
         pass  # pragma: no cover
 
+    def create_api_tokens(self, tokens: list[dict[str, Any]]):
+        """Creates several API tokens at once.
+
+        Implementations may override this to insert all rows in a single
+        transaction. The default implementation calls `create_api_token`
+        for each entry.
+
+        Args:
+            tokens: Dictionaries of `create_api_token` keyword arguments.
+        """
+        for token in tokens:
+            self.create_api_token(**token)
+
     @abstractmethod
     def list_api_tokens(self, user_id: str) -> list[dict[str, Any]]:
         """Lists all tokens for a user.
@@ -412,6 +577,19 @@ class StateRepository(ABC):
         """
         pass  # pragma: no cover
 
+    def iter_api_tokens(self, user_id: str) -> Iterator[dict[str, Any]]:
+        """Iterates over a user's tokens without materializing the full list.
+
+        The default implementation delegates to `list_api_tokens`.
+
+        Args:
+            user_id: The ID of the user.
+
+        Yields:
+            Token dictionaries, as returned by `list_api_tokens`.
+        """
+        yield from self.list_api_tokens(user_id)
+
     @abstractmethod
     def revoke_api_token(self, token_id: str):
         """Revokes an API token.
@@ -478,6 +656,21 @@ class StateRepository(ABC):
         """
         pass  # pragma: no cover
 
+    def iter_webhooks(
+        self, project_id: Optional[str] = None
+    ) -> Iterator[dict[str, Any]]:
+        """Iterates over webhooks without materializing the full list.
+
+        The default implementation delegates to `list_webhooks`.
+
+        Args:
+            project_id: Optional project ID to filter by.
+
+        Yields:
+            Webhook dictionaries, as returned by `list_webhooks`.
+        """
+        yield from self.list_webhooks(project_id)
+
     @abstractmethod
     def list_enabled_schedules(self) -> list[dict[str, Any]]:
         """Lists all enabled schedules across all projects.
@@ -1,9 +1,17 @@
 """SQLAlchemy implementation of the StateRepository."""
 
+from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta, timezone
 from typing import Any, Optional
 
-from sqlalchemy import create_engine, delete, func, select
+from sqlalchemy import (
+    case,
+    create_engine,
+    delete,
+    func,
+    insert,
+    select,
+)
 from sqlalchemy.orm import sessionmaker
 
 from gradio_chat_agent.models.enums import ExecutionStatus
@@ -26,10 +34,28 @@ from gradio_chat_agent.persistence.models import (
     User,
     Webhook,
 )
-from gradio_chat_agent.persistence.repository import StateRepository
+from gradio_chat_agent.persistence.repository import (
+    StateRepository,
+    UsageSnapshot,
+)
 from gradio_chat_agent.utils import SecretManager
 
 
+def _execution_cost():
+    """SQL expression for an execution's cost.
+
+    Prefers the `cost` column and falls back to `metadata['cost']` for rows
+    written before the column was populated.
+    """
+    return func.coalesce(
+        Execution.cost, Execution.metadata_["cost"].as_float(), 0.0
+    )
+
+
+# Rows fetched per round trip by the streaming iter_* methods.
+STREAM_BATCH_SIZE = 500
+
+
 class SQLStateRepository(StateRepository):
     """Production-ready SQL persistence layer."""
 
@@ -41,7 +67,9 @@ class SQLStateRepository(StateRepository):
             auto_create_tables: If True, calls Base.metadata.create_all.
                 Set to False when using Alembic migrations.
         """
-        self.engine = create_engine(database_url)
+        # pool_pre_ping transparently replaces connections dropped while
+        # the repository sat idle in a long-lived process.
+        self.engine = create_engine(database_url, pool_pre_ping=True)
         if auto_create_tables:
             Base.metadata.create_all(self.engine)
         self.SessionLocal = sessionmaker(bind=self.engine)
@@ -336,30 +364,77 @@ class SQLStateRepository(StateRepository):
                 .limit(limit)
             )
             rows = session.execute(stmt).scalars().all()
+            return [self._row_to_result(row) for row in rows]
 
-            results = []
-            for row in rows:
-                diffs = [StateDiffEntry(**d) for d in row.state_diff]
-                error = ExecutionError(**row.error) if row.error else None
-
-                results.append(
-                    ExecutionResult(
-                        request_id=row.request_id,
-                        user_id=row.user_id,
-                        action_id=row.action_id,
-                        status=ExecutionStatus(row.status),
-                        timestamp=row.timestamp,
-                        execution_time_ms=row.duration_ms,
-                        cost=row.cost,
-                        message=row.message,
-                        state_snapshot_id=row.state_snapshot_id,
-                        state_diff=diffs,
-                        intent=row.intent,
-                        error=error,
-                        metadata=row.metadata_ or {},
-                    )
+    @staticmethod
+    def _row_to_result(row: Execution) -> ExecutionResult:
+        """Converts an executions row into an ExecutionResult.
+
+        Args:
+            row: The executions table row.
+
+        Returns:
+            The execution result.
+        """
+        return ExecutionResult(
+            request_id=row.request_id,
+            user_id=row.user_id,
+            action_id=row.action_id,
+            status=ExecutionStatus(row.status),
+            timestamp=row.timestamp,
+            execution_time_ms=row.duration_ms,
+            cost=row.cost,
+            message=row.message,
+            state_snapshot_id=row.state_snapshot_id,
+            state_diff=[StateDiffEntry(**d) for d in row.state_diff],
+            intent=row.intent,
+            error=ExecutionError(**row.error) if row.error else None,
+            metadata=row.metadata_ or {},
+        )
+
+    def get_latest_execution_seq(self, project_id: str) -> int:
+        """Returns the sequence number of a project's latest execution.
+
+        The autoincrement primary key serves as the sequence number.
+
+        Args:
+            project_id: The ID of the project.
+
+        Returns:
+            The latest sequence number, or 0 if there are no executions.
+        """
+        with self.SessionLocal() as session:
+            stmt = select(func.max(Execution.id)).where(
+                Execution.project_id == project_id
+            )
+            return session.execute(stmt).scalar() or 0
+
+    def get_successful_executions_since(
+        self, project_id: str, after_seq: int, limit: int = 100
+    ) -> list[tuple[int, ExecutionResult]]:
+        """Retrieves successful executions recorded after a sequence number.
+
+        Args:
+            project_id: The ID of the project.
+            after_seq: Only executions with a greater sequence are returned.
+            limit: Maximum number of records to return. Defaults to 100.
+
+        Returns:
+            (sequence, result) tuples in ascending sequence order.
+        """
+        with self.SessionLocal() as session:
+            stmt = (
+                select(Execution)
+                .where(
+                    Execution.project_id == project_id,
+                    Execution.id > after_seq,
+                    Execution.status == ExecutionStatus.SUCCESS.value,
                 )
-            return results
+                .order_by(Execution.id)
+                .limit(limit)
+            )
+            rows = session.execute(stmt).scalars().all()
+            return [(row.id, self._row_to_result(row)) for row in rows]
 
     def get_session_facts(
         self, project_id: str, user_id: str
@@ -510,6 +585,31 @@ class SQLStateRepository(StateRepository):
 
             return session.execute(stmt).scalar() or 0
 
+    def count_recent_executions_by_status(
+        self, project_id: str, minutes: int
+    ) -> dict[str, int]:
+        """Counts executions in the last N minutes, grouped by status.
+
+        Args:
+            project_id: The ID of the project to count executions for.
+            minutes: The lookback time window in minutes.
+
+        Returns:
+            A mapping of status value to execution count.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(minutes=minutes)
+        cutoff_naive = cutoff.replace(tzinfo=None)
+        with self.SessionLocal() as session:
+            stmt = (
+                select(Execution.status, func.count())
+                .where(
+                    Execution.project_id == project_id,
+                    Execution.timestamp >= cutoff_naive,
+                )
+                .group_by(Execution.status)
+            )
+            return dict(session.execute(stmt).tuples().all())
+
     def get_daily_budget_usage(self, project_id: str) -> float:
         """Calculates the total cost of successful executions today.
 
@@ -525,18 +625,91 @@ class SQLStateRepository(StateRepository):
         cutoff = midnight.replace(tzinfo=None)
 
         with self.SessionLocal() as session:
-            stmt = select(Execution).where(
+            stmt = select(func.sum(_execution_cost())).where(
                 Execution.project_id == project_id,
                 Execution.timestamp >= cutoff,
                 Execution.status == "success",
             )
-            rows = session.execute(stmt).scalars().all()
+            return float(session.execute(stmt).scalar() or 0.0)
+
+    def get_usage_snapshot(
+        self,
+        project_id: str,
+        limits: Optional[dict[str, Any]] = None,
+        archived: Optional[bool] = None,
+        counters: bool = True,
+    ) -> UsageSnapshot:
+        """Fetches limits, counters and lifecycle state in one session.
 
-            total = 0.0
-            for row in rows:
-                if row.metadata_:
-                    total += float(row.metadata_.get("cost", 0.0))
-            return total
+        The rate and budget counters are computed by a single aggregate
+        query with conditional sums, and only when the policy needs them.
+
+        Args:
+            project_id: The ID of the project.
+            limits: The project policy, if already known (e.g. cached).
+            archived: The archived flag, if already known.
+            counters: If False, only the policy and archived flag are read.
+
+        Returns:
+            The project's usage snapshot.
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        minute_cutoff = now - timedelta(minutes=1)
+        hour_cutoff = now - timedelta(minutes=60)
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        with self.SessionLocal() as session:
+            if archived is None:
+                project = session.get(Project, project_id)
+                archived = bool(project and project.archived_at)
+            if limits is None:
+                project_limits = session.get(ProjectLimits, project_id)
+                limits = (
+                    project_limits.raw_policy
+                    if project_limits and project_limits.raw_policy
+                    else {}
+                )
+
+            policy = limits.get("limits", {})
+            rate = policy.get("rate", {})
+            if not counters or not (
+                rate.get("per_minute")
+                or rate.get("per_hour")
+                or policy.get("budget", {}).get("daily") is not None
+            ):
+                return UsageSnapshot(limits=limits, archived=archived)
+
+            cost = _execution_cost()
+            stmt = select(
+                func.sum(
+                    case((Execution.timestamp >= minute_cutoff, 1), else_=0)
+                ),
+                func.sum(
+                    case((Execution.timestamp >= hour_cutoff, 1), else_=0)
+                ),
+                func.sum(
+                    case(
+                        (
+                            (Execution.timestamp >= midnight)
+                            & (Execution.status == "success"),
+                            cost,
+                        ),
+                        else_=0.0,
+                    )
+                ),
+            ).where(
+                Execution.project_id == project_id,
+                Execution.timestamp >= min(hour_cutoff, midnight),
+            )
+            per_minute, per_hour, budget_used = session.execute(stmt).one()
+
+        return UsageSnapshot(
+            limits=limits,
+            per_minute=per_minute or 0,
+            per_hour=per_hour or 0,
+            daily_budget_used=float(budget_used or 0.0),
+            archived=archived,
+        )
 
     def get_webhook(self, webhook_id: str) -> Optional[dict[str, Any]]:
         """Retrieves a webhook configuration by ID.
@@ -824,46 +997,43 @@ class SQLStateRepository(StateRepository):
             A dictionary containing platform-wide statistics.
         """
         with self.SessionLocal() as session:
-            # Get all projects
-            projects = session.execute(select(Project)).scalars().all()
+            projects = session.execute(select(Project.id, Project.name)).all()
+
+            # One grouped query for every project's counts and cost, instead
+            # of two queries per project.
+            stmt = select(
+                Execution.project_id,
+                Execution.status,
+                func.count(Execution.id),
+                func.sum(Execution.cost),
+            ).group_by(Execution.project_id, Execution.status)
+            counts: dict[str, dict[str, int]] = {}
+            costs: dict[str, float] = {}
+            for project_id, status, count, cost in session.execute(stmt):
+                counts.setdefault(project_id, {})[status] = count
+                if status == "success":
+                    costs[project_id] = float(cost or 0.0)
 
             projects_stats = {}
             total_executions = 0
             total_cost = 0.0
 
-            for project in projects:
-                # Execution counts
-                stmt = (
-                    select(Execution.status, func.count(Execution.id))
-                    .where(Execution.project_id == project.id)
-                    .group_by(Execution.status)
-                )
+            for project_id, project_name in projects:
+                project_counts = counts.get(project_id, {})
+                project_total_execs = sum(project_counts.values())
+                project_cost = costs.get(project_id, 0.0)
 
-                counts = dict(session.execute(stmt).all())
-                success_count = counts.get("success", 0)
-                failed_count = counts.get("failed", 0)
-                rejected_count = counts.get("rejected", 0)
-                project_total_execs = sum(counts.values())
-
-                # Total cost for this project
-                # In SQL we have a 'cost' column in Execution table
-                stmt_cost = select(func.sum(Execution.cost)).where(
-                    Execution.project_id == project.id,
-                    Execution.status == "success",
-                )
-                project_cost = session.execute(stmt_cost).scalar() or 0.0
-
-                projects_stats[project.id] = {
-                    "project_id": project.id,
-                    "project_name": project.name,
+                projects_stats[project_id] = {
+                    "project_id": project_id,
+                    "project_name": project_name,
                     "total_executions": project_total_execs,
-                    "success_count": success_count,
-                    "failed_count": failed_count,
-                    "rejected_count": rejected_count,
-                    "total_cost": float(project_cost),
+                    "success_count": project_counts.get("success", 0),
+                    "failed_count": project_counts.get("failed", 0),
+                    "rejected_count": project_counts.get("rejected", 0),
+                    "total_cost": project_cost,
                 }
                 total_executions += project_total_execs
-                total_cost += float(project_cost)
+                total_cost += project_cost
 
             return {
                 "total_projects": len(projects),
@@ -952,6 +1122,23 @@ class SQLStateRepository(StateRepository):
                 for row in rows
             ]
 
+    def iter_projects(self) -> Iterator[dict[str, Any]]:
+        """Streams all projects in batches.
+
+        Yields:
+            Project dictionaries.
+        """
+        with self.SessionLocal() as session:
+            stmt = select(
+                Project.id, Project.name, Project.archived_at
+            ).execution_options(yield_per=STREAM_BATCH_SIZE)
+            for row in session.execute(stmt):
+                yield {
+                    "id": row.id,
+                    "name": row.name,
+                    "archived": row.archived_at is not None,
+                }
+
     def create_user(
         self,
         user_id: str,
@@ -980,6 +1167,28 @@ class SQLStateRepository(StateRepository):
             session.add(user)
             session.commit()
 
+    def create_users(self, users: list[dict[str, Any]]):
+        """Creates several users in a single transaction.
+
+        Args:
+            users: Dictionaries of `create_user` keyword arguments.
+        """
+        if not users:
+            return
+        rows = [
+            {
+                "id": user["user_id"],
+                "password_hash": user["password_hash"],
+                "full_name": user.get("full_name"),
+                "email": user.get("email"),
+                "organization_id": user.get("organization_id"),
+            }
+            for user in users
+        ]
+        with self.SessionLocal() as session:
+            session.execute(insert(User), rows)
+            session.commit()
+
     def list_users(self) -> list[dict[str, Any]]:
         """Lists all users in the system.
 
@@ -1023,6 +1232,27 @@ class SQLStateRepository(StateRepository):
             session.add(db_token)
             session.commit()
 
+    def create_api_tokens(self, tokens: list[dict[str, Any]]):
+        """Creates several API tokens in a single transaction.
+
+        Args:
+            tokens: Dictionaries of `create_api_token` keyword arguments.
+        """
+        if not tokens:
+            return
+        rows = [
+            {
+                "id": token["token_id"],
+                "user_id": token["user_id"],
+                "name": token["name"],
+                "expires_at": token.get("expires_at"),
+            }
+            for token in tokens
+        ]
+        with self.SessionLocal() as session:
+            session.execute(insert(ApiToken), rows)
+            session.commit()
+
     def list_api_tokens(self, user_id: str) -> list[dict[str, Any]]:
         """Lists all tokens for a user.
 
@@ -1047,6 +1277,31 @@ class SQLStateRepository(StateRepository):
                 for row in rows
             ]
 
+    def iter_api_tokens(self, user_id: str) -> Iterator[dict[str, Any]]:
+        """Streams all tokens for a user in batches.
+
+        Args:
+            user_id: The ID of the user.
+
+        Yields:
+            Token dictionaries.
+        """
+        with self.SessionLocal() as session:
+            stmt = (
+                select(
+                    ApiToken.id,
+                    ApiToken.user_id,
+                    ApiToken.name,
+                    ApiToken.created_at,
+                    ApiToken.expires_at,
+                    ApiToken.revoked_at,
+                )
+                .where(ApiToken.user_id == user_id)
+                .execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
+            for row in session.execute(stmt).mappings():
+                yield dict(row)
+
     def revoke_api_token(self, token_id: str):
         """Revokes an API token.
 
@@ -1162,3 +1417,26 @@ class SQLStateRepository(StateRepository):
                 }
                 for row in rows
             ]
+
+    def iter_webhooks(
+        self, project_id: Optional[str] = None
+    ) -> Iterator[dict[str, Any]]:
+        """Streams webhooks in batches.
+
+        Args:
+            project_id: Optional project ID to filter by.
+
+        Yields:
+            Webhook dictionaries.
+        """
+        with self.SessionLocal() as session:
+            stmt = select(
+                Webhook.id,
+                Webhook.project_id,
+                Webhook.action_id,
+                Webhook.enabled,
+            ).execution_options(yield_per=STREAM_BATCH_SIZE)
+            if project_id:
+                stmt = stmt.where(Webhook.project_id == project_id)
+            for row in session.execute(stmt).mappings():
+                yield dict(row)
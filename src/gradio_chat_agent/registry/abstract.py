@@ -5,10 +5,107 @@ components and actions, as well as the executable handlers for actions.
 """
 
 from abc import ABC, abstractmethod
-from typing import Callable, Optional
-
-from gradio_chat_agent.models.action import ActionDeclaration
-from gradio_chat_agent.models.component import ComponentDeclaration
+from dataclasses import dataclass
+from types import CodeType
+from typing import Any, Callable, Optional
+
+from jsonschema import SchemaError
+
+from gradio_chat_agent.execution.expressions import compile_checks
+from gradio_chat_agent.models.action import (
+    ActionDeclaration,
+    ActionPrecondition,
+)
+from gradio_chat_agent.models.component import (
+    ComponentDeclaration,
+    ComponentInvariant,
+)
+from gradio_chat_agent.models.enums import ActionRisk
+from gradio_chat_agent.utils import build_input_validator
+
+
+def pure_handler(handler: Callable) -> Callable:
+    """Marks an action handler as never mutating the snapshot it receives.
+
+    Pure handlers must copy any dict they change (e.g.
+    `new = snapshot.components.copy(); new[cid] = {**new[cid], ...}`).
+    The engine then passes them the live state instead of a deep copy.
+
+    Args:
+        handler: The handler function.
+
+    Returns:
+        The same handler, marked as pure.
+    """
+    handler.is_pure = True
+    return handler
+
+
+def is_pure_handler(handler: Callable) -> bool:
+    """Checks whether a handler was marked with `pure_handler`.
+
+    Args:
+        handler: The handler function.
+
+    Returns:
+        True if the handler is marked as pure.
+    """
+    return getattr(handler, "is_pure", False) is True
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledAction:
+    """Everything the engine needs to execute an action, resolved once.
+
+    Attributes:
+        action: The action declaration.
+        handler: The action handler, or None if none is registered.
+        validator: The input schema validator, or None if the schema is
+            invalid (the error is raised when the validator is rebuilt).
+        preconditions: The preconditions with their compiled expressions.
+        high_risk: Whether the action's risk level is HIGH.
+        needs_confirmation: Whether the action requires confirmation,
+            either explicitly or because it is high risk.
+        pure: Whether the handler is marked with `pure_handler`.
+    """
+
+    action: ActionDeclaration
+    handler: Optional[Callable]
+    validator: Any
+    preconditions: tuple[tuple[Optional[CodeType], ActionPrecondition], ...]
+    high_risk: bool
+    needs_confirmation: bool
+    pure: bool
+
+
+def compile_action(
+    action: ActionDeclaration,
+    handler: Optional[Callable],
+    validator: Any,
+    preconditions: list[tuple[Optional[CodeType], ActionPrecondition]],
+) -> CompiledAction:
+    """Bundles an action with its handler and precompiled checks.
+
+    Args:
+        action: The action declaration.
+        handler: The action handler, if any.
+        validator: The input schema validator, or None if it is invalid.
+        preconditions: The compiled preconditions of the action.
+
+    Returns:
+        The compiled action.
+    """
+    high_risk = action.permission.risk == ActionRisk.HIGH
+    return CompiledAction(
+        action=action,
+        handler=handler,
+        validator=validator,
+        preconditions=tuple(preconditions),
+        high_risk=high_risk,
+        needs_confirmation=action.permission.confirmation_required
+        or high_risk,
+        pure=handler is not None and is_pure_handler(handler),
+    )
 
 
 class Registry(ABC):
@@ -69,3 +166,82 @@ class Registry(ABC):
             The callable handler function if found, otherwise None.
         """
         pass  # pragma: no cover
+
+    def get_compiled_preconditions(
+        self, action: ActionDeclaration
+    ) -> list[tuple[Optional[CodeType], ActionPrecondition]]:
+        """Returns an action's preconditions with their compiled expressions.
+
+        The default implementation compiles on every call; registries
+        should override it to compile once at registration time.
+
+        Args:
+            action: The action declaration.
+
+        Returns:
+            A list of (code, precondition) tuples. `code` is None when the
+            expression failed to compile.
+        """
+        return compile_checks(action.preconditions)
+
+    def get_input_validator(self, action: ActionDeclaration) -> Any:
+        """Returns a JSON Schema validator for an action's input schema.
+
+        The default implementation builds a new validator on every call;
+        registries should override it to build once at registration time.
+
+        Args:
+            action: The action declaration.
+
+        Returns:
+            A `jsonschema` validator instance.
+
+        Raises:
+            jsonschema.SchemaError: If the input schema is invalid.
+        """
+        return build_input_validator(action.input_schema)
+
+    def get_compiled_action(self, action_id: str) -> Optional[CompiledAction]:
+        """Resolves an action with its handler and precompiled checks.
+
+        The default implementation assembles the result from the other
+        lookup methods on every call; registries should override it to
+        compile once at registration time.
+
+        Args:
+            action_id: The unique identifier of the action.
+
+        Returns:
+            The compiled action if the action exists, otherwise None.
+        """
+        action = self.get_action(action_id)
+        if action is None:
+            return None
+        try:
+            validator = self.get_input_validator(action)
+        except SchemaError:
+            validator = None
+        return compile_action(
+            action,
+            self.get_handler(action_id),
+            validator,
+            self.get_compiled_preconditions(action),
+        )
+
+    def get_compiled_invariants(
+        self,
+    ) -> list[tuple[str, Optional[CodeType], ComponentInvariant]]:
+        """Returns all component invariants with their compiled expressions.
+
+        The default implementation compiles on every call; registries
+        should override it to compile once at registration time.
+
+        Returns:
+            A list of (component_id, code, invariant) tuples. `code` is None
+            when the expression failed to compile.
+        """
+        return [
+            (component.component_id, code, invariant)
+            for component in self.list_components()
+            for code, invariant in compile_checks(component.invariants)
+        ]
@@ -22,6 +22,7 @@ from gradio_chat_agent.models.enums import (
 )
 from gradio_chat_agent.models.execution_result import StateDiffEntry
 from gradio_chat_agent.models.state_snapshot import StateSnapshot
+from gradio_chat_agent.registry.abstract import pure_handler
 
 
 # --- Component ---
@@ -45,6 +46,7 @@ counter_component = ComponentDeclaration(
 # --- Handlers ---
 
 
+@pure_handler
 def set_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     """Sets the counter to a specific value.
 
@@ -69,6 +71,7 @@ def set_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     return new_comps, diff, f"Counter set to {val} (was {old_val})"
 
 
+@pure_handler
 def increment_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     """Increments the counter by a given amount.
 
@@ -94,6 +97,7 @@ def increment_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     return new_comps, diff, f"Counter incremented by {amount} to {new_val}"
 
 
+@pure_handler
 def reset_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     """Resets the counter to zero.
 
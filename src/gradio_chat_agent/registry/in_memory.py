@@ -4,11 +4,26 @@ This module provides a simple dictionary-backed registry for development,
 testing, and single-instance deployments.
 """
 
-from typing import Callable, Optional
-
-from gradio_chat_agent.models.action import ActionDeclaration
-from gradio_chat_agent.models.component import ComponentDeclaration
-from gradio_chat_agent.registry.abstract import Registry
+from types import CodeType
+from typing import Any, Callable, Optional
+
+from jsonschema import SchemaError
+
+from gradio_chat_agent.execution.expressions import compile_checks
+from gradio_chat_agent.models.action import (
+    ActionDeclaration,
+    ActionPrecondition,
+)
+from gradio_chat_agent.models.component import (
+    ComponentDeclaration,
+    ComponentInvariant,
+)
+from gradio_chat_agent.registry.abstract import (
+    CompiledAction,
+    Registry,
+    compile_action,
+)
+from gradio_chat_agent.utils import build_input_validator
 
 
 class InMemoryRegistry(Registry):
@@ -19,6 +34,17 @@ class InMemoryRegistry(Registry):
         self._components: dict[str, ComponentDeclaration] = {}
         self._actions: dict[str, ActionDeclaration] = {}
         self._handlers: dict[str, Callable] = {}
+        # Check expressions compiled at registration time.
+        self._compiled_preconditions: dict[
+            str, list[tuple[Optional[CodeType], ActionPrecondition]]
+        ] = {}
+        self._compiled_invariants: list[
+            tuple[str, Optional[CodeType], ComponentInvariant]
+        ] = []
+        # Input schema validators built at registration time.
+        self._input_validators: dict[str, Any] = {}
+        # Per-action bundles dispatched on by the engine's hot path.
+        self._compiled_actions: dict[str, CompiledAction] = {}
 
     def register_component(self, component: ComponentDeclaration):
         """Registers a new component declaration.
@@ -27,16 +53,40 @@ class InMemoryRegistry(Registry):
             component: The component declaration object to register.
         """
         self._components[component.component_id] = component
-
-    def register_action(self, action: ActionDeclaration, handler: Callable):
+        self._compiled_invariants = [
+            (comp.component_id, code, invariant)
+            for comp in self._components.values()
+            for code, invariant in compile_checks(comp.invariants)
+        ]
+
+    def register_action(
+        self, action: ActionDeclaration, handler: Optional[Callable]
+    ):
         """Registers a new action and its associated handler.
 
         Args:
             action: The action declaration object to register.
-            handler: The function to be called when this action is executed.
+            handler: The function to be called when this action is executed,
+                or None to declare the action without a handler.
         """
         self._actions[action.action_id] = action
         self._handlers[action.action_id] = handler
+        self._compiled_preconditions[action.action_id] = compile_checks(
+            action.preconditions
+        )
+        try:
+            self._input_validators[action.action_id] = build_input_validator(
+                action.input_schema
+            )
+        except SchemaError:
+            # Invalid schemas are reported when the action is executed.
+            self._input_validators.pop(action.action_id, None)
+        self._compiled_actions[action.action_id] = compile_action(
+            action,
+            handler,
+            self._input_validators.get(action.action_id),
+            self._compiled_preconditions[action.action_id],
+        )
 
     def _get_latest_version(self, base_id: str, store: dict) -> Optional[str]:
         """Finds the latest version of a component or action.
@@ -127,3 +177,66 @@ class InMemoryRegistry(Registry):
 
         latest_id = self._get_latest_version(action_id, self._actions)
         return self._handlers.get(latest_id) if latest_id else None
+
+    def get_compiled_preconditions(
+        self, action: ActionDeclaration
+    ) -> list[tuple[Optional[CodeType], ActionPrecondition]]:
+        """Returns an action's preconditions compiled at registration.
+
+        Args:
+            action: The action declaration.
+
+        Returns:
+            A list of (code, precondition) tuples.
+        """
+        compiled = self._compiled_preconditions.get(action.action_id)
+        if (
+            compiled is None
+            or self._actions.get(action.action_id) is not action
+        ):
+            return super().get_compiled_preconditions(action)
+        return compiled
+
+    def get_input_validator(self, action: ActionDeclaration) -> Any:
+        """Returns the input schema validator built at registration.
+
+        Args:
+            action: The action declaration.
+
+        Returns:
+            A `jsonschema` validator instance.
+        """
+        validator = self._input_validators.get(action.action_id)
+        if (
+            validator is None
+            or self._actions.get(action.action_id) is not action
+        ):
+            return super().get_input_validator(action)
+        return validator
+
+    def get_compiled_action(self, action_id: str) -> Optional[CompiledAction]:
+        """Returns the action bundle compiled at registration.
+
+        If no version is specified, returns the latest version.
+
+        Args:
+            action_id: The unique identifier of the action.
+
+        Returns:
+            The compiled action if found, otherwise None.
+        """
+        if "@" in action_id:
+            return self._compiled_actions.get(action_id)
+
+        latest_id = self._get_latest_version(action_id, self._actions)
+        return self._compiled_actions.get(latest_id) if latest_id else None
+
+    def get_compiled_invariants(
+        self,
+    ) -> list[tuple[str, Optional[CodeType], ComponentInvariant]]:
+        """Returns all component invariants compiled at registration.
+
+        Returns:
+            A list of (component_id, code, invariant) tuples.
+        """
+        return self._compiled_invariants
@@ -22,6 +22,7 @@ from gradio_chat_agent.models.enums import (
 )
 from gradio_chat_agent.models.execution_result import StateDiffEntry
 from gradio_chat_agent.models.state_snapshot import StateSnapshot
+from gradio_chat_agent.registry.abstract import pure_handler
 
 
 # --- Component IDs ---
@@ -94,6 +95,7 @@ status_indicator_component = ComponentDeclaration(
 
 # --- Handlers ---
 
+@pure_handler
 def text_input_set_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     new_value = inputs["value"]
     new_comps = snapshot.components.copy()
@@ -108,6 +110,7 @@ def text_input_set_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     return new_comps, diff, f"Text input set to: {new_value}"
 
 
+@pure_handler
 def slider_set_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     new_value = inputs["value"]
     new_comps = snapshot.components.copy()
@@ -122,6 +125,7 @@ def slider_set_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     return new_comps, diff, f"Slider set to: {new_value}"
 
 
+@pure_handler
 def status_indicator_update_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     new_status = inputs.get("status")
     new_message = inputs.get("message")
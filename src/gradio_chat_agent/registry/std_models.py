@@ -23,6 +23,7 @@ from gradio_chat_agent.models.enums import (
 )
 from gradio_chat_agent.models.execution_result import StateDiffEntry
 from gradio_chat_agent.models.state_snapshot import StateSnapshot
+from gradio_chat_agent.registry.abstract import pure_handler
 
 
 # --- Components ---
@@ -93,6 +94,7 @@ output_panel_component = ComponentDeclaration(
 
 # --- Handlers ---
 
+@pure_handler
 def select_model_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     model_name = inputs["model_name"]
     new_comps = snapshot.components.copy()
@@ -113,6 +115,7 @@ def select_model_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     return new_comps, diff, f"Model selected: {model_name}"
 
 
+@pure_handler
 def load_model_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     new_comps = snapshot.components.copy()
     state = new_comps.get(MODEL_SELECTOR_ID).copy()
@@ -127,6 +130,7 @@ def load_model_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     return new_comps, diff, f"Model {model_name} loaded successfully."
 
 
+@pure_handler
 def run_inference_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     prompt_text = inputs.get("prompt_override") or snapshot.components.get(PROMPT_EDITOR_ID, {}).get("text", "")
     
@@ -23,6 +23,7 @@ from gradio_chat_agent.models.enums import (
 )
 from gradio_chat_agent.models.execution_result import StateDiffEntry
 from gradio_chat_agent.models.state_snapshot import StateSnapshot
+from gradio_chat_agent.registry.abstract import pure_handler
 
 
 # --- Component Definition ---
@@ -48,6 +49,7 @@ memory_component = ComponentDeclaration(
 # --- Action Handlers ---
 
 
+@pure_handler
 def remember_handler(
     inputs: dict[str, Any], snapshot: StateSnapshot
 ) -> tuple[dict[str, dict[str, Any]], list[StateDiffEntry], str]:
@@ -89,6 +91,7 @@ def remember_handler(
     return new_components, diff, f"Remembered: {key} = {value}"
 
 
+@pure_handler
 def forget_handler(
     inputs: dict[str, Any], snapshot: StateSnapshot
 ) -> tuple[dict[str, dict[str, Any]], list[StateDiffEntry], str]:
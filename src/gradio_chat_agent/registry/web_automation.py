@@ -22,6 +22,7 @@ from gradio_chat_agent.models.enums import (
 )
 from gradio_chat_agent.models.execution_result import StateDiffEntry
 from gradio_chat_agent.models.state_snapshot import StateSnapshot
+from gradio_chat_agent.registry.abstract import pure_handler
 
 
 # --- Component ---
@@ -58,6 +59,7 @@ browser_component = ComponentDeclaration(
 # --- Handlers ---
 
 def _create_pending_action_handler(action_type: str):
+    @pure_handler
     def handler(inputs: dict[str, Any], snapshot: StateSnapshot):
         new_comps = snapshot.components.copy()
         state = new_comps.get(BROWSER_ID, {
@@ -89,6 +91,7 @@ click_handler = _create_pending_action_handler("click")
 type_handler = _create_pending_action_handler("type")
 scroll_handler = _create_pending_action_handler("scroll")
 
+@pure_handler
 def sync_browser_state_handler(inputs: dict[str, Any], snapshot: StateSnapshot):
     """Internal handler to sync the real browser state back to the component."""
     new_comps = snapshot.components.copy()
@@ -5,6 +5,8 @@ logic for handling user interactions, agent communication, and engine
 execution.
 """
 
+from typing import Optional
+
 import gradio as gr
 
 from gradio_chat_agent.api.endpoints import ApiEndpoints
@@ -269,9 +271,12 @@ class UIController:
         last_intent_json = result.model_dump(mode="json") if result else {}
         updates = self.binder.get_updates(state_dict)
         if isinstance(result, ExecutionPlan):
-            plan_md = f"## Proposed Plan (ID: {result.plan_id})\n"
-            for i, step in enumerate(result.steps):
-                plan_md += f"{i + 1}. **{step.action_id}**: `{step.inputs}`\n"
+            plan_lines = [f"## Proposed Plan (ID: {result.plan_id})"]
+            plan_lines.extend(
+                f"{i}. **{step.action_id}**: `{step.inputs}`"
+                for i, step in enumerate(result.steps, start=1)
+            )
+            plan_md = "\n".join(plan_lines) + "\n"
 
             new_history.append(
                 {
@@ -448,13 +453,16 @@ class UIController:
             pid, plan, user_roles=user_roles, user_id=uid
         )
 
-        summary = "### Plan Execution Result\n"
+        summary_lines = ["### Plan Execution Result"]
         final_diff = []
         for res in results:
             status_icon = "✅" if res.status == "success" else "❌"
-            summary += f"- {status_icon} **{res.action_id}**: {res.message}\n"
+            summary_lines.append(
+                f"- {status_icon} **{res.action_id}**: {res.message}"
+            )
             if res.state_diff:
                 final_diff.extend(res.state_diff)
+        summary = "\n".join(summary_lines) + "\n"
 
         history.append({"role": "assistant", "content": summary})
 
@@ -498,7 +506,10 @@ class UIController:
 
 
 def create_ui(
-    engine: ExecutionEngine, adapter: AgentAdapter, auth_manager=None
+    engine: ExecutionEngine,
+    adapter: AgentAdapter,
+    auth_manager=None,
+    api: Optional[ApiEndpoints] = None,
 ) -> gr.Blocks:
     """Constructs the Gradio UI and sets up event handlers.
 
@@ -506,11 +517,13 @@ def create_ui(
         engine: The authoritative execution engine for state mutations.
         adapter: The chat agent adapter for natural language interpretation.
         auth_manager: Optional manager for OIDC authentication.
+        api: Optional API endpoint handlers. Defaults to a new
+            `ApiEndpoints` for the engine.
 
     Returns:
         A Gradio gr.Blocks object containing the application layout.
     """
-    api = ApiEndpoints(engine)
+    api = api or ApiEndpoints(engine)
     controller = UIController(engine, adapter)
     controller.auth_manager = auth_manager
     theme = AgentTheme()
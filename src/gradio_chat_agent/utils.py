@@ -9,7 +9,7 @@ import base64
 import hashlib
 import json
 import mimetypes
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import copy
 from gradio_chat_agent.models.enums import StateDiffOp
@@ -57,11 +57,69 @@ class SecretManager:
 
 
 def hash_password(password: str) -> str:
-    """Simple SHA256 hashing for demonstration purposes.
+    """Simple BLAKE2b hashing for demonstration purposes.
 
     In production, use a dedicated library like bcrypt or argon2.
     """
-    return hashlib.sha256(password.encode()).hexdigest()
+    return hashlib.blake2b(
+        password.encode("utf-8"), digest_size=32, person=b"gca-user"
+    ).hexdigest()
+
+
+# Types whose instances are immutable and can be shared by a clone.
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None), bytes})
+
+# Sentinel for keys absent from a state dict (None is a valid value).
+_MISSING = object()
+
+
+def fast_clone(obj: Any) -> Any:
+    """Returns a deep copy of plain JSON-like data.
+
+    Dicts, lists and tuples are rebuilt with their constructors and
+    immutable scalars are shared, which avoids `copy.deepcopy`'s memo and
+    per-node dispatch. Exact type checks are used, so subclasses and any
+    other object fall back to `copy.deepcopy`.
+
+    Args:
+        obj: The object to copy.
+
+    Returns:
+        An independent deep copy of the object.
+    """
+    t = type(obj)
+    if t is dict:
+        return {k: fast_clone(v) for k, v in obj.items()}
+    if t is list:
+        return [fast_clone(v) for v in obj]
+    if t in _IMMUTABLE_TYPES:
+        return obj
+    if t is tuple:
+        return tuple(fast_clone(v) for v in obj)
+    return copy.deepcopy(obj)
+
+
+def build_input_validator(schema: dict[str, Any]) -> Any:
+    """Builds a reusable JSON Schema validator for an input schema.
+
+    This performs the same steps as `jsonschema.validate` (pick the validator
+    class for the schema's dialect and check the schema itself) but returns
+    the validator so it can be reused for many instances.
+
+    Args:
+        schema: The JSON schema.
+
+    Returns:
+        A `jsonschema` validator instance.
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid.
+    """
+    from jsonschema.validators import validator_for
+
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
 
 
 def compute_checksum(components: dict[str, Any]) -> str:
@@ -78,6 +136,23 @@ def compute_checksum(components: dict[str, Any]) -> str:
     return hashlib.sha256(dump.encode("utf-8")).hexdigest()
 
 
+def compute_media_hash(data: Union[str, bytes, bytearray, memoryview]) -> str:
+    """Computes the SHA-256 hex digest of a media payload.
+
+    Bytes-like payloads are hashed in place through a memoryview, so no
+    copy of the buffer is made; strings are UTF-8 encoded first.
+
+    Args:
+        data: The media payload.
+
+    Returns:
+        The hex-encoded SHA-256 digest.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(memoryview(data)).hexdigest()
+
+
 def compute_state_diff(
     old_state: dict[str, Any], new_state: dict[str, Any], path_prefix: str = ""
 ) -> list[StateDiffEntry]:
@@ -97,37 +172,34 @@ def compute_state_diff(
         A list of StateDiffEntry objects describing the changes between the
         two states.
     """
-    diffs = []
+    # Dict equality runs in C and bails out on the first difference, so
+    # unchanged states skip the per-key walk entirely.
+    if old_state == new_state:
+        return []
 
-    all_keys = set(old_state.keys()) | set(new_state.keys())
-
-    for key in all_keys:
-        path = f"{path_prefix}.{key}" if path_prefix else key
+    diffs = []
 
-        if key not in old_state:
-            diffs.append(
-                StateDiffEntry(
-                    path=path, op=StateDiffOp.ADD, value=new_state[key]
-                )
-            )
-        elif key not in new_state:
-            diffs.append(
-                StateDiffEntry(path=path, op=StateDiffOp.REMOVE, value=None)
-            )
-        elif old_state[key] != new_state[key]:
-            if isinstance(old_state[key], dict) and isinstance(
-                new_state[key], dict
-            ):
-                diffs.extend(
-                    compute_state_diff(old_state[key], new_state[key], path)
-                )
+    # One pass over each side: removed and changed keys in old order, then
+    # added keys in new order. Paths are only built for changed keys.
+    for key, old_value in old_state.items():
+        new_value = new_state.get(key, _MISSING)
+        if new_value is _MISSING:
+            path = f"{path_prefix}.{key}" if path_prefix else key
+            diffs.append(StateDiffEntry(path=path, op=StateDiffOp.REMOVE, value=None))
+        elif old_value != new_value:
+            path = f"{path_prefix}.{key}" if path_prefix else key
+            if isinstance(old_value, dict) and isinstance(new_value, dict):
+                diffs.extend(compute_state_diff(old_value, new_value, path))
             else:
                 diffs.append(
-                    StateDiffEntry(
-                        path=path, op=StateDiffOp.REPLACE, value=new_state[key]
-                    )
+                    StateDiffEntry(path=path, op=StateDiffOp.REPLACE, value=new_value)
                 )
 
+    for key, new_value in new_state.items():
+        if key not in old_state:
+            path = f"{path_prefix}.{key}" if path_prefix else key
+            diffs.append(StateDiffEntry(path=path, op=StateDiffOp.ADD, value=new_value))
+
     return diffs
 
 
@@ -143,7 +215,7 @@ def apply_state_diff(
     Returns:
         A new state dictionary with the diffs applied.
     """
-    new_state = copy.deepcopy(state)
+    new_state = fast_clone(state)
 
     for diff in diffs:
         path = diff.path
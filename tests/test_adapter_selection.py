@@ -8,7 +8,7 @@ from gradio_chat_agent.chat.openai_adapter import OpenAIAgentAdapter
 @pytest.fixture
 def mock_adapters():
     with patch("gradio_chat_agent.app.GeminiAgentAdapter") as mock_gemini, \
-         patch("gradio_chat_agent.app.OpenAIAgentAdapter") as mock_openai, \
+         patch("gradio_chat_agent.app.get_openai_adapter") as mock_openai, \
          patch("gradio_chat_agent.app.SQLStateRepository") as mock_repo, \
          patch("gradio_chat_agent.app.ExecutionEngine") as mock_engine, \
          patch("gradio_chat_agent.app.create_ui") as mock_ui, \
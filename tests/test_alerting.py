@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from gradio_chat_agent.execution.engine import ExecutionEngine
-from gradio_chat_agent.observability.alerting import AlertingService
+from gradio_chat_agent.observability.alerting import AlertingService, WebhookAlertHandler
 from gradio_chat_agent.persistence.in_memory import InMemoryStateRepository
 from gradio_chat_agent.registry.in_memory import InMemoryRegistry
 from gradio_chat_agent.models.enums import ExecutionStatus
@@ -108,3 +108,56 @@ class TestAlertingSystem:
         res = MagicMock(status=ExecutionStatus.SUCCESS, execution_time_ms=100, action_id="a")
         service.check_execution_alerts(pid, res)
         handler.assert_not_called()
+
+    def test_webhook_handler_posts_to_all_urls(self):
+        client = MagicMock()
+        handler = WebhookAlertHandler(["http://a", "http://b"], client=client)
+
+        handler({"type": "high_latency"})
+        handler.close()
+
+        urls = sorted(c.args[0] for c in client.post.call_args_list)
+        assert urls == ["http://a", "http://b"]
+        assert all(c.kwargs["content"] == b'{"type":"high_latency"}' for c in client.post.call_args_list)
+        assert all(
+            c.kwargs["headers"]["Content-Type"] == "application/json" for c in client.post.call_args_list
+        )
+
+    def test_webhook_handler_logs_http_errors(self):
+        import httpx
+
+        client = MagicMock()
+        client.post.side_effect = httpx.ConnectError("down")
+        handler = WebhookAlertHandler(["http://a"], client=client)
+        with patch("gradio_chat_agent.observability.alerting.logger") as mock_logger:
+            handler({"type": "x"})
+            handler.close()
+            mock_logger.error.assert_called_once()
+
+    def test_webhook_handler_logs_error_responses(self):
+        import httpx
+
+        client = MagicMock()
+        request = httpx.Request("POST", "http://a")
+        client.post.return_value = httpx.Response(500, request=request)
+        handler = WebhookAlertHandler(["http://a"], client=client)
+        with patch("gradio_chat_agent.observability.alerting.logger") as mock_logger:
+            handler({"type": "x"})
+            handler.close()
+            mock_logger.error.assert_called_once()
+
+    def test_webhook_handler_does_not_wait_for_delivery(self):
+        import threading
+
+        release = threading.Event()
+        client = MagicMock()
+        client.post.side_effect = lambda *args, **kwargs: release.wait(2.0)
+        handler = WebhookAlertHandler(["http://a"], client=client)
+
+        handler({"type": "x"})
+        # The call returned while the request is still blocked
+        assert not release.is_set()
+        release.set()
+        handler.close()
+        client.post.assert_called_once()
+
@@ -10,7 +10,7 @@ class TestApp:
 
     def test_app_main_execution(self):
         with patch("gradio_chat_agent.app.SQLStateRepository") as mock_repo:
-            with patch("gradio_chat_agent.app.OpenAIAgentAdapter") as mock_adapter:
+            with patch("gradio_chat_agent.app.get_openai_adapter") as mock_adapter:
                 with patch("gradio_chat_agent.app.create_ui") as mock_ui:
                     with patch("uvicorn.run") as mock_run:
                         with patch("gradio.mount_gradio_app") as mock_mount:
@@ -32,7 +32,7 @@ class TestApp:
         # Patch uvicorn.run GLOBALLY to prevent actual server start
         with patch("uvicorn.run") as mock_run:
             with patch("gradio_chat_agent.app.SQLStateRepository"), \
-                 patch("gradio_chat_agent.app.OpenAIAgentAdapter"), \
+                 patch("gradio_chat_agent.app.get_openai_adapter"), \
                  patch("gradio.mount_gradio_app"), \
                  patch("gradio_chat_agent.app.create_ui") as mock_ui:
                 mock_demo = MagicMock()
@@ -51,7 +51,7 @@ class TestApp:
                 # Configure repo for health check
                 mock_repo.check_health.return_value = True
                 
-                with patch("gradio_chat_agent.app.OpenAIAgentAdapter"):
+                with patch("gradio_chat_agent.app.get_openai_adapter"):
                     with patch("gradio_chat_agent.app.create_ui"):
                          # IMPORTANT: Mock mount_gradio_app to return the FIRST argument (the FastAPI app)
                          # otherwise app variable in main() becomes a MagicMock and TestClient won't work well
@@ -81,7 +81,7 @@ class TestApp:
 
     def test_app_auth_endpoints_coverage(self):
         with patch("gradio_chat_agent.app.SQLStateRepository"), \
-             patch("gradio_chat_agent.app.OpenAIAgentAdapter"), \
+             patch("gradio_chat_agent.app.get_openai_adapter"), \
              patch("gradio_chat_agent.app.create_ui"), \
              patch("gradio.mount_gradio_app", side_effect=lambda app, *args, **kwargs: app):
             
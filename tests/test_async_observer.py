@@ -109,31 +109,159 @@ class TestAsyncObserver:
         
         assert observer._poll_and_process.call_count >= 1
 
-    def test_observer_timestamp_logic(self, setup):
+    def test_observer_sequence_watermark(self, setup):
         observer, engine, repo, pid = setup
-        
-        # 1. Start (sets last_processed to now)
-        observer.start()
-        # Mock last_processed to be in the past
-        observer._last_processed_timestamp = datetime(2020, 1, 1, tzinfo=timezone.utc)
-        
-        # 2. Add new execution (naive timestamp)
-        mock_res = ExecutionResult(
+        # An entry logged before start() is historic and skipped
+        repo.save_execution(pid, ExecutionResult(
+            request_id="r0", action_id="a", status=ExecutionStatus.SUCCESS, state_snapshot_id="s"
+        ))
+        with patch.object(observer, "_run"):
+            observer.start()
+        assert observer._last_processed_seq == {pid: 1}
+
+        # Ordering follows the log, not the (skewed, naive) timestamps
+        repo.save_execution(pid, ExecutionResult(
             request_id="r1", action_id="a", status=ExecutionStatus.SUCCESS,
-            state_snapshot_id="s", timestamp=datetime(2021, 1, 1), # Naive
-            metadata={}
-        )
-        repo.save_execution(pid, mock_res)
-        
-        # 3. Poll
+            state_snapshot_id="s", timestamp=datetime(2021, 1, 1),
+        ))
         callback = MagicMock()
         observer.add_callback(callback)
         observer._poll_and_process()
-        
-        # Should have called callback
+
         callback.assert_called_once()
-        # Should have updated timestamp (aware)
-        assert observer._last_processed_timestamp.year == 2021
-        assert observer._last_processed_timestamp.tzinfo is not None
-        
+        assert callback.call_args[0][1].request_id == "r1"
+        assert observer._last_processed_seq[pid] == 2
         observer.stop()
+
+    def test_poll_returns_processed_count(self, setup):
+        observer, engine, repo, pid = setup
+        assert observer._poll_and_process() == 0
+
+        for i in range(2):
+            repo.save_execution(pid, ExecutionResult(
+                request_id=f"r{i}", action_id="a", status=ExecutionStatus.SUCCESS,
+                state_snapshot_id="s", timestamp=datetime(2021, 1, 1 + i, tzinfo=timezone.utc)
+            ))
+        assert observer._poll_and_process() == 2
+        assert observer._poll_and_process() == 0
+
+    def test_adaptive_poll_interval(self, setup):
+        observer, _, _, _ = setup
+        # Fixed interval unless a maximum is configured
+        assert observer._next_interval(0.1, 0) == 0.1
+
+        observer.max_poll_interval = 0.3
+        assert observer._next_interval(0.1, 0) == pytest.approx(0.15)
+        assert observer._next_interval(0.25, 0) == 0.3
+        assert observer._next_interval(0.3, 0) == 0.3
+        # Any activity resets to the fast interval
+        assert observer._next_interval(0.3, 1) == 0.1
+
+    def test_concurrent_fetch_runs_callbacks_on_caller(self, setup):
+        import threading
+
+        observer, engine, repo, pid = setup
+        repo.create_project("p2", "P2")
+        observer.max_workers = 2
+        for project_id in (pid, "p2"):
+            repo.save_execution(project_id, ExecutionResult(
+                request_id=f"r-{project_id}", action_id="a", status=ExecutionStatus.SUCCESS, state_snapshot_id="s"
+            ))
+
+        fetch_threads = set()
+        fetch = observer._fetch_new_entries
+
+        def tracking_fetch(project_id):
+            fetch_threads.add(threading.get_ident())
+            return fetch(project_id)
+
+        callback_threads = []
+        observer.add_callback(lambda project_id, entry: callback_threads.append(threading.get_ident()))
+        with patch.object(observer, "_fetch_new_entries", side_effect=tracking_fetch):
+            assert observer._poll_and_process() == 2
+
+        assert threading.get_ident() not in fetch_threads
+        assert callback_threads == [threading.get_ident()] * 2
+        assert observer._last_processed_seq == {pid: 1, "p2": 1}
+        observer.stop()
+        assert observer._pool is None
+
+    def test_engine_commit_wakes_observer(self, setup):
+        from gradio_chat_agent.models.action import ActionDeclaration, ActionPermission
+        from gradio_chat_agent.models.enums import ActionRisk, ActionVisibility, IntentType
+        from gradio_chat_agent.models.intent import ChatIntent
+
+        observer, engine, repo, pid = setup
+        # Long enough that only the commit hook can explain a prompt callback
+        observer.poll_interval = 30.0
+        engine.registry.register_action(
+            ActionDeclaration(
+                action_id="t.act", title="T", description="D", targets=["t"], input_schema={},
+                permission=ActionPermission(confirmation_required=False, risk=ActionRisk.LOW, visibility=ActionVisibility.USER),
+            ),
+            lambda inputs, snapshot: ({"t": {"v": 1}}, [], "ok"),
+        )
+        seen = []
+        observer.add_callback(lambda project_id, entry: seen.append(entry.request_id))
+        observer.start()
+        assert observer._notify in engine.post_execution_hooks
+        time.sleep(0.05)
+
+        engine.execute_intent(pid, ChatIntent(type=IntentType.ACTION_CALL, request_id="r-wake", action_id="t.act"), user_roles=["admin"])
+        deadline = time.monotonic() + 2.0
+        while not seen and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert seen == ["r-wake"]
+        observer.stop()
+        assert observer._notify not in engine.post_execution_hooks
+
+    def test_callback_pool_runs_callbacks_off_caller(self, setup):
+        import threading
+
+        _, engine, repo, pid = setup
+        observer = AuditLogObserver(engine, callback_workers=2)
+        for i in range(3):
+            repo.save_execution(pid, ExecutionResult(
+                request_id=f"r{i}", action_id="a", status=ExecutionStatus.SUCCESS, state_snapshot_id="s"
+            ))
+
+        callback_threads = []
+        observer.add_callback(lambda project_id, entry: callback_threads.append(threading.get_ident()))
+        assert observer._poll_and_process() == 3
+        observer.stop()
+
+        assert observer._callback_pool is None
+        assert len(callback_threads) == 3
+        assert threading.get_ident() not in callback_threads
+
+    def test_full_callback_queue_defers_entries(self, setup):
+        import threading
+
+        _, engine, repo, pid = setup
+        observer = AuditLogObserver(engine, callback_workers=1, max_pending_callbacks=1)
+        for i in range(3):
+            repo.save_execution(pid, ExecutionResult(
+                request_id=f"r{i}", action_id="a", status=ExecutionStatus.SUCCESS, state_snapshot_id="s"
+            ))
+
+        release = threading.Event()
+        seen = []
+
+        def slow_callback(project_id, entry):
+            release.wait(2.0)
+            seen.append(entry.request_id)
+
+        observer.add_callback(slow_callback)
+        # Only one entry fits; the poll must return instead of blocking
+        assert observer._poll_and_process() == 1
+        assert observer._last_processed_seq[pid] == 1
+
+        release.set()
+        deadline = time.monotonic() + 2.0
+        while observer._last_processed_seq[pid] < 3 and time.monotonic() < deadline:
+            observer._poll_and_process()
+            time.sleep(0.01)
+        observer.stop()
+
+        assert seen == ["r0", "r1", "r2"]
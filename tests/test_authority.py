@@ -0,0 +1,87 @@
+import pytest
+
+from gradio_chat_agent.execution.authority import (
+    ROLE_ADMIN,
+    ROLE_BITS,
+    ROLE_OPERATOR,
+    ROLE_ORDER,
+    ROLE_VIEWER,
+    compile_approval_rules,
+    match_approval_rule,
+    has_role,
+    intern_role,
+    is_viewer_only,
+    to_role_mask,
+)
+
+
+class TestAuthority:
+    def test_to_role_mask(self):
+        assert to_role_mask([]) == 0
+        assert to_role_mask(["viewer"]) == ROLE_VIEWER
+        assert to_role_mask(["admin", "operator"]) == ROLE_ADMIN | ROLE_OPERATOR
+        # Unknown roles contribute nothing
+        assert to_role_mask(["auditor"]) == 0
+
+    def test_role_tables_are_frozen_and_interned(self):
+        assert ROLE_ORDER == ("viewer", "operator", "admin")
+        assert dict(ROLE_BITS) == {"viewer": ROLE_VIEWER, "operator": ROLE_OPERATOR, "admin": ROLE_ADMIN}
+        with pytest.raises(TypeError):
+            ROLE_BITS["auditor"] = 8
+        # Roles built at runtime resolve to the same interned object
+        runtime_role = "".join(["ad", "min"])
+        assert intern_role(runtime_role) is ROLE_ORDER[2]
+
+    def test_has_role(self):
+        mask = to_role_mask(["operator"])
+        assert has_role(mask, ROLE_OPERATOR)
+        assert not has_role(mask, ROLE_ADMIN)
+        assert has_role(mask, ROLE_ADMIN | ROLE_OPERATOR)
+
+    def test_is_viewer_only(self):
+        assert is_viewer_only(to_role_mask(["viewer"]))
+        assert is_viewer_only(to_role_mask(["viewer", "auditor"]))
+        assert not is_viewer_only(to_role_mask(["viewer", "operator"]))
+        assert not is_viewer_only(0)
+
+    def test_match_approval_rule(self):
+        rules = [
+            {"min_cost": 50, "required_role": "admin"},
+            {"min_cost": 10, "required_role": "operator"},
+        ]
+        compiled = compile_approval_rules(rules)
+        operator = to_role_mask(["operator"])
+
+        assert match_approval_rule(compiled, 5, operator) is None
+        assert match_approval_rule(compiled, 20, operator) is None
+        assert match_approval_rule(compiled, 60, operator) == rules[0]
+        # Lowest unmet threshold wins
+        assert match_approval_rule(compiled, 60, 0) == rules[1]
+
+    def test_compile_approval_rules(self):
+        rules = [
+            {"min_cost": 50, "required_role": "admin"},
+            {"min_cost": 10, "required_role": "auditor"},
+            {"min_cost": 10},
+        ]
+        compiled = compile_approval_rules(rules)
+
+        # Sorted by threshold, ties keep policy order, missing role means admin
+        assert [(c[0], c[1], c[3]) for c in compiled] == [
+            (10, "auditor", rules[1]),
+            (10, "admin", rules[2]),
+            (50, "admin", rules[0]),
+        ]
+        assert compiled[0][2] is None
+        assert compiled[1][2] == ROLE_ADMIN
+
+        assert match_approval_rule(compiled, 5, 0) is None
+        assert match_approval_rule(compiled, 20, ROLE_ADMIN, frozenset({"auditor"})) is None
+        assert match_approval_rule(compiled, 20, ROLE_ADMIN) == rules[1]
+
+    def test_match_approval_rule_custom_role(self):
+        rules = [{"min_cost": 0, "required_role": "auditor"}]
+        compiled = compile_approval_rules(rules)
+        assert match_approval_rule(compiled, 1, 0, frozenset({"auditor"})) is None
+        assert match_approval_rule(compiled, 1, 0, frozenset({"viewer"})) == rules[0]
+
@@ -27,6 +27,13 @@ class TestCLI:
         assert result.exit_code == 0
         assert "test-p: Test Project" in result.output
 
+    def test_get_repo_is_reused_per_database_url(self, tmp_path):
+        repo = get_repo()
+        assert get_repo() is repo
+
+        os.environ["DATABASE_URL"] = f"sqlite:///{tmp_path / 'other.db'}"
+        assert get_repo() is not repo
+
     def test_user_create_and_reset(self):
         # user create prompts for password
         result = runner.invoke(app, ["user", "create", "--username", "alice"], input="password123\n")
@@ -71,10 +78,37 @@ class TestCLI:
         assert "Validation Error" in result.output
         assert "unknown" in result.output
 
+    def test_policy_validator_cached_by_path_and_mtime(self, tmp_path):
+        import os
+        from gradio_chat_agent.cli import _get_policy_validator
+
+        schema = tmp_path / "schema.json"
+        schema.write_text('{"type": "object"}')
+        first = _get_policy_validator(schema)
+        assert _get_policy_validator(schema) is first
+
+        # Touching the schema invalidates the cached validator
+        stat = schema.stat()
+        os.utime(schema, (stat.st_atime, stat.st_mtime + 10))
+        assert _get_policy_validator(schema) is not first
+
+    def test_policy_validator_checks_schema_once(self, tmp_path):
+        from jsonschema import Draft7Validator
+        from gradio_chat_agent.cli import _get_policy_validator
+
+        schema = tmp_path / "schema.json"
+        schema.write_text('{"$schema": "http://json-schema.org/draft-07/schema#", "type": "object"}')
+        with patch.object(Draft7Validator, "check_schema") as mock_check:
+            validator = _get_policy_validator(schema)
+            for _ in range(3):
+                assert list(_get_policy_validator(schema).iter_errors({})) == []
+            mock_check.assert_called_once()
+        assert validator.format_checker is None
+
     def test_project_list_empty(self):
         with patch("gradio_chat_agent.cli.get_repo") as mock_get:
             mock_repo = MagicMock()
-            mock_repo.list_projects.return_value = []
+            mock_repo.iter_projects.return_value = iter([])
             mock_get.return_value = mock_repo
             
             result = runner.invoke(app, ["project", "list"])
@@ -112,7 +146,7 @@ class TestCLI:
             assert "Skipping schema check" in result.output
 
         # Generic Exception during validation
-        with patch("gradio_chat_agent.cli.json_validate", side_effect=Exception("Generic Error")):
+        with patch("gradio_chat_agent.cli._get_policy_validator", side_effect=Exception("Generic Error")):
              result = runner.invoke(app, ["project", "validate", str(valid_policy)])
              assert result.exit_code == 1
              assert "Error: Generic Error" in result.output
@@ -124,6 +158,57 @@ class TestCLI:
             runpy.run_path("src/gradio_chat_agent/cli.py", run_name="__main__")
             mock_call.assert_called_once()
 
+    def test_user_and_token_create_from_file(self, tmp_path):
+        users = tmp_path / "users.jsonl"
+        users.write_text(
+            '{"username": "bob", "password": "p1"}\n\n'
+            '{"username": "carol", "password": "p2"}\n'
+        )
+        result = runner.invoke(app, ["user", "create", "--from-file", str(users)])
+        assert result.exit_code == 0
+        assert "Users created: 2" in result.output
+        assert {u["id"] for u in get_repo().list_users()} >= {"bob", "carol"}
+
+        tokens = tmp_path / "tokens.jsonl"
+        tokens.write_text(
+            '{"owner": "bob", "name": "T1", "expires_days": 7}\n'
+            '{"owner": "carol", "name": "T2"}\n'
+        )
+        result = runner.invoke(app, ["token", "create", "--from-file", str(tokens)])
+        assert result.exit_code == 0
+        assert "Token created: T1" in result.output
+        assert "Token created: T2" in result.output
+        assert len(get_repo().list_api_tokens("carol")) == 1
+
+    def test_from_file_rejects_incomplete_records(self, tmp_path):
+        users = tmp_path / "users.jsonl"
+        users.write_text('{"username": "dave", "password": "p1"}\n\n{"username": "erin"}\n')
+        with patch("gradio_chat_agent.cli.hash_password") as mock_hash:
+            result = runner.invoke(app, ["user", "create", "--from-file", str(users)])
+        assert result.exit_code == 1
+        assert "Error: line 3: missing 'password'" in result.output
+        mock_hash.assert_not_called()
+
+        tokens = tmp_path / "tokens.jsonl"
+        tokens.write_text('["bob", "T1"]\n')
+        result = runner.invoke(app, ["token", "create", "--from-file", str(tokens)])
+        assert result.exit_code == 1
+        assert "Error: line 1: expected a JSON object" in result.output
+
+        tokens.write_text('{"owner": "bob"}\n')
+        result = runner.invoke(app, ["token", "create", "--from-file", str(tokens)])
+        assert result.exit_code == 1
+        assert "Error: line 1: missing 'name'" in result.output
+
+    def test_create_commands_require_arguments(self):
+        result = runner.invoke(app, ["user", "create"])
+        assert result.exit_code == 1
+        result = runner.invoke(app, ["token", "create", "--owner", "bob"])
+        assert result.exit_code == 1
+        result = runner.invoke(app, ["user", "create", "--from-file", "missing.jsonl"])
+        assert result.exit_code == 1
+        assert "File not found" in result.output
+
     def test_cli_token_commands_coverage(self):
         # 1. token create with expiry
         result = runner.invoke(app, ["token", "create", "--owner", "alice", "--name", "T1", "--expires-days", "7"])
@@ -4,7 +4,7 @@ import gradio_chat_agent.app as app
 
 def test_app_respects_env_vars():
     with patch("gradio_chat_agent.app.SQLStateRepository"):
-        with patch("gradio_chat_agent.app.OpenAIAgentAdapter"):
+        with patch("gradio_chat_agent.app.get_openai_adapter"):
             with patch("gradio_chat_agent.app.create_ui"):
                 with patch("uvicorn.run") as mock_run:
                     with patch("gradio.mount_gradio_app"):
@@ -20,7 +20,7 @@ def test_app_respects_env_vars():
 
 def test_app_uses_defaults():
     with patch("gradio_chat_agent.app.SQLStateRepository"):
-        with patch("gradio_chat_agent.app.OpenAIAgentAdapter"):
+        with patch("gradio_chat_agent.app.get_openai_adapter"):
             with patch("gradio_chat_agent.app.create_ui"):
                 with patch("uvicorn.run") as mock_run:
                     with patch("gradio.mount_gradio_app"):
@@ -6,6 +6,7 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+from gradio_chat_agent.execution.authority import compile_approval_rules
 from gradio_chat_agent.execution.engine import ExecutionEngine
 from gradio_chat_agent.models.action import (
     ActionDeclaration,
@@ -26,6 +27,7 @@ from gradio_chat_agent.models.enums import (
     ExecutionStatus,
     IntentType,
 )
+from gradio_chat_agent.models.execution_result import ExecutionResult
 from gradio_chat_agent.models.intent import ChatIntent, IntentMedia
 from gradio_chat_agent.models.plan import ExecutionPlan
 from gradio_chat_agent.models.state_snapshot import StateSnapshot
@@ -330,6 +332,23 @@ class TestEngine:
         assert len(results) == 1
         assert results[0].status == ExecutionStatus.REJECTED
 
+    def test_execute_plan_tolerates_audit_write_errors(self, setup):
+        engine, _, repo, pid = setup
+        repo.save_execution = MagicMock(side_effect=RuntimeError("DB down"))
+
+        plan = ExecutionPlan(
+            plan_id="p1",
+            steps=[
+                ChatIntent(type=IntentType.ACTION_CALL, request_id="r1", action_id="missing.action"),
+            ],
+        )
+        results = engine.execute_plan(pid, plan, user_roles=["admin"])
+
+        # The rejection is still returned even though logging it failed
+        repo.save_execution.assert_called_once()
+        assert len(results) == 1
+        assert results[0].status == ExecutionStatus.REJECTED
+
     def test_revert_to_snapshot(self, setup):
         engine, _, repo, pid = setup
         
@@ -346,6 +365,28 @@ class TestEngine:
         latest = repo.get_latest_snapshot(pid)
         assert latest.components == {"comp": {"foo": "bar"}}
 
+    def test_simulated_plan_reads_usage_once(self, setup):
+        engine, _, repo, pid = setup
+        repo.set_project_limits(pid, {"limits": {"rate": {"per_minute": 10}, "budget": {"daily": 100.0}}})
+        steps = [
+            ChatIntent(type=IntentType.ACTION_CALL, request_id=f"sim{i}", action_id="demo.counter.set", inputs={"value": i})
+            for i in range(3)
+        ]
+        plan = ExecutionPlan(plan_id="p-sim", steps=steps)
+
+        with patch.object(repo, "get_usage_snapshot", wraps=repo.get_usage_snapshot) as mock_usage:
+            results = engine.execute_plan(pid, plan, user_roles=["admin"], simulate=True)
+            counter_reads = [c for c in mock_usage.call_args_list if c.kwargs.get("counters", True)]
+            assert len(counter_reads) == 1
+        assert [r.status for r in results] == [ExecutionStatus.SUCCESS] * 3
+        assert getattr(engine._plan_usage, "snapshots", None) is None
+
+        # Real plans still read the counters for every step
+        with patch.object(repo, "get_usage_snapshot", wraps=repo.get_usage_snapshot) as mock_usage:
+            engine.execute_plan(pid, plan, user_roles=["admin"])
+            counter_reads = [c for c in mock_usage.call_args_list if c.kwargs.get("counters", True)]
+            assert len(counter_reads) == 3
+
     def test_execute_plan_limits(self, setup):
         engine, _, _, pid = setup
         
@@ -443,6 +484,143 @@ class TestEngine:
         assert res.status == ExecutionStatus.FAILED
         assert res.error.code == "invariant_violation"
 
+    def test_invariants_skipped_for_untouched_components(self, setup):
+        engine, registry, repo, pid = setup
+        registry.register_component(
+            ComponentDeclaration(
+                component_id="other.comp", title="O", description="O", state_schema={},
+                permissions=ComponentPermissions(readable=True),
+                invariants=[ComponentInvariant(description="Positive", expr="state['other.comp']['v'] > 0")]
+            )
+        )
+        repo.save_snapshot(pid, StateSnapshot(snapshot_id="s0", components={"other.comp": {"v": -1}}))
+
+        # The violating component is not touched by the action, so its invariant is not re-checked
+        res = engine.execute_intent(pid, ChatIntent(type=IntentType.ACTION_CALL, request_id="r1", action_id="demo.counter.set", inputs={"value": 1}), user_roles=["admin"])
+        assert res.status == ExecutionStatus.SUCCESS
+
+    def test_invariants_skipped_for_noop_handler(self, setup):
+        engine, registry, repo, pid = setup
+        registry.register_component(
+            ComponentDeclaration(
+                component_id="noop.comp", title="N", description="N", state_schema={},
+                permissions=ComponentPermissions(readable=True),
+                # Dynamic access: the reference analysis cannot skip this one
+                invariants=[ComponentInvariant(description="Never", expr="len(state) < 0")]
+            )
+        )
+        registry.register_action(
+            ActionDeclaration(
+                action_id="noop.echo", title="E", description="E", targets=["noop.comp"],
+                input_schema={}, permission=ActionPermission(confirmation_required=False, risk=ActionRisk.LOW, visibility=ActionVisibility.USER)
+            ),
+            handler=lambda i, s: (s.components, [], "Echo")
+        )
+
+        res = engine.execute_intent(pid, ChatIntent(type=IntentType.ACTION_CALL, request_id="r1", action_id="noop.echo"), user_roles=["admin"])
+        assert res.status == ExecutionStatus.SUCCESS
+        assert res.state_diff == []
+
+    def test_state_references(self):
+        from gradio_chat_agent.execution.expressions import state_references
+
+        assert state_references("state['a']['v'] > 0 and state['b'] is not None") == frozenset({"a", "b"})
+        assert state_references("1 + 1") == frozenset()
+        # Dynamic access makes dependencies unknown
+        assert state_references("state[key] > 0") is None
+        assert state_references("len(state) > 0") is None
+        assert state_references("state[") is None
+
+    def test_policy_cache_ttl(self, setup):
+        from gradio_chat_agent.execution.engine import EngineConfig
+
+        _, registry, repo, pid = setup
+        engine = ExecutionEngine(registry, repo, EngineConfig(policy_cache_ttl=60))
+
+        def intent(rid):
+            return ChatIntent(type=IntentType.ACTION_CALL, request_id=rid, action_id="demo.counter.set", inputs={"value": 1})
+
+        with patch.object(repo, "get_project_limits", wraps=repo.get_project_limits) as spy:
+            assert engine.execute_intent(pid, intent("r1"), user_roles=["admin"]).status == ExecutionStatus.SUCCESS
+            assert engine.execute_intent(pid, intent("r2"), user_roles=["admin"]).status == ExecutionStatus.SUCCESS
+            assert spy.call_count == 1
+
+        # Policy changes apply once the cache is invalidated
+        repo.create_project(pid, "P")
+        repo.archive_project(pid)
+        assert engine.execute_intent(pid, intent("r3"), user_roles=["admin"]).status == ExecutionStatus.SUCCESS
+        engine.invalidate_policy(pid)
+        res = engine.execute_intent(pid, intent("r4"), user_roles=["admin"])
+        assert res.error.code == "project_archived"
+
+    def test_cached_policy_reuses_compiled_approvals(self, setup):
+        from gradio_chat_agent.execution.engine import EngineConfig
+
+        _, registry, repo, pid = setup
+        repo.set_project_limits(pid, {"approvals": [{"min_cost": 0, "required_role": "auditor"}]})
+        engine = ExecutionEngine(registry, repo, EngineConfig(policy_cache_ttl=60))
+        intent = ChatIntent(type=IntentType.ACTION_CALL, request_id="r1", action_id="demo.counter.set", inputs={"value": 1})
+
+        with patch(
+            "gradio_chat_agent.execution.engine.compile_approval_rules",
+            wraps=compile_approval_rules,
+        ) as spy:
+            res = engine.execute_intent(pid, intent, user_roles=["admin"])
+            res2 = engine.execute_intent(pid, intent.model_copy(update={"request_id": "r2"}), user_roles=["admin", "auditor"])
+            # Compiled once, when the policy was cached
+            assert spy.call_count == 1
+
+        assert res.status == ExecutionStatus.PENDING_APPROVAL
+        assert "auditor" in res.message
+        assert res2.status == ExecutionStatus.SUCCESS
+
+    def test_trust_handler_diff(self, setup):
+        from gradio_chat_agent.execution.engine import EngineConfig
+        from gradio_chat_agent.models.enums import StateDiffOp
+        from gradio_chat_agent.models.execution_result import StateDiffEntry
+
+        _, registry, repo, pid = setup
+        handler_diff = [StateDiffEntry(path="demo.counter.value", op=StateDiffOp.REPLACE, value=7)]
+        registry.register_action(
+            registry.get_action("demo.counter.set"),
+            lambda i, s: ({"demo.counter": {"value": 7}}, handler_diff, "ok"),
+        )
+        intent = ChatIntent(type=IntentType.ACTION_CALL, request_id="r1", action_id="demo.counter.set", inputs={"value": 7})
+
+        engine = ExecutionEngine(registry, repo, EngineConfig(trust_handler_diff=True))
+        with patch("gradio_chat_agent.execution.engine.compute_state_diff") as mock_diff:
+            res = engine.execute_intent(pid, intent, user_roles=["admin"])
+            mock_diff.assert_not_called()
+        assert res.status == ExecutionStatus.SUCCESS
+        assert res.state_diff == handler_diff
+
+    def test_budget_check_is_atomic_under_project_lock(self, setup):
+        import threading
+
+        engine, registry, repo, pid = setup
+        action = registry.get_action("demo.counter.set")
+        repo.set_project_limits(pid, {"limits": {"budget": {"daily": action.cost}}})
+
+        def slow_handler(inputs, snapshot):
+            time.sleep(0.05)
+            return {"demo.counter": {"value": inputs["value"]}}, [], "ok"
+
+        registry.register_action(action, slow_handler)
+        results = []
+
+        def run(rid):
+            intent = ChatIntent(type=IntentType.ACTION_CALL, request_id=rid, action_id="demo.counter.set", inputs={"value": 1})
+            results.append(engine.execute_intent(pid, intent, user_roles=["admin"]))
+
+        threads = [threading.Thread(target=run, args=(f"r{i}",)) for i in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # Only one execution fits in the budget, even when both start together
+        assert sorted(r.status for r in results) == ["rejected", "success"]
+
     def test_execution_windows(self, setup):
         engine, _, repo, pid = setup
         repo.set_project_limits(pid, {"execution_windows": {"allowed": [{"days": ["never"], "hours": ["00:00", "23:59"]}]}})
@@ -496,6 +674,121 @@ class TestEngine:
         # List comprehensions are forbidden
         with pytest.raises(ValueError, match="Forbidden expression node: ListComp"):
             engine._safe_eval("[x for x in d]", {"d": [1]})
+        # Nested forbidden nodes are found too
+        with pytest.raises(ValueError, match="Forbidden expression node: Lambda"):
+            engine._safe_eval("d[0] + (lambda: 1)", {"d": [1]})
+
+    def test_engine_safe_eval_blocks_sandbox_escapes(self, setup):
+        engine, _, _, _ = setup
+        with pytest.raises(ValueError, match="Forbidden attribute access: __subclasses__"):
+            engine._safe_eval("().__class__.__bases__[0].__subclasses__()", {})
+        with pytest.raises(ValueError, match="Forbidden attribute access: format"):
+            engine._safe_eval("'{0.__class__}'.format(d)", {"d": 1})
+        with pytest.raises(ValueError, match="Forbidden name: __builtins__"):
+            engine._safe_eval("__builtins__", {})
+        # Ordinary attribute access still works
+        assert engine._safe_eval("d.real == 1", {"d": 1}) is True
+
+    def test_engine_safe_eval_caches_compiled_expr(self, setup):
+        from gradio_chat_agent.execution.expressions import compile_safe_expr
+
+        engine, _, _, _ = setup
+        compile_safe_expr.cache_clear()
+        assert engine._safe_eval("x * 2 > 3", {"x": 1}) is False
+        assert engine._safe_eval("x * 2 > 3", {"x": 5}) is True
+        info = compile_safe_expr.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_safe_eval_globals_are_isolated(self, setup):
+        from gradio_chat_agent.execution.expressions import _EVAL_GLOBALS
+
+        engine, _, _, _ = setup
+        assert engine._safe_eval("x + 1", {"x": 1}) == 2
+        # The shared globals never pick up names from an evaluation context
+        assert _EVAL_GLOBALS == {"__builtins__": {}}
+        with pytest.raises(NameError):
+            engine._safe_eval("x", {})
+
+    def test_project_lock_is_shared_across_threads(self, setup):
+        import threading
+
+        engine, _, _, _ = setup
+        locks = []
+        threads = [
+            threading.Thread(target=lambda: locks.append(engine._get_project_lock("p-shared")))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert all(lock is locks[0] for lock in locks)
+        assert engine._get_project_lock("p-other") is not locks[0]
+
+    def test_handler_receives_unvalidated_clone(self, setup):
+        engine, registry, _, pid = setup
+        clone = {"demo.counter": {"value": 0}}
+        seen = {}
+
+        def handler(inputs, snapshot):
+            seen["snapshot"] = snapshot
+            return snapshot.components, [], "ok"
+
+        registry.register_action(registry.get_action("demo.counter.set"), handler)
+        intent = ChatIntent(
+            type=IntentType.ACTION_CALL, request_id="r-clone",
+            action_id="demo.counter.set", inputs={"value": 1}
+        )
+        with patch("gradio_chat_agent.execution.engine.fast_clone", return_value=clone):
+            res = engine.execute_intent(pid, intent, user_roles=["admin"])
+
+        assert res.status == ExecutionStatus.SUCCESS
+        assert isinstance(seen["snapshot"], StateSnapshot)
+        assert seen["snapshot"].components is clone
+
+    def test_handler_returning_malformed_state_fails(self, setup):
+        engine, registry, repo, pid = setup
+        registry.register_action(
+            registry.get_action("demo.counter.set"), lambda inputs, snapshot: ({"demo.counter": 5}, [], "ok")
+        )
+        intent = ChatIntent(
+            type=IntentType.ACTION_CALL, request_id="r-bad",
+            action_id="demo.counter.set", inputs={"value": 1}
+        )
+        res = engine.execute_intent(pid, intent, user_roles=["admin"])
+
+        assert res.status == ExecutionStatus.FAILED
+        assert "must map component IDs to dicts" in res.message
+        assert repo.get_latest_snapshot(pid) is None
+
+    def test_pure_handler_shares_live_state(self, setup):
+        from gradio_chat_agent.registry.abstract import pure_handler
+
+        engine, registry, repo, pid = setup
+        repo.save_snapshot(pid, StateSnapshot(snapshot_id="s0", components={"demo.counter": {"value": 0}}))
+        seen = {}
+
+        @pure_handler
+        def handler(inputs, snapshot):
+            seen["components"] = snapshot.components
+            new_comps = snapshot.components.copy()
+            new_comps["demo.counter"] = {"value": inputs["value"]}
+            return new_comps, [], "ok"
+
+        registry.register_action(registry.get_action("demo.counter.set"), handler)
+        intent = ChatIntent(
+            type=IntentType.ACTION_CALL, request_id="r-pure",
+            action_id="demo.counter.set", inputs={"value": 1}
+        )
+        with patch("gradio_chat_agent.execution.engine.fast_clone") as mock_clone:
+            res = engine.execute_intent(pid, intent, user_roles=["admin"])
+            mock_clone.assert_not_called()
+
+        assert res.status == ExecutionStatus.SUCCESS
+        assert seen["components"] == {"demo.counter": {"value": 0}}
+        assert repo.get_snapshot("s0").components == {"demo.counter": {"value": 0}}
+        assert repo.get_latest_snapshot(pid).components == {"demo.counter": {"value": 1}}
 
     def test_hourly_rate_limit(self, setup):
         engine, _, repo, pid = setup
@@ -540,9 +833,9 @@ class TestEngine:
             intent = ChatIntent(type=IntentType.ACTION_CALL, request_id="r1", action_id="demo.counter.set", inputs={"value": 1})
             # Force a handler failure by mocking the handler ITSELF
             mock_handler = MagicMock(side_effect=Exception("Handler Fail"))
-            with patch.object(engine.registry, 'get_handler', return_value=mock_handler):
-                res = engine.execute_intent(pid, intent, user_roles=["admin"])
-                assert res.status == ExecutionStatus.FAILED
+            engine.registry.register_action(engine.registry.get_action("demo.counter.set"), mock_handler)
+            res = engine.execute_intent(pid, intent, user_roles=["admin"])
+            assert res.status == ExecutionStatus.FAILED
 
     def test_revert_to_snapshot_missing_current(self, setup):
         engine, _, repo, pid = setup
@@ -601,6 +894,21 @@ class TestEngine:
         assert res.status == ExecutionStatus.FAILED
         assert res.error.code == "invariant_error"
 
+    def test_simulated_memory_action_results_are_independent(self, setup):
+        engine, _, _, pid = setup
+        results = [
+            engine.execute_intent(
+                pid,
+                ChatIntent(type=IntentType.ACTION_CALL, request_id=rid, action_id=aid, inputs={"key": "k"}),
+                user_id="u1", simulate=True, user_roles=["admin"],
+            )
+            for rid, aid in [("s1", "memory.remember"), ("s2", "memory.forget")]
+        ]
+        assert [(r.request_id, r.action_id) for r in results] == [("s1", "memory.remember"), ("s2", "memory.forget")]
+        assert all(r.simulated and r.user_id == "u1" for r in results)
+        results[0].metadata["x"] = 1
+        assert results[1].metadata == {}
+
     def test_execute_missing_action_id_intent(self, setup):
         engine, _, _, pid = setup
         intent = ChatIntent(type=IntentType.ACTION_CALL, request_id="r1")
@@ -628,12 +936,26 @@ class TestEngine:
             action_id="no.handler", title="N", description="N", targets=["demo.counter"],
             input_schema={}, permission=ActionPermission(confirmation_required=False, risk=ActionRisk.LOW, visibility=ActionVisibility.USER)
         )
-        registry._actions["no.handler"] = action
+        registry.register_action(action, None)
         intent = ChatIntent(type=IntentType.ACTION_CALL, request_id="r1", action_id="no.handler")
         res = engine.execute_intent(pid, intent, user_roles=["admin"])
         assert res.status == ExecutionStatus.FAILED
         assert "No handler registered" in res.message
 
+    def test_no_handler_checked_before_schema(self, setup):
+        engine, registry, _, pid = setup
+        action = ActionDeclaration(
+            action_id="no.handler", title="N", description="N", targets=["demo.counter"],
+            input_schema={"type": "object", "required": ["v"]},
+            permission=ActionPermission(confirmation_required=False, risk=ActionRisk.LOW, visibility=ActionVisibility.USER)
+        )
+        registry.register_action(action, None)
+        intent = ChatIntent(type=IntentType.ACTION_CALL, request_id="r1", action_id="no.handler", inputs={})
+        res = engine.execute_intent(pid, intent, user_roles=["admin"])
+        # The empty inputs violate the schema, but the handler check runs first
+        assert res.status == ExecutionStatus.FAILED
+        assert "No handler registered" in res.message
+
     def test_media_hashing(self, setup):
         engine, _, _, pid = setup
         media = IntentMedia(type="image", data="some-data", mime_type="image/png")
@@ -652,6 +974,20 @@ class TestEngine:
         windows = [{"days": [day], "hours": ["00:00", "23:59"]}]
         assert engine._is_within_execution_window(windows) is True
 
+    def test_is_within_execution_window_minutes(self, setup):
+        from datetime import datetime, timezone
+
+        engine, _, _, _ = setup
+        fixed = datetime(2024, 1, 1, 9, 30, tzinfo=timezone.utc)  # Monday
+        with patch("gradio_chat_agent.execution.engine.datetime") as mock_dt:
+            mock_dt.now.return_value = fixed
+            assert engine._is_within_execution_window([{"days": ["mon"], "hours": ["9:00", "10:00"]}]) is True
+            assert engine._is_within_execution_window([{"days": ["mon"], "hours": ["09:31", "10:00"]}]) is False
+            assert engine._is_within_execution_window([{"days": ["tue"], "hours": ["00:00", "23:59"]}]) is False
+            # Malformed windows never match
+            assert engine._is_within_execution_window([{"days": ["mon"], "hours": ["bad", "10:00"]}]) is False
+            assert engine._is_within_execution_window([{"days": ["mon"], "hours": ["09:00"]}]) is False
+
     def test_project_lock_distributed_retry(self, setup):
         engine, _, _, _ = setup
         repo = MagicMock()
@@ -10,7 +10,7 @@ def test_health_endpoint_success():
         mock_repo = mock_repo_class.return_value
         mock_repo.check_health.return_value = True
         
-        with patch("gradio_chat_agent.app.OpenAIAgentAdapter"):
+        with patch("gradio_chat_agent.app.get_openai_adapter"):
             with patch("gradio_chat_agent.app.create_ui"):
                 with patch("uvicorn.run"):
                     # We need to capture the 'app' created inside main()
@@ -66,6 +66,8 @@ def test_app_health_endpoint_failure():
         def save_snapshot(self, pid, s): pass
         def save_execution(self, pid, r): pass
         def get_execution_history(self, pid, l=100): pass
+        def get_latest_execution_seq(self, pid): pass
+        def get_successful_executions_since(self, pid, seq, limit=100): pass
         def get_session_facts(self, pid, uid): pass
         def save_session_fact(self, pid, uid, k, v): pass
         def delete_session_fact(self, pid, uid, k): pass
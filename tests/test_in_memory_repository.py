@@ -145,6 +145,7 @@ class TestInMemoryRepository:
         assert repo.get_daily_budget_usage(pid) == 10.0
         # Should count BOTH success and failure in the last hour
         assert repo.count_recent_executions(pid, 60) == 2
+        assert repo.count_recent_executions_by_status(pid, 60) == {"success": 1, "failed": 1}
 
     def test_schedule_management(self):
         repo = InMemoryStateRepository()
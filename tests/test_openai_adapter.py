@@ -1,6 +1,6 @@
 import pytest
-from unittest.mock import MagicMock, patch
-from gradio_chat_agent.chat.openai_adapter import OpenAIAgentAdapter
+from unittest.mock import AsyncMock, MagicMock, patch
+from gradio_chat_agent.chat.openai_adapter import OpenAIAgentAdapter, get_adapter
 from gradio_chat_agent.models.intent import ChatIntent
 from gradio_chat_agent.models.enums import IntentType
 from gradio_chat_agent.models.plan import ExecutionPlan
@@ -17,6 +17,13 @@ class TestOpenAIAgentAdapter:
             adapter = OpenAIAgentAdapter(model_name="test-model")
             assert adapter.model_name == "test-model"
 
+    def test_client_uses_sdk_retries_and_timeout(self):
+        with patch("gradio_chat_agent.chat.openai_adapter.OpenAI") as mock_openai:
+            OpenAIAgentAdapter()
+        _, kwargs = mock_openai.call_args
+        assert kwargs["max_retries"] == 5
+        assert kwargs["timeout"].connect == 5.0
+
     def test_registry_to_tools(self, adapter):
         registry = {
             "action.1": {
@@ -217,6 +224,11 @@ class TestOpenAIAgentAdapter:
         res = adapter.message_to_intent_or_plan("do", [], {}, {}, {"real.action": {}})
         assert res.action_id == "real.action"
         assert adapter.client.chat.completions.create.call_count == 2
+        _, kwargs = adapter.client.chat.completions.create.call_args
+        retry_call = kwargs["messages"][-2]["tool_calls"][0]
+        assert retry_call["id"] == "c1"
+        assert retry_call["function"]["name"] == "ghost.action"
+        mock_msg_invalid.model_dump.assert_not_called()
 
     def test_openai_multimodal_payload(self, adapter):
         mock_choice = MagicMock()
@@ -264,4 +276,289 @@ class TestOpenAIAgentAdapter:
         mock_msg.tool_calls = [mock_tc1, mock_tc2]
         res = adapter.message_to_intent_or_plan("hi", [], {}, {}, {"a.1": {}, "a.2": {}})
         assert isinstance(res, ExecutionPlan)
-        assert len(res.steps) == 2
\ No newline at end of file
+        assert len(res.steps) == 2
+
+    def test_system_prompt_keeps_volatile_context_last(self, adapter):
+        registry = {"comp.b": {"description": "B"}, "comp.a": {"description": "A"}}
+        prompt = adapter._construct_system_prompt(
+            registry, {"comp.a": {"v": 1}}, "autonomous", {"k": "v"}
+        )
+
+        assert prompt.startswith(adapter._construct_prompt_prefix(registry))
+        assert prompt.index("COMPONENT REGISTRY") < prompt.index("SESSION MEMORY")
+        assert prompt.index("SESSION MEMORY") < prompt.index("CURRENT STATE SNAPSHOT")
+        assert prompt.rstrip().endswith("EXECUTION MODE: AUTONOMOUS")
+        # Registry keys are sorted so the prefix is deterministic
+        assert prompt.index('"comp.a"') < prompt.index('"comp.b"')
+
+    def test_prompt_cache_key_stable_across_turns(self, adapter):
+        mock_msg = MagicMock(tool_calls=None, content="ok", role="assistant")
+        mock_completion = MagicMock(choices=[MagicMock(message=mock_msg)])
+        mock_completion.usage.total_tokens = 5
+        adapter.client.chat.completions.create.return_value = mock_completion
+        registry = {"comp.1": {"description": "d"}}
+
+        adapter.message_to_intent_or_plan("a", [], {"comp.1": {"v": 1}}, registry, {})
+        _, first = adapter.client.chat.completions.create.call_args
+        adapter.message_to_intent_or_plan(
+            "b", [], {"comp.1": {"v": 2}}, registry, {}, execution_mode="interactive"
+        )
+        _, second = adapter.client.chat.completions.create.call_args
+
+        assert first["prompt_cache_key"] == second["prompt_cache_key"]
+
+    def test_get_adapter_is_cached_per_configuration(self):
+        with patch("gradio_chat_agent.chat.openai_adapter.OpenAI"):
+            first = get_adapter("m1", api_key="k", base_url="http://a")
+            again = get_adapter("m1", api_key="k", base_url="http://a")
+            other = get_adapter("m1", api_key="k", base_url="http://b")
+
+        assert first is again
+        assert first is not other
+
+
+def _stream_chunk(tool_calls=None, content=None, finish_reason=None, usage=None):
+    delta = MagicMock(content=content, tool_calls=tool_calls)
+    choice = MagicMock(delta=delta, finish_reason=finish_reason)
+    return MagicMock(choices=[choice], usage=usage)
+
+
+def _tool_delta(index, name=None, arguments=None, call_id=None):
+    tc = MagicMock(index=index, id=call_id)
+    tc.function.name = name
+    tc.function.arguments = arguments
+    return tc
+
+
+class _FakeStream:
+    """Minimal stand-in for the SDK's AsyncStream."""
+
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+        self.closed = False
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+        if self.error is not None:
+            raise self.error
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+
+def _async_stream(chunks, error=None):
+    return _FakeStream(chunks, error)
+
+
+class TestOpenAIStreaming:
+    @pytest.fixture
+    def streaming_adapter(self):
+        with patch("gradio_chat_agent.chat.openai_adapter.OpenAI"), patch(
+            "gradio_chat_agent.chat.openai_adapter.AsyncOpenAI"
+        ) as mock_async:
+            adapter = OpenAIAgentAdapter()
+            client = mock_async.return_value
+            client.chat.completions.create = AsyncMock()
+            yield adapter, client
+
+    async def _collect(self, adapter, registry):
+        return [
+            i async for i in adapter.astream_intents("do", [], {}, {}, registry)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_intents_in_order(self, streaming_adapter):
+        adapter, client = streaming_adapter
+        client.chat.completions.create.return_value = _async_stream([
+            _stream_chunk([_tool_delta(0, "a.1", '{"x"', "c1")]),
+            _stream_chunk([_tool_delta(0, None, ': 1}')]),
+            _stream_chunk([_tool_delta(1, "a.2", "{}", "c2")]),
+            _stream_chunk(finish_reason="tool_calls"),
+            MagicMock(choices=[], usage=MagicMock(total_tokens=7)),
+        ])
+
+        intents = await self._collect(adapter, {"a.1": {}, "a.2": {}})
+
+        assert [i.action_id for i in intents] == ["a.1", "a.2"]
+        assert intents[0].inputs == {"x": 1}
+        _, kwargs = client.chat.completions.create.call_args
+        assert kwargs["stream"] is True
+        assert kwargs["stream_options"] == {"include_usage": True}
+
+    @pytest.mark.asyncio
+    async def test_stream_text_only_becomes_clarification(self, streaming_adapter):
+        adapter, client = streaming_adapter
+        client.chat.completions.create.return_value = _async_stream([
+            _stream_chunk(content="What "),
+            _stream_chunk(content="do you mean?", finish_reason="stop"),
+        ])
+
+        intents = await self._collect(adapter, {})
+
+        assert len(intents) == 1
+        assert intents[0].type == IntentType.CLARIFICATION_REQUEST
+        assert intents[0].question == "What do you mean?"
+
+    @pytest.mark.asyncio
+    async def test_stream_retries_hallucinated_tool(self, streaming_adapter):
+        adapter, client = streaming_adapter
+        client.chat.completions.create.side_effect = [
+            _async_stream([
+                _stream_chunk([_tool_delta(0, "ghost.action", "{}", "c1")]),
+                _stream_chunk(finish_reason="tool_calls"),
+            ]),
+            _async_stream([
+                _stream_chunk([_tool_delta(0, "real.action", "{}", "c2")]),
+                _stream_chunk(finish_reason="tool_calls"),
+            ]),
+        ]
+
+        intents = await self._collect(adapter, {"real.action": {}})
+
+        assert [i.action_id for i in intents] == ["real.action"]
+        assert client.chat.completions.create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_error_yields_clarification(self, streaming_adapter):
+        adapter, client = streaming_adapter
+        client.chat.completions.create.side_effect = Exception("API Down")
+
+        intents = await self._collect(adapter, {})
+
+        assert intents[0].type == IntentType.CLARIFICATION_REQUEST
+        assert "Error communicating" in intents[0].question
+
+    @pytest.mark.asyncio
+    async def test_stream_is_closed_on_early_return(self, streaming_adapter):
+        adapter, client = streaming_adapter
+        stream = _async_stream([
+            _stream_chunk([_tool_delta(0, "ask_clarification", '{"question": "?"}', "c1")]),
+            _stream_chunk([_tool_delta(1, "a.1", "{}", "c2")]),
+            _stream_chunk(finish_reason="tool_calls"),
+        ])
+        client.chat.completions.create.return_value = stream
+
+        intents = await self._collect(adapter, {"a.1": {}})
+
+        assert [i.type for i in intents] == [IntentType.CLARIFICATION_REQUEST]
+        assert stream.closed
+
+    @pytest.mark.asyncio
+    async def test_stream_error_mid_stream_yields_clarification(self, streaming_adapter):
+        adapter, client = streaming_adapter
+        stream = _async_stream(
+            [_stream_chunk(content="Working")], error=ValueError("broken chunk")
+        )
+        client.chat.completions.create.return_value = stream
+
+        intents = await self._collect(adapter, {})
+
+        assert len(intents) == 1
+        assert "Error communicating" in intents[0].question
+        assert stream.closed
+
+    @pytest.mark.asyncio
+    async def test_transient_mid_stream_error_is_retried(self, streaming_adapter):
+        import httpx
+        from openai import APIConnectionError
+
+        adapter, client = streaming_adapter
+        error = APIConnectionError(request=httpx.Request("POST", "http://test"))
+        client.chat.completions.create.side_effect = [
+            _async_stream([_stream_chunk(content="partial")], error=error),
+            _async_stream([
+                _stream_chunk([_tool_delta(0, "a.1", "{}", "c1")]),
+                _stream_chunk(finish_reason="tool_calls"),
+            ]),
+        ]
+
+        with patch(
+            "gradio_chat_agent.chat.openai_adapter.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            intents = await self._collect(adapter, {"a.1": {}})
+
+        assert [i.action_id for i in intents] == ["a.1"]
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_keeps_valid_calls_when_retries_run_out(self, streaming_adapter):
+        adapter, client = streaming_adapter
+        client.chat.completions.create.side_effect = [
+            _async_stream([
+                _stream_chunk([_tool_delta(0, "ghost.action", "{}", f"g{i}")]),
+                _stream_chunk([_tool_delta(1, "a.1", "{}", f"v{i}")]),
+                _stream_chunk(finish_reason="tool_calls"),
+            ])
+            for i in range(3)
+        ]
+
+        intents = await self._collect(adapter, {"a.1": {}})
+
+        # Same as the blocking path: the last attempt's calls become intents
+        assert [i.action_id for i in intents] == ["ghost.action", "a.1"]
+        assert client.chat.completions.create.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_abatch_messages_preserves_order(self, streaming_adapter):
+        adapter, client = streaming_adapter
+        client.chat.completions.create.side_effect = [
+            _async_stream([
+                _stream_chunk([_tool_delta(0, name, "{}", name)]),
+                _stream_chunk(finish_reason="tool_calls"),
+            ])
+            for name in ("a.1", "a.2")
+        ]
+
+        results = await adapter.abatch_messages(
+            ["first", "second"], [], {}, {}, {"a.1": {}, "a.2": {}}
+        )
+
+        assert [r.action_id for r in results] == ["a.1", "a.2"]
+
+    @pytest.mark.asyncio
+    async def test_abatch_messages_isolates_failures(self, streaming_adapter):
+        adapter, _ = streaming_adapter
+
+        async def translate(message, *args, **kwargs):
+            if message == "bad":
+                raise RuntimeError("boom")
+            return ChatIntent(type=IntentType.ACTION_CALL, request_id=message, action_id="a.1")
+
+        with patch.object(adapter, "amessage_to_intent_or_plan", side_effect=translate):
+            results = await adapter.abatch_messages(["first", "bad", "last"], [], {}, {}, {"a.1": {}})
+
+        assert [r.request_id for r in (results[0], results[2])] == ["first", "last"]
+        assert results[1].type == IntentType.CLARIFICATION_REQUEST
+        assert "boom" in results[1].question
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_is_retried_with_backoff(self, streaming_adapter):
+        import httpx
+        from openai import RateLimitError
+
+        adapter, client = streaming_adapter
+        response = httpx.Response(
+            429, request=httpx.Request("POST", "http://test")
+        )
+        client.chat.completions.create.side_effect = [
+            RateLimitError("slow down", response=response, body=None),
+            _async_stream([_stream_chunk(content="ok", finish_reason="stop")]),
+        ]
+
+        with patch(
+            "gradio_chat_agent.chat.openai_adapter.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            result = await adapter.amessage_to_intent_or_plan(
+                "hi", [], {}, {}, {}
+            )
+
+        assert result.question == "ok"
+        mock_sleep.assert_awaited_once()
+        assert client.chat.completions.create.call_count == 2
@@ -1,11 +1,12 @@
 import pytest
+from unittest.mock import patch
 from gradio_chat_agent.api.endpoints import ApiEndpoints
 from gradio_chat_agent.execution.engine import ExecutionEngine
 from gradio_chat_agent.persistence.in_memory import InMemoryStateRepository
 from gradio_chat_agent.persistence.sql_repository import SQLStateRepository
 from gradio_chat_agent.registry.in_memory import InMemoryRegistry
 from gradio_chat_agent.models.intent import ChatIntent
-from gradio_chat_agent.models.enums import IntentType, ExecutionStatus, ActionRisk, ActionVisibility
+from gradio_chat_agent.models.enums import IntentType, ExecutionStatus, ActionRisk, ActionVisibility, ProjectOp
 from gradio_chat_agent.models.action import ActionDeclaration, ActionPermission
 
 class TestOrgRollup:
@@ -81,3 +82,30 @@ class TestOrgRollup:
         res = api.api_org_rollup(user_id="alice")
         assert res["code"] == 1
         assert "Permission denied" in res["message"]
+
+    def test_rollup_cache(self, setup_in_memory):
+        _, engine, repo = setup_in_memory
+        api = ApiEndpoints(engine, rollup_cache_ttl=60.0)
+
+        with patch.object(repo, "get_org_rollup", wraps=repo.get_org_rollup) as mock_rollup:
+            first = api.api_org_rollup(user_id="admin")
+            assert api.api_org_rollup(user_id="admin") == first
+            assert mock_rollup.call_count == 1
+
+            # Creating a project changes the rollup, so it drops the cache
+            api.manage_project(ProjectOp.CREATE, name="New", project_id="p-new", user_id="admin")
+            res = api.api_org_rollup(user_id="admin")
+            assert mock_rollup.call_count == 2
+            assert "p-new" in res["data"]["projects"]
+
+            # The cache expires after its TTL
+            api._rollup_cache = (api._rollup_cache[0] - 61.0, api._rollup_cache[1])
+            api.api_org_rollup(user_id="admin")
+            assert mock_rollup.call_count == 3
+
+    def test_rollup_cache_disabled_by_default(self, setup_in_memory):
+        api, _, repo = setup_in_memory
+        with patch.object(repo, "get_org_rollup", wraps=repo.get_org_rollup) as mock_rollup:
+            api.api_org_rollup(user_id="admin")
+            api.api_org_rollup(user_id="admin")
+            assert mock_rollup.call_count == 2
@@ -8,7 +8,7 @@ class TestProductionApp:
     def test_create_app_returns_fastapi_instance(self):
         with (
             patch("gradio_chat_agent.app.SQLStateRepository"),
-            patch("gradio_chat_agent.app.OpenAIAgentAdapter"),
+            patch("gradio_chat_agent.app.get_openai_adapter"),
             patch("gradio_chat_agent.app.create_ui"),
             patch(
                 "gradio.mount_gradio_app",
@@ -23,7 +23,7 @@ class TestProductionApp:
     async def test_app_lifecycle_events(self):
         with (
             patch("gradio_chat_agent.app.SQLStateRepository"),
-            patch("gradio_chat_agent.app.OpenAIAgentAdapter"),
+            patch("gradio_chat_agent.app.get_openai_adapter"),
             patch("gradio_chat_agent.app.create_ui"),
             patch(
                 "gradio.mount_gradio_app",
@@ -1,12 +1,17 @@
+from unittest.mock import patch
+
 from gradio_chat_agent.models.action import (
     ActionDeclaration,
     ActionPermission,
+    ActionPrecondition,
 )
 from gradio_chat_agent.models.component import (
     ComponentDeclaration,
+    ComponentInvariant,
     ComponentPermissions,
 )
 from gradio_chat_agent.models.enums import ActionRisk, ActionVisibility
+from gradio_chat_agent.registry.abstract import Registry, pure_handler
 from gradio_chat_agent.registry.in_memory import InMemoryRegistry
 
 
@@ -46,3 +51,126 @@ class TestRegistry:
         assert registry.get_action("a1") == action
         assert registry.get_handler("a1") == handler
         assert len(registry.list_actions()) == 1
+
+    def test_checks_compiled_at_registration(self):
+        registry = InMemoryRegistry()
+        comp = ComponentDeclaration(
+            component_id="c1",
+            title="C1",
+            description="D1",
+            state_schema={},
+            permissions=ComponentPermissions(readable=True),
+            invariants=[
+                ComponentInvariant(description="ok", expr="state['c1'] >= 0"),
+                ComponentInvariant(description="bad", expr="[x for x in state]"),
+            ],
+        )
+        action = ActionDeclaration(
+            action_id="a1",
+            title="A1",
+            description="D1",
+            targets=["c1"],
+            input_schema={},
+            preconditions=[
+                ActionPrecondition(id="p1", description="P1", expr="inputs['v'] > 0")
+            ],
+            permission=ActionPermission(
+                confirmation_required=False,
+                risk=ActionRisk.LOW,
+                visibility=ActionVisibility.USER,
+            ),
+        )
+        registry.register_component(comp)
+        registry.register_action(action, lambda i, s: ({}, [], "ok"))
+
+        with patch("gradio_chat_agent.registry.in_memory.compile_checks") as mock_compile:
+            invariants = registry.get_compiled_invariants()
+            preconditions = registry.get_compiled_preconditions(action)
+            mock_compile.assert_not_called()
+
+        assert [(cid, inv.description) for cid, _, inv in invariants] == [("c1", "ok"), ("c1", "bad")]
+        # Forbidden expressions are kept with no code object
+        assert invariants[0][1] is not None
+        assert invariants[1][1] is None
+        assert len(preconditions) == 1
+        assert eval(preconditions[0][0], {"__builtins__": {}}, {"inputs": {"v": 1}}) is True
+
+    def test_input_validator_built_at_registration(self):
+        import jsonschema
+        import pytest
+
+        registry = InMemoryRegistry()
+
+        def make_action(action_id, schema):
+            return ActionDeclaration(
+                action_id=action_id,
+                title="A",
+                description="D",
+                targets=["c1"],
+                input_schema=schema,
+                permission=ActionPermission(
+                    confirmation_required=False,
+                    risk=ActionRisk.LOW,
+                    visibility=ActionVisibility.USER,
+                ),
+            )
+
+        action = make_action("a1", {"type": "object", "properties": {"v": {"type": "integer"}}})
+        registry.register_action(action, lambda i, s: ({}, [], "ok"))
+
+        with patch("gradio_chat_agent.registry.abstract.build_input_validator") as mock_build:
+            validator = registry.get_input_validator(action)
+            assert registry.get_input_validator(action) is validator
+            mock_build.assert_not_called()
+        assert list(validator.iter_errors({"v": 1})) == []
+        assert len(list(validator.iter_errors({"v": "x"}))) == 1
+
+        # Invalid schemas still surface when the validator is requested
+        broken = make_action("a2", {"type": "no-such-type"})
+        registry.register_action(broken, lambda i, s: ({}, [], "ok"))
+        with pytest.raises(jsonschema.SchemaError):
+            registry.get_input_validator(broken)
+
+    def test_compiled_action_bundled_at_registration(self):
+        registry = InMemoryRegistry()
+
+        def make_action(action_id, risk, confirm=False):
+            return ActionDeclaration(
+                action_id=action_id,
+                title="A",
+                description="D",
+                targets=["c1"],
+                input_schema={"type": "object"},
+                preconditions=[ActionPrecondition(id="p", description="P", expr="True")],
+                permission=ActionPermission(
+                    confirmation_required=confirm,
+                    risk=risk,
+                    visibility=ActionVisibility.USER,
+                ),
+            )
+
+        handler = pure_handler(lambda i, s: ({}, [], "ok"))
+        registry.register_action(make_action("a1@v1", ActionRisk.LOW), handler)
+        registry.register_action(make_action("a1@v2", ActionRisk.HIGH), None)
+
+        compiled = registry.get_compiled_action("a1@v1")
+        assert compiled.handler is handler
+        assert compiled.pure is True
+        assert compiled.high_risk is False
+        assert compiled.needs_confirmation is False
+        assert compiled.validator is registry.get_input_validator(compiled.action)
+        assert len(compiled.preconditions) == 1
+        assert compiled.preconditions[0][0] is not None
+
+        latest = registry.get_compiled_action("a1")
+        assert latest.action.action_id == "a1@v2"
+        assert latest.handler is None
+        assert latest.high_risk is True
+        assert latest.needs_confirmation is True
+        assert registry.get_compiled_action("missing") is None
+
+        # Registries without an override assemble the bundle on demand
+        compiled = Registry.get_compiled_action(registry, "a1@v1")
+        assert compiled.handler is handler
+        assert compiled.preconditions == registry._compiled_actions["a1@v1"].preconditions
+        assert Registry.get_compiled_action(registry, "missing") is None
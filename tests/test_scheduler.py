@@ -47,6 +47,31 @@ class TestSchedulerWorker:
         assert schedule_id not in worker._active_schedules
         assert worker.scheduler.get_job(schedule_id) is None
 
+    def test_sync_parses_cron_only_when_it_changes(self, setup):
+        from apscheduler.triggers.cron import CronTrigger
+
+        worker, engine, repo = setup
+        schedule = {"id": "s1", "project_id": "p1", "action_id": "demo.act", "cron": "* * * * *", "enabled": True}
+        repo.save_schedule(schedule)
+        worker.scheduler.start(paused=True)
+
+        with patch(
+            "gradio_chat_agent.execution.scheduler.CronTrigger.from_crontab",
+            side_effect=CronTrigger.from_crontab,
+        ) as from_crontab:
+            worker._sync_schedules()
+            worker._sync_schedules()
+            assert from_crontab.call_count == 1
+
+            repo.save_schedule({**schedule, "cron": "0 * * * *"})
+            worker._sync_schedules()
+            assert from_crontab.call_count == 2
+
+        job = worker.scheduler.get_job("s1")
+        assert str(job.trigger) == str(CronTrigger.from_crontab("0 * * * *"))
+        assert job.args[0]["cron"] == "0 * * * *"
+        worker.scheduler.shutdown()
+
     def test_execute_scheduled_action(self, setup):
         worker, engine, repo = setup
         
@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timedelta, timezone
 import pytest
+from sqlalchemy import event
 from gradio_chat_agent.persistence.sql_repository import SQLStateRepository
 from gradio_chat_agent.models.state_snapshot import StateSnapshot
 from gradio_chat_agent.models.execution_result import ExecutionResult, ExecutionStatus, StateDiffEntry, ExecutionError
@@ -121,6 +122,30 @@ class TestSQLRepository:
         # In last 15 minutes: 2
         assert repo.count_recent_executions(pid, 15) == 2
         
+    def test_get_usage_snapshot_matches_individual_queries(self, repo):
+        from gradio_chat_agent.persistence.repository import StateRepository, UsageSnapshot
+
+        pid = "p1"
+        # No limits configured: counters are skipped
+        assert repo.get_usage_snapshot(pid) == UsageSnapshot(limits={})
+
+        repo.set_project_limits(pid, {"limits": {"rate": {"per_minute": 5, "per_hour": 50}, "budget": {"daily": 10}}})
+        for i, (minutes_ago, status, cost) in enumerate(
+            [(0, ExecutionStatus.SUCCESS, 2.0), (0, ExecutionStatus.FAILED, 1.0), (10, ExecutionStatus.SUCCESS, 1.5)]
+        ):
+            repo.save_execution(pid, ExecutionResult(
+                request_id=f"r{i}", action_id="a1", status=status, state_snapshot_id="s1",
+                timestamp=datetime.now(timezone.utc) - timedelta(minutes=minutes_ago),
+                metadata={"cost": cost},
+            ))
+        repo.archive_project(pid)
+
+        usage = repo.get_usage_snapshot(pid)
+        assert usage == StateRepository.get_usage_snapshot(repo, pid)
+        assert usage.per_minute == 2
+        assert usage.per_hour == 3
+        assert usage.archived is True
+
     def test_webhooks(self, repo):
         pid = "p1"
         config = {"id": "wh1", "project_id": pid, "action_id": "a1", "secret": "s", "enabled": True}
@@ -202,6 +227,16 @@ class TestSQLRepository:
         usage = repo.get_daily_budget_usage(pid)
         assert usage == 0.0
 
+    def test_sql_repository_get_daily_budget_usage_aggregates(self, repo):
+        pid = "p1"
+        repo.save_execution(pid, ExecutionResult(request_id="r1", action_id="a", status=ExecutionStatus.SUCCESS, state_snapshot_id="s1", cost=2.5, metadata={"cost": 2.5}))
+        # Legacy rows only carry the cost in metadata
+        repo.save_execution(pid, ExecutionResult(request_id="r2", action_id="a", status=ExecutionStatus.SUCCESS, state_snapshot_id="s1", metadata={"cost": 1.5}))
+        # Failures do not count towards the budget
+        repo.save_execution(pid, ExecutionResult(request_id="r3", action_id="a", status=ExecutionStatus.FAILED, state_snapshot_id="s1", cost=100.0))
+        assert repo.get_daily_budget_usage(pid) == 4.0
+        assert repo.get_daily_budget_usage("other") == 0.0
+
     def test_sql_repository_is_project_archived_missing(self, repo):
         assert repo.is_project_archived("missing") is False
 
@@ -257,6 +292,72 @@ class TestSQLRepository:
         assert len(p1_wh) == 1
         assert p1_wh[0]["id"] == "wh1"
 
+    def test_get_org_rollup_groups_in_one_query(self, repo):
+        repo.create_project("p1", "P1")
+        repo.create_project("p2", "P2")
+        for result in [
+            ExecutionResult(request_id="r1", action_id="a", status=ExecutionStatus.SUCCESS, state_snapshot_id="s", cost=2.0),
+            ExecutionResult(request_id="r2", action_id="a", status=ExecutionStatus.SUCCESS, state_snapshot_id="s", cost=3.0),
+            ExecutionResult(request_id="r3", action_id="a", status=ExecutionStatus.FAILED, state_snapshot_id="s", cost=50.0),
+            ExecutionResult(request_id="r4", action_id="a", status=ExecutionStatus.REJECTED, state_snapshot_id="s"),
+        ]:
+            repo.save_execution("p1", result)
+
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(repo.engine, "before_cursor_execute", count)
+        try:
+            rollup = repo.get_org_rollup()
+        finally:
+            event.remove(repo.engine, "before_cursor_execute", count)
+        # Projects plus one grouped query, independent of the project count
+        assert len(statements) == 2
+
+        p1 = rollup["projects"]["p1"]
+        assert (p1["total_executions"], p1["success_count"], p1["failed_count"], p1["rejected_count"]) == (4, 2, 1, 1)
+        assert p1["total_cost"] == 5.0
+        assert rollup["projects"]["p2"]["total_executions"] == 0
+        assert rollup["projects"]["p2"]["total_cost"] == 0.0
+        assert rollup["total_executions"] == 4
+        assert rollup["total_cost"] == 5.0
+
+    def test_successful_executions_since(self, repo):
+        assert repo.get_latest_execution_seq("p1") == 0
+        for i in range(4):
+            repo.save_execution("p1", ExecutionResult(
+                request_id=f"r{i}", action_id="a", state_snapshot_id="s",
+                status=ExecutionStatus.FAILED if i == 1 else ExecutionStatus.SUCCESS,
+            ))
+        repo.save_execution("p2", ExecutionResult(request_id="other", action_id="a", status=ExecutionStatus.SUCCESS, state_snapshot_id="s"))
+
+        entries = repo.get_successful_executions_since("p1", 0)
+        assert [r.request_id for _, r in entries] == ["r0", "r2", "r3"]
+        seqs = [seq for seq, _ in entries]
+        assert seqs == sorted(seqs)
+        assert repo.get_latest_execution_seq("p1") == seqs[-1]
+
+        after_first = repo.get_successful_executions_since("p1", seqs[0], limit=1)
+        assert [r.request_id for _, r in after_first] == ["r2"]
+        assert repo.get_successful_executions_since("p1", seqs[-1]) == []
+
+    def test_sql_repository_iterators_match_lists(self, repo):
+        repo.create_project("p1", "Project 1")
+        repo.create_project("p2", "Project 2")
+        repo.archive_project("p2")
+        repo.save_webhook({"id": "wh1", "project_id": "p1", "action_id": "a", "secret": "s"})
+        repo.save_webhook({"id": "wh2", "project_id": "p2", "action_id": "a", "secret": "s"})
+        repo.create_user("u1", "h")
+        repo.create_api_token("u1", "t1", "id1")
+
+        assert list(repo.iter_projects()) == repo.list_projects()
+        assert list(repo.iter_webhooks()) == repo.list_webhooks()
+        assert list(repo.iter_webhooks("p1")) == repo.list_webhooks("p1")
+        assert list(repo.iter_api_tokens("u1")) == repo.list_api_tokens("u1")
+        assert list(repo.iter_api_tokens("missing")) == []
+
     def test_check_health_failure(self, repo):
         # Mock SessionLocal to raise exception on context enter or execute
         with patch.object(repo, "SessionLocal") as mock_session_cls:
@@ -284,6 +385,7 @@ class TestSQLRepository:
         
         assert repo.count_recent_executions(pid, 10, status=ExecutionStatus.SUCCESS) == 1
         assert repo.count_recent_executions(pid, 10, status=ExecutionStatus.FAILED) == 1
+        assert repo.count_recent_executions_by_status(pid, 10) == {"success": 1, "failed": 1}
 
         # 3. list_enabled_schedules (lines 789-792)
         repo.save_schedule({"id": "sch1", "project_id": pid, "action_id": "a", "cron": "*", "enabled": True})
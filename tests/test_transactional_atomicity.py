@@ -3,6 +3,7 @@ import uuid
 from unittest.mock import MagicMock, patch
 from gradio_chat_agent.persistence.in_memory import InMemoryStateRepository
 from gradio_chat_agent.persistence.sql_repository import SQLStateRepository
+from gradio_chat_agent.persistence.repository import UsageSnapshot
 from gradio_chat_agent.models.execution_result import ExecutionResult, ExecutionStatus
 from gradio_chat_agent.models.state_snapshot import StateSnapshot
 from gradio_chat_agent.execution.engine import ExecutionEngine
@@ -91,6 +92,7 @@ class TestTransactionalAtomicity:
         # We need to mock repository methods that are called before save_execution_and_snapshot
         repository.get_project_limits.return_value = {}
         repository.is_project_archived.return_value = False
+        repository.get_usage_snapshot.return_value = UsageSnapshot(limits={})
         repository.get_latest_snapshot.return_value = None
         
         engine.execute_intent(project_id, intent, user_roles=["admin"])
@@ -1,7 +1,14 @@
 from unittest.mock import MagicMock
 from gradio_chat_agent.models.enums import StateDiffOp
 from gradio_chat_agent.models.execution_result import StateDiffEntry
-from gradio_chat_agent.utils import compute_state_diff, encode_media, apply_state_diff
+from gradio_chat_agent.utils import (
+    apply_state_diff,
+    compute_media_hash,
+    compute_state_diff,
+    encode_media,
+    fast_clone,
+    hash_password,
+)
 
 
 class TestUtils:
@@ -41,6 +48,27 @@ class TestUtils:
         assert "a.b" in paths
         assert "a.c" in paths
 
+    def test_compute_state_diff_equal_states_short_circuit(self):
+        from unittest.mock import patch
+
+        state = {"a": {"b": [1, 2]}, "c": "x"}
+        with patch("gradio_chat_agent.utils.StateDiffEntry") as mock_entry:
+            assert compute_state_diff(state, {"a": {"b": [1, 2]}, "c": "x"}) == []
+            mock_entry.assert_not_called()
+
+    def test_compute_state_diff_order_and_none_values(self):
+        old = {"a": 1, "b": None, "c": {"x": 1, "y": 2}}
+        new = {"d": None, "c": {"y": 3, "x": 1}, "a": 1}
+        diff = compute_state_diff(old, new)
+        # Removed/changed keys in old order, then additions in new order
+        assert [(d.path, d.op) for d in diff] == [
+            ("b", StateDiffOp.REMOVE),
+            ("c.y", StateDiffOp.REPLACE),
+            ("d", StateDiffOp.ADD),
+        ]
+        assert diff[1].value == 3
+        assert diff[2].value is None
+
     def test_encode_media(self, tmp_path):
         p = tmp_path / "hello.txt"
         p.write_text("hello world")
@@ -98,4 +126,43 @@ class TestUtils:
         mock_state2.__getitem__.return_value = 1 # Not a dict
         diffs = [StateDiffEntry(path="a.b.c", op=StateDiffOp.REMOVE)]
         apply_state_diff(mock_state2, diffs)
-        assert mock_state2.__contains__.call_count >= 4
\ No newline at end of file
+        assert mock_state2.__contains__.call_count >= 4
+
+    def test_hash_password_is_deterministic(self):
+        digest = hash_password("secret")
+        assert digest == hash_password("secret")
+        assert digest != hash_password("other")
+        assert len(digest) == 64
+
+    def test_fast_clone_is_deep(self):
+        state = {"a": {"b": [1, 2, {"c": "x"}]}, "d": None}
+        clone = fast_clone(state)
+        assert clone == state
+        clone["a"]["b"][2]["c"] = "y"
+        assert state["a"]["b"][2]["c"] == "x"
+
+    def test_fast_clone_falls_back_for_unpicklable(self):
+        state = {"fn": lambda: 1, "v": [1]}
+        clone = fast_clone(state)
+        assert clone["fn"] is state["fn"]
+        assert clone["v"] == [1] and clone["v"] is not state["v"]
+
+    def test_fast_clone_types(self):
+        from collections import OrderedDict
+
+        state = {"t": (1, [2]), "o": OrderedDict(a=[1]), "s": {1, 2}}
+        clone = fast_clone(state)
+        assert clone == state
+        assert type(clone["t"]) is tuple and clone["t"][1] is not state["t"][1]
+        # Subclasses and other containers go through copy.deepcopy
+        assert type(clone["o"]) is OrderedDict and clone["o"]["a"] is not state["o"]["a"]
+        assert clone["s"] is not state["s"]
+
+    def test_compute_media_hash_accepts_str_and_bytes(self):
+        import hashlib
+
+        expected = hashlib.sha256(b"aGVsbG8=").hexdigest()
+        assert compute_media_hash("aGVsbG8=") == expected
+        assert compute_media_hash(b"aGVsbG8=") == expected
+        assert compute_media_hash(bytearray(b"aGVsbG8=")) == expected
+        assert compute_media_hash(memoryview(b"aGVsbG8=")) == expected
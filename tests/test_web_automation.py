@@ -101,7 +101,8 @@ class TestWebAutomation:
         # Verify Playwright calls
         mock_page.goto.assert_called_with("https://example.com")
         
-        # Verify state synced back
+        # Verify state synced back once the debounced sync is flushed
+        executor.flush_syncs()
         latest = repo.get_latest_snapshot(pid)
         assert latest.components[BROWSER_ID]["url"] == "https://example.com"
         assert latest.components[BROWSER_ID]["status"] == "idle"
@@ -280,4 +281,79 @@ class TestWebAutomation:
 
             executor.stop()
 
-    
\ No newline at end of file
+    @patch("gradio_chat_agent.execution.browser_executor.sync_playwright")
+    def test_browser_executor_evicts_least_recent_page(self, mock_sync_pw, setup):
+        engine, _, _, _ = setup
+        executor = BrowserExecutor(engine, max_pages=2)
+        mock_browser = mock_sync_pw.return_value.start.return_value.chromium.launch.return_value
+        pages = [MagicMock(name=f"page{i}") for i in range(3)]
+        mock_browser.new_page.side_effect = pages
+
+        executor._ensure_browser()
+        executor._get_page("p1")
+        executor._get_page("p2")
+        # Touch p1 so p2 becomes the least recently used page
+        assert executor._get_page("p1") is pages[0]
+        executor._get_page("p3")
+
+        assert list(executor._pages) == ["p1", "p3"]
+        pages[1].close.assert_called_once()
+        assert mock_browser.new_page.call_count == 3
+
+    @patch("gradio_chat_agent.execution.browser_executor.sync_playwright")
+    def test_browser_executor_coalesces_syncs(self, mock_sync_pw, setup):
+        engine, _, repo, pid = setup
+        executor = BrowserExecutor(engine, sync_delay=60)
+        mock_page = mock_sync_pw.return_value.start.return_value.chromium.launch.return_value.new_page.return_value
+        mock_page.url = "https://example.com"
+        mock_page.title.return_value = "Example"
+
+        steps = [
+            ("browser.click", {"selector": "#a"}),
+            ("browser.type", {"selector": "#b", "text": "hi"}),
+            ("browser.click", {"selector": "#c"}),
+        ]
+        with patch.object(engine, "execute_intent", wraps=engine.execute_intent) as spy:
+            for i, (action_id, inputs) in enumerate(steps):
+                intent = ChatIntent(
+                    type=IntentType.ACTION_CALL, request_id=f"r{i}",
+                    action_id=action_id, inputs=inputs
+                )
+                executor(pid, engine.execute_intent(pid, intent, user_roles=["admin"]))
+            executor.stop()
+
+        sync_calls = [
+            c for c in spy.call_args_list
+            if "intent" in c.kwargs and c.kwargs["intent"].action_id == "browser.sync.state"
+        ]
+        assert len(sync_calls) == 1
+        state = repo.get_latest_snapshot(pid).components[BROWSER_ID]
+        assert state["last_action_result"] == "Clicked element: #c"
+        assert state["pending_action"] is None
+
+    @patch("gradio_chat_agent.execution.browser_executor.sync_playwright")
+    def test_browser_executor_error_supersedes_pending_sync(self, mock_sync_pw, setup):
+        engine, _, repo, pid = setup
+        executor = BrowserExecutor(engine, sync_delay=60)
+        mock_page = mock_sync_pw.return_value.start.return_value.chromium.launch.return_value.new_page.return_value
+        mock_page.url = "https://example.com"
+        mock_page.title.return_value = "Example"
+
+        intent = ChatIntent(
+            type=IntentType.ACTION_CALL, request_id="r1",
+            action_id="browser.click", inputs={"selector": "#a"}
+        )
+        executor(pid, engine.execute_intent(pid, intent, user_roles=["admin"]))
+        mock_page.click.side_effect = Exception("Boom")
+        intent = ChatIntent(
+            type=IntentType.ACTION_CALL, request_id="r2",
+            action_id="browser.click", inputs={"selector": "#b"}
+        )
+        executor(pid, engine.execute_intent(pid, intent, user_roles=["admin"]))
+
+        assert executor._pending_syncs == {}
+        state = repo.get_latest_snapshot(pid).components[BROWSER_ID]
+        assert state["status"] == "error"
+        assert state["last_error"] == "Boom"
+        assert state["url"] == "https://example.com"
+        executor.stop()
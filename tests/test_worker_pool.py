@@ -65,3 +65,17 @@ class TestWorkerPool:
             
             # Second call should return same instance
             assert get_engine() == engine
+
+    def test_engine_warmed_on_worker_startup(self):
+        from gradio_chat_agent.execution import tasks
+
+        assert tasks.huey._startup["warm_engine"] is tasks.warm_engine
+        with patch("gradio_chat_agent.execution.tasks._build_engine") as mock_build:
+            tasks._engine = None
+            try:
+                tasks.warm_engine()
+                tasks.warm_engine()
+                mock_build.assert_called_once()
+                assert get_engine() is mock_build.return_value
+            finally:
+                tasks._engine = None